@@ -2,32 +2,41 @@
 Authentication API endpoints.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_session
+from app.core.database import SessionReleasingRoute, get_session
+from app.core.ratelimit import client_ip
 from app.services.auth import (
     authenticate_user,
+    check_auth_rate,
     create_user_token,
     get_current_user,
+    get_token_claims,
     register_user,
+    request_password_reset,
+    reset_password,
 )
+from app.services.tokens import InvalidRefreshTokenError, revoke_access_token, rotate_refresh_token
 
 from .schemas import (
     PasswordResetConfirm,
     PasswordResetRequest,
+    RefreshTokenRequest,
+    TokenPairResponse,
     TokenResponse,
     UserLoginRequest,
     UserRegisterRequest,
     UserResponse,
 )
 
-router = APIRouter()
+router = APIRouter(route_class=SessionReleasingRoute)
 
 
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def register(
     request: UserRegisterRequest,
+    http_request: Request,
     session: AsyncSession = Depends(get_session),
 ):
     """
@@ -36,7 +45,11 @@ async def register(
     - **email**: Valid email address (unique)
     - **password**: Min 8 characters
     - **full_name**: User's full name
+
+    Returns 429 with Retry-After when the client or the server is over budget.
     """
+    check_auth_rate(client_ip(http_request))
+
     user = await register_user(
         email=request.email,
         password=request.password,
@@ -50,13 +63,17 @@ async def register(
 @router.post("/login", response_model=TokenResponse)
 async def login(
     request: UserLoginRequest,
+    http_request: Request,
     session: AsyncSession = Depends(get_session),
 ):
     """
     Login with email and password.
 
-    Returns JWT access token and user info.
+    Returns a short-lived JWT access token, a refresh token and user info,
+    or 429 with Retry-After when the client or the server is over budget.
     """
+    check_auth_rate(client_ip(http_request), email=request.email)
+
     user = await authenticate_user(
         email=request.email,
         password=request.password,
@@ -69,7 +86,7 @@ async def login(
             detail="Invalid email or password",
         )
 
-    token_data = create_user_token(user)
+    token_data = await create_user_token(user, session)
 
     return {
         **token_data,
@@ -77,6 +94,40 @@ async def login(
     }
 
 
+@router.post("/refresh", response_model=TokenPairResponse)
+async def refresh_tokens(
+    request: RefreshTokenRequest,
+    session: AsyncSession = Depends(get_session),
+):
+    """
+    Exchange a refresh token for a new access token and refresh token.
+
+    Each refresh token can be used once. Reusing a spent refresh token
+    revokes the whole login session.
+    """
+    try:
+        return await rotate_refresh_token(request.refresh_token, session)
+    except InvalidRefreshTokenError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired refresh token",
+        )
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(
+    claims: dict = Depends(get_token_claims),
+    session: AsyncSession = Depends(get_session),
+):
+    """
+    End the current login session.
+
+    Revokes the session's refresh tokens and, on every instance within
+    REVOCATION_SYNC_SECONDS (immediately on this one), its access tokens.
+    """
+    await revoke_access_token(claims, session)
+
+
 @router.get("/me", response_model=UserResponse)
 async def get_me(
     current_user = Depends(get_current_user),
@@ -84,28 +135,32 @@ async def get_me(
     """
     Get current authenticated user info.
 
-    Requires valid JWT token in Authorization header.
+    Requires valid JWT token in Authorization header. Served from the
+    principal cache when warm (no database query).
     """
     return current_user
 
 
 @router.post("/reset-password")
-async def request_password_reset(
+async def request_password_reset_email(
     request: PasswordResetRequest,
+    http_request: Request,
+    background_tasks: BackgroundTasks,
     session: AsyncSession = Depends(get_session),
 ):
     """
     Request password reset email.
 
-    Always returns success to prevent email enumeration.
+    Always returns success to prevent email enumeration. The email is sent
+    in the background after the response.
     """
-    # TODO: Implement password reset email logic with SendGrid
-    # For now, always return success message
+    check_auth_rate(client_ip(http_request), email=request.email)
+    await request_password_reset(request.email, session, background_tasks)
     return {"message": "Password reset email sent"}
 
 
 @router.post("/reset-password/{token}")
-async def reset_password(
+async def confirm_password_reset(
     token: str,
     request: PasswordResetConfirm,
     session: AsyncSession = Depends(get_session),
@@ -115,10 +170,8 @@ async def reset_password(
 
     - **token**: Password reset token from email
     - **new_password**: New password (min 8 characters)
+
+    Signs out every existing session of the account.
     """
-    # TODO: Implement password reset token validation and password update
-    # For now, return error
-    raise HTTPException(
-        status_code=status.HTTP_400_BAD_REQUEST,
-        detail="Invalid or expired token",
-    )
+    await reset_password(token, request.new_password, session)
+    return {"message": "Password has been reset"}
@@ -0,0 +1,50 @@
+"""
+Operational metrics endpoints (author only; the dependency is applied where
+the router is mounted in app.main).
+"""
+
+from fastapi import APIRouter
+
+from app.core.database import recent_writers, replica_engine, replica_health
+from app.core.pool_metrics import pool_monitor
+from app.core.security import password_limiter
+from app.services.auth import auth_ip_buckets, login_email_buckets
+
+router = APIRouter()
+
+
+@router.get("/auth")
+async def get_auth_metrics():
+    """
+    Admission control metrics for password hashing and verification.
+
+    - **password_hashing**: in-flight and queued bcrypt calls, shed counts and
+      queue wait times (avg/p95/max over the last 1024 admissions)
+    - **rate_limit_keys**: number of tracked per-email and per-IP buckets
+    """
+    return {
+        "password_hashing": password_limiter.metrics(),
+        "rate_limit_keys": {
+            "login_email": len(login_email_buckets),
+            "auth_ip": len(auth_ip_buckets),
+        },
+    }
+
+
+@router.get("/db")
+async def get_db_metrics():
+    """
+    Database connection pool metrics, for sizing DB_POOL_SIZE / DB_MAX_OVERFLOW.
+
+    - **capacity**, **size**, **checked_out**, **checked_in**, **overflow**: pool gauges
+    - **timeouts**: checkouts that gave up after DB_POOL_TIMEOUT_SECONDS
+    - **checkout_wait_ms**: time spent waiting for a connection (histogram)
+    - **hold_ms**: time a connection stayed checked out (histogram)
+    - **saturation**: share of capacity in use right after each checkout (histogram)
+    - **replica**: replication lag and whether reads are routed to the replica
+      (null without DATABASE_REPLICA_URL)
+    """
+    replica = None
+    if replica_engine is not None:
+        replica = {**replica_health.metrics(), "sticky_clients": len(recent_writers)}
+    return {**pool_monitor.metrics(), "replica": replica}
@@ -2,146 +2,89 @@
 Newsletter API endpoints for fetching articles from Substack RSS feed.
 """
 
-from datetime import datetime
-
-import feedparser
-from dateutil import parser as date_parser
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query, Response
 from fastapi.responses import JSONResponse
 
 from app.api.schemas import NewsletterArticle, NewsletterResponse
+from app.services.newsletter import FeedUnavailableError, InvalidCursorError, feed_cache
 
 router = APIRouter()
 
-# Substack RSS feed URL
-SUBSTACK_RSS_URL = "https://theincurablehumanist.substack.com/feed"
-
 
-@router.get("/articles", response_model=NewsletterResponse)
-async def get_newsletter_articles():
+@router.get("/articles", response_model=NewsletterResponse, response_model_exclude_unset=True)
+async def get_newsletter_articles(
+    response: Response,
+    limit: int | None = Query(None, ge=1, le=100),
+    cursor: str | None = None,
+    fields: str | None = None,
+):
     """
     Fetch articles from The Incurable Humanist Substack newsletter RSS feed.
 
+    Articles are served from an in-process cache that is refreshed in the
+    background once it is older than NEWSLETTER_CACHE_TTL_SECONDS. Each refresh
+    ingests new or changed entries into the newsletter_article archive, and the
+    cache holds the whole archive (not just the current RSS window).
+
+    When Substack is failing, the last known good articles (possibly loaded
+    from the on-disk snapshot) are served with an `Age` header giving their
+    age in seconds.
+
+    - **limit**: Page size (omit to return every article)
+    - **cursor**: `next_cursor` from the previous page
+    - **fields**: Comma-separated article fields to return besides title and
+      link, e.g. `published,author` to drop the description HTML
+
     Returns:
-        NewsletterResponse: List of articles with metadata
+        NewsletterResponse: Page of articles, newest first, with total_count
+        for the whole archive and next_cursor when more pages remain
 
     Raises:
+        HTTPException: 400 for an invalid cursor or field name
         HTTPException: 503 if unable to fetch or parse RSS feed
     """
-    try:
-        # Parse the RSS feed
-        feed = feedparser.parse(SUBSTACK_RSS_URL)
-
-        # Check if feed was successfully parsed
-        if feed.bozo:
-            # Feed has parsing errors
-            error_msg = getattr(feed, "bozo_exception", "Unknown parsing error")
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to parse RSS feed: {str(error_msg)}",
-            )
-
-        # Check if feed has entries
-        if not hasattr(feed, "entries") or not feed.entries:
+    projection = None
+    if fields is not None:
+        projection = {name.strip() for name in fields.split(",") if name.strip()}
+        unknown = projection - set(NewsletterArticle.model_fields)
+        if unknown:
             raise HTTPException(
-                status_code=503,
-                detail="RSS feed contains no articles",
+                status_code=400,
+                detail=f"Unknown article fields: {', '.join(sorted(unknown))}",
             )
 
-        # Extract articles from feed entries
-        articles = []
-        for entry in feed.entries:
-            try:
-                # Parse published date and convert to ISO format
-                published_date = entry.get("published", "")
-                if published_date:
-                    try:
-                        parsed_date = date_parser.parse(published_date)
-                        published_iso = parsed_date.isoformat()
-                    except (ValueError, TypeError):
-                        # If date parsing fails, use the original string
-                        published_iso = published_date
-                else:
-                    published_iso = datetime.utcnow().isoformat()
-
-                # Extract author information
-                author = None
-                if hasattr(entry, "author"):
-                    author = entry.author
-                elif hasattr(entry, "authors") and entry.authors:
-                    author = entry.authors[0].get("name", None)
-
-                # Create article object
-                article = NewsletterArticle(
-                    title=entry.get("title", "Untitled"),
-                    link=entry.get("link", ""),
-                    description=entry.get("summary", ""),
-                    published=published_iso,
-                    author=author,
-                )
-                articles.append(article)
-
-            except Exception as entry_error:
-                # Log error but continue processing other entries
-                print(f"Error processing entry: {str(entry_error)}")
-                continue
-
-        if not articles:
-            raise HTTPException(
-                status_code=503,
-                detail="No valid articles found in RSS feed",
-            )
-
-        return NewsletterResponse(articles=articles, total_count=len(articles))
+    try:
+        index = await feed_cache.get()
+    except FeedUnavailableError as e:
+        raise HTTPException(status_code=503, detail=str(e))
 
-    except HTTPException:
-        # Re-raise HTTP exceptions
-        raise
+    if feed_cache.degraded:
+        age = feed_cache.age_seconds()
+        if age is not None:
+            response.headers["Age"] = str(int(age))
 
-    except Exception as e:
-        # Handle unexpected errors
-        raise HTTPException(
-            status_code=503,
-            detail=f"Unable to fetch newsletter articles: {str(e)}",
-        )
+    try:
+        return index.page(limit=limit, cursor=cursor, fields=projection)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.get("/health")
 async def newsletter_health_check():
     """
-    Health check endpoint to verify RSS feed connectivity.
+    Health check endpoint reporting RSS feed state from the feed cache.
+
+    Makes no network call: it reports what the last refreshes observed
+    (last successful fetch, fetch/parse latency, entry count, consecutive
+    failures and circuit breaker state).
 
     Returns:
-        dict: Status information about the RSS feed
+        dict: Status information about the RSS feed (503 when no articles
+        can be served)
     """
-    try:
-        feed = feedparser.parse(SUBSTACK_RSS_URL)
-
-        if feed.bozo:
-            return JSONResponse(
-                status_code=503,
-                content={
-                    "status": "unhealthy",
-                    "message": "RSS feed has parsing errors",
-                    "feed_url": SUBSTACK_RSS_URL,
-                },
-            )
+    health = feed_cache.health()
+
+    if health["status"] == "unhealthy":
+        return JSONResponse(status_code=503, content=health)
 
-        article_count = len(feed.entries) if hasattr(feed, "entries") else 0
-
-        return {
-            "status": "healthy",
-            "feed_url": SUBSTACK_RSS_URL,
-            "article_count": article_count,
-            "feed_title": feed.feed.get("title", "Unknown") if hasattr(feed, "feed") else "Unknown",
-        }
-
-    except Exception as e:
-        return JSONResponse(
-            status_code=503,
-            content={
-                "status": "unhealthy",
-                "message": str(e),
-                "feed_url": SUBSTACK_RSS_URL,
-            },
-        )
+    return health
@@ -36,14 +36,27 @@ class UserResponse(BaseModel):
         from_attributes = True
 
 
-class TokenResponse(BaseModel):
-    """Token response schema."""
+class TokenPairResponse(BaseModel):
+    """Access and refresh token pair."""
 
     access_token: str
+    refresh_token: str
     token_type: str
+    expires_in: int
+
+
+class TokenResponse(TokenPairResponse):
+    """Token response schema."""
+
     user: UserResponse
 
 
+class RefreshTokenRequest(BaseModel):
+    """Refresh token exchange request schema."""
+
+    refresh_token: str
+
+
 class PasswordResetRequest(BaseModel):
     """Password reset request schema."""
 
@@ -58,17 +71,24 @@ class PasswordResetConfirm(BaseModel):
 
 # ========== Newsletter Schemas ==========
 class NewsletterArticle(BaseModel):
-    """Newsletter article schema from Substack RSS feed."""
+    """
+    Newsletter article schema from Substack RSS feed.
+
+    Only title and link are guaranteed; the other fields can be dropped with
+    the `fields` projection on /api/newsletter/articles.
+    """
 
     title: str
     link: str
-    description: str
-    published: str
+    description: str | None = None
+    excerpt: str | None = None
+    published: str | None = None
     author: str | None = None
 
 
 class NewsletterResponse(BaseModel):
-    """Newsletter response schema containing list of articles."""
+    """Newsletter response schema containing a page of articles."""
 
     articles: list[NewsletterArticle]
     total_count: int
+    next_cursor: str | None = None
@@ -0,0 +1,5 @@
+"""
+Command-line maintenance tasks, run from the backend directory, e.g.:
+
+    python -m app.cli.import_subscribers substack_export.csv
+"""
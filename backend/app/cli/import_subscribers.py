@@ -0,0 +1,298 @@
+"""
+Bulk import of a Substack subscriber export into users and newsletter subscriptions.
+
+The CSV is streamed and de-duplicated by email in memory, loaded with a
+single COPY into a temporary staging table, and merged into the user and
+newsletter subscription tables with one set-based statement:
+
+- new emails become placeholder accounts with an unusable password (no
+  bcrypt work at import time; readers set a password through the
+  password-reset flow)
+- existing accounts and existing subscriptions are left untouched
+
+Usage (from the backend directory):
+
+    python -m app.cli.import_subscribers substack_export.csv
+    python -m app.cli.import_subscribers export.csv --frequency monthly --dry-run
+"""
+
+import argparse
+import asyncio
+import csv
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, Iterator
+
+import asyncpg
+from sqlalchemy.engine import make_url
+
+from app.core.config import settings
+from app.core.security import UNUSABLE_PASSWORD
+from app.models import NewsletterFrequency, NewsletterSubscription, User
+
+logger = logging.getLogger(__name__)
+
+STAGING_TABLE = "subscriber_import"
+
+# Header aliases seen in Substack (and similar) exports, lower-cased
+EMAIL_COLUMNS = ("email", "email address")
+NAME_COLUMNS = ("name", "full_name", "full name")
+CREATED_COLUMNS = ("created_at", "subscription_date", "subscribed_at")
+DISABLED_COLUMNS = ("email_disabled",)
+
+TRUE_VALUES = frozenset({"true", "1", "yes", "y", "t"})
+
+
+@dataclass
+class SubscriberRow:
+    """
+    One de-duplicated subscriber from the export.
+
+    Attributes:
+        email: Lower-cased email address
+        full_name: Subscriber name, if exported
+        subscribed_at: Subscription time (naive UTC), if exported
+        is_active: False when the export marks email delivery as disabled
+    """
+
+    email: str
+    full_name: str | None = None
+    subscribed_at: datetime | None = None
+    is_active: bool = True
+
+    def as_record(self) -> tuple:
+        return (self.email, self.full_name, self.subscribed_at, self.is_active)
+
+
+@dataclass
+class ImportResult:
+    """
+    Outcome of an import.
+
+    Attributes:
+        rows_read: Data rows in the CSV
+        subscribers: Distinct valid emails staged
+        users_created: Placeholder accounts created
+        subscriptions_created: Newsletter subscriptions created
+        seconds: Wall-clock duration
+    """
+
+    rows_read: int
+    subscribers: int
+    users_created: int = 0
+    subscriptions_created: int = 0
+    seconds: float = 0.0
+
+
+def _first(row: dict[str, str], columns: Iterable[str]) -> str:
+    for column in columns:
+        value = row.get(column)
+        if value:
+            return value.strip()
+    return ""
+
+
+def _parse_timestamp(value: str) -> datetime | None:
+    """Parse an ISO 8601 export timestamp to naive UTC (None if unparseable)."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def read_subscribers(lines: Iterable[str]) -> tuple[dict[str, SubscriberRow], int]:
+    """
+    Stream CSV lines into subscribers de-duplicated by email (first row wins).
+
+    Args:
+        lines: CSV text lines, header first
+
+    Returns:
+        (subscribers keyed by email, number of data rows read)
+
+    Raises:
+        ValueError: If the CSV has no email column
+    """
+    reader = csv.DictReader(lines)
+    if reader.fieldnames is None or not set(EMAIL_COLUMNS) & {
+        name.strip().lower() for name in reader.fieldnames
+    }:
+        raise ValueError("CSV export has no email column")
+    reader.fieldnames = [name.strip().lower() for name in reader.fieldnames]
+
+    subscribers: dict[str, SubscriberRow] = {}
+    rows_read = 0
+    for row in reader:
+        rows_read += 1
+        email = _first(row, EMAIL_COLUMNS).lower()
+        if "@" not in email or email in subscribers:
+            continue
+
+        subscribers[email] = SubscriberRow(
+            email=email,
+            full_name=_first(row, NAME_COLUMNS)[:255] or None,
+            subscribed_at=_parse_timestamp(_first(row, CREATED_COLUMNS)),
+            is_active=_first(row, DISABLED_COLUMNS).lower() not in TRUE_VALUES,
+        )
+
+    return subscribers, rows_read
+
+
+def merge_statement() -> str:
+    """
+    The set-based merge from the staging table (one statement).
+
+    New users come from the INSERT's RETURNING; existing users from a join
+    (a statement cannot see its own inserts). Parameter $1 is the
+    subscription frequency.
+    """
+    users = User.__tablename__
+    subscriptions = NewsletterSubscription.__tablename__
+    frequency_type = NewsletterSubscription.__table__.c.frequency.type.name
+    return f"""
+        WITH new_users AS (
+            INSERT INTO "{users}"
+                (email, hashed_password, full_name, is_author, is_active, created_at)
+            SELECT email, '{UNUSABLE_PASSWORD}', full_name, false, true,
+                   COALESCE(subscribed_at, now() AT TIME ZONE 'utc')
+            FROM {STAGING_TABLE}
+            ON CONFLICT (email) DO NOTHING
+            RETURNING id, email
+        ),
+        targets AS (
+            SELECT u.id AS user_id, s.subscribed_at, s.is_active
+            FROM {STAGING_TABLE} s JOIN "{users}" u ON u.email = s.email
+            UNION ALL
+            SELECT n.id, s.subscribed_at, s.is_active
+            FROM new_users n JOIN {STAGING_TABLE} s ON s.email = n.email
+        ),
+        new_subscriptions AS (
+            INSERT INTO "{subscriptions}" (user_id, frequency, is_active, subscribed_at)
+            SELECT user_id, $1::{frequency_type}, is_active,
+                   COALESCE(subscribed_at, now() AT TIME ZONE 'utc')
+            FROM targets
+            ON CONFLICT (user_id) DO NOTHING
+            RETURNING 1
+        )
+        SELECT
+            (SELECT count(*) FROM new_users) AS users_created,
+            (SELECT count(*) FROM new_subscriptions) AS subscriptions_created
+    """
+
+
+def asyncpg_dsn(database_url: str) -> str:
+    """Turn the SQLAlchemy DATABASE_URL into a plain asyncpg DSN."""
+    return make_url(database_url).set(drivername="postgresql").render_as_string(
+        hide_password=False
+    )
+
+
+async def import_subscribers(
+    path: str | Path,
+    frequency: NewsletterFrequency = NewsletterFrequency.WEEKLY,
+    dry_run: bool = False,
+) -> ImportResult:
+    """
+    Import a subscriber export.
+
+    Args:
+        path: CSV export path
+        frequency: Delivery frequency for new subscriptions
+        dry_run: Parse and stage only; roll the transaction back
+
+    Returns:
+        ImportResult with counts and duration
+    """
+    started = time.perf_counter()
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        subscribers, rows_read = read_subscribers(f)
+    result = ImportResult(rows_read=rows_read, subscribers=len(subscribers))
+
+    connection = await asyncpg.connect(
+        asyncpg_dsn(settings.DATABASE_URL),
+        # Behind a transaction-mode pooler prepared statements cannot be cached
+        statement_cache_size=0 if settings.DB_POOLER_MODE == "transaction" else 100,
+    )
+    try:
+        transaction = connection.transaction()
+        await transaction.start()
+        try:
+            await connection.execute(
+                f"""
+                CREATE TEMP TABLE {STAGING_TABLE} (
+                    email varchar(255) PRIMARY KEY,
+                    full_name varchar(255),
+                    subscribed_at timestamp,
+                    is_active boolean NOT NULL
+                ) ON COMMIT DROP
+                """
+            )
+            await connection.copy_records_to_table(
+                STAGING_TABLE,
+                records=_records(subscribers.values()),
+                columns=["email", "full_name", "subscribed_at", "is_active"],
+            )
+            await connection.execute(f"ANALYZE {STAGING_TABLE}")
+
+            # Enum columns store member names
+            merged = await connection.fetchrow(merge_statement(), frequency.name)
+            result.users_created = merged["users_created"]
+            result.subscriptions_created = merged["subscriptions_created"]
+        except BaseException:
+            await transaction.rollback()
+            raise
+
+        if dry_run:
+            await transaction.rollback()
+        else:
+            await transaction.commit()
+    finally:
+        await connection.close()
+
+    result.seconds = time.perf_counter() - started
+    return result
+
+
+def _records(subscribers: Iterable[SubscriberRow]) -> Iterator[tuple]:
+    for subscriber in subscribers:
+        yield subscriber.as_record()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Import a Substack subscriber CSV export")
+    parser.add_argument("csv_path", help="Subscriber export (CSV with an email column)")
+    parser.add_argument(
+        "--frequency",
+        choices=[frequency.value for frequency in NewsletterFrequency],
+        default=NewsletterFrequency.WEEKLY.value,
+        help="Delivery frequency for new subscriptions",
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Roll back instead of committing")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
+
+    result = asyncio.run(
+        import_subscribers(args.csv_path, NewsletterFrequency(args.frequency), args.dry_run)
+    )
+    logger.info(
+        "%s %d rows (%d distinct emails) in %.2fs: %d users created, %d subscriptions created",
+        "Dry run of" if args.dry_run else "Imported",
+        result.rows_read,
+        result.subscribers,
+        result.seconds,
+        result.users_created,
+        result.subscriptions_created,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Circuit breaker for calls to unreliable upstream services.
+"""
+
+import time
+from enum import Enum
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    After `failure_threshold` consecutive failures the circuit opens and calls
+    are refused for `reset_timeout` seconds. The first call after that is a
+    half-open trial: success closes the circuit, failure re-opens it.
+
+    Not thread-safe; intended for use from a single event loop.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.consecutive_failures = 0
+        self._opened_at: float | None = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> CircuitState:
+        """Current circuit state."""
+        if self._opened_at is None:
+            return CircuitState.CLOSED
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return CircuitState.HALF_OPEN
+        return CircuitState.OPEN
+
+    def retry_after(self) -> float:
+        """Seconds until an open circuit allows a trial call (0 if not open)."""
+        if self._opened_at is None:
+            return 0.0
+        return max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+
+    def allow_request(self) -> bool:
+        """
+        Check whether a call may be attempted now.
+
+        Returns:
+            True if the circuit is closed, or half-open with no trial in flight
+        """
+        state = self.state
+        if state == CircuitState.CLOSED:
+            return True
+        if state == CircuitState.HALF_OPEN and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        """Record a successful call and close the circuit."""
+        self.consecutive_failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the circuit at the threshold."""
+        self.consecutive_failures += 1
+        self._trial_in_flight = False
+        if self._opened_at is not None or self.consecutive_failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
@@ -5,33 +5,267 @@ Database engine and session management.
 import asyncio
 import logging
 import os
-
-from sqlalchemy import text
+import time
+import uuid
+from typing import Any, Callable, Coroutine
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+from sqlalchemy import event, text
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 from sqlmodel import SQLModel
 
 from .config import settings
+from .middleware import client_key
+from .pool_metrics import InstrumentedAsyncQueuePool, pool_monitor, untracked_checkouts
+from .replica import RecentWriters, ReplicaHealth, check_replica_lag
 
 logger = logging.getLogger(__name__)
 
+# Request scope key listing the sessions opened by get_session / get_read_session
+REQUEST_SESSIONS_KEY = "db_sessions"
+
+
+def _unique_statement_name() -> str:
+    return f"__asyncpg_{uuid.uuid4().hex}__"
+
+
+def pooler_connect_args(mode: str) -> dict[str, Any]:
+    """
+    asyncpg connect args for the connection pooler in front of Postgres.
+
+    PgBouncer in transaction mode runs each transaction on whichever server
+    connection is free, so prepared statements cannot be cached per client
+    connection (they may not exist on the next server connection) and
+    asyncpg's sequential statement names collide between clients. Caching
+    is disabled and every statement gets a unique name; asyncpg closes
+    uncached statements after use.
+
+    Args:
+        mode: "none" (direct connections or session pooling) or "transaction"
+
+    Raises:
+        ValueError: For an unknown mode
+    """
+    if mode == "none":
+        return {}
+    if mode == "transaction":
+        return {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": _unique_statement_name,
+        }
+    raise ValueError(f"Unknown DB_POOLER_MODE {mode!r}, expected 'none' or 'transaction'")
+
+
+def liveness_pre_ping(mode: str) -> bool:
+    """
+    Whether pooled connections are pinged on every checkout.
+
+    Args:
+        mode: "pre_ping" (SELECT 1 round trip per checkout) or "background"
+            (pool_recycle, run_idle_validation and RetryingSession instead)
+
+    Raises:
+        ValueError: For an unknown mode
+    """
+    if mode == "pre_ping":
+        return True
+    if mode == "background":
+        return False
+    raise ValueError(f"Unknown DB_LIVENESS_MODE {mode!r}, expected 'background' or 'pre_ping'")
+
+
+def _create_engine(url: str, **kwargs: Any) -> AsyncEngine:
+    """Async engine with the pool and liveness settings shared by primary and replica."""
+    created = create_async_engine(
+        url,
+        echo=os.getenv("DB_ECHO", "false").lower() == "true",  # Log SQL queries (controlled by DB_ECHO env var)
+        future=True,
+        pool_pre_ping=liveness_pre_ping(settings.DB_LIVENESS_MODE),
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        connect_args=pooler_connect_args(settings.DB_POOLER_MODE),
+        **kwargs,
+    )
+    event.listen(created.sync_engine, "checkin", _stamp_checkin)
+    return created
+
+
+def _stamp_checkin(dbapi_connection, connection_record) -> None:
+    """Remember when a connection went idle (read by validate_idle_connections)."""
+    connection_record.info["idle_since"] = time.monotonic()
+
+
 # Create async engine with Railway-optimized pool settings
-engine: AsyncEngine = create_async_engine(
+engine: AsyncEngine = _create_engine(
     settings.DATABASE_URL,
-    echo=os.getenv("DB_ECHO", "false").lower() == "true",  # Log SQL queries (controlled by DB_ECHO env var)
-    future=True,
-    pool_pre_ping=True,  # Verify connections before using
-    pool_size=5,  # Connection pool size
-    max_overflow=5,  # Max overflow connections
+    poolclass=InstrumentedAsyncQueuePool,  # Times checkout waits for pool_monitor
+)
+pool_monitor.attach(
+    engine.sync_engine,
+    capacity=settings.DB_POOL_SIZE + max(settings.DB_MAX_OVERFLOW, 0),
+)
+
+# Optional read replica with its own pool (None when DATABASE_REPLICA_URL is unset)
+replica_engine: AsyncEngine | None = (
+    _create_engine(settings.DATABASE_REPLICA_URL) if settings.DATABASE_REPLICA_URL else None
 )
+replica_health = ReplicaHealth(
+    max_lag_seconds=settings.DB_REPLICA_MAX_LAG_SECONDS,
+    stale_after_seconds=3 * settings.DB_REPLICA_LAG_CHECK_SECONDS,
+)
+recent_writers = RecentWriters(window_seconds=settings.DB_READ_YOUR_WRITES_SECONDS)
+
+
+class RetryingSession(Session):
+    """
+    Session that retries the first statement of a transaction once if it
+    fails because the connection was dropped.
+
+    Safe because nothing ran in the transaction yet: a statement on a
+    connection that died is rolled back by the server, so it is re-run on a
+    fresh connection (the pool discards every connection older than the
+    dead one). Later statements are never retried.
+    """
+
+    def _run_retrying_disconnect(self, method, *args, **kwargs):
+        if self.in_transaction():
+            return method(*args, **kwargs)
+        try:
+            return method(*args, **kwargs)
+        except DBAPIError as e:
+            if not e.connection_invalidated:
+                raise
+            logger.warning("Database connection lost, retrying statement: %s", e.orig)
+            self.rollback()
+            return method(*args, **kwargs)
+
+    def execute(self, *args, **kwargs):
+        return self._run_retrying_disconnect(super().execute, *args, **kwargs)
+
+    def scalars(self, *args, **kwargs):
+        return self._run_retrying_disconnect(super().scalars, *args, **kwargs)
+
+    def scalar(self, *args, **kwargs):
+        return self._run_retrying_disconnect(super().scalar, *args, **kwargs)
+
+
+@event.listens_for(RetryingSession, "do_orm_execute")
+def _note_dml(orm_execute_state) -> None:
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info["wrote"] = True
+
+
+@event.listens_for(RetryingSession, "after_flush")
+def _note_flush(session, flush_context) -> None:
+    session.info["wrote"] = True
+
+
+@event.listens_for(RetryingSession, "after_commit")
+def _mark_recent_writer(session) -> None:
+    """Keep the writing client's reads on the primary for DB_READ_YOUR_WRITES_SECONDS."""
+    if session.info.pop("wrote", False) and session.info.get("client_key"):
+        recent_writers.mark(session.info["client_key"])
+
+
+@event.listens_for(RetryingSession, "after_rollback")
+def _forget_writes(session) -> None:
+    session.info.pop("wrote", None)
+
 
 # Create async session factory
 async_session_maker = sessionmaker(
     engine,
     class_=AsyncSession,
+    sync_session_class=RetryingSession,
     expire_on_commit=False,
 )
 
+replica_session_maker = (
+    sessionmaker(
+        replica_engine,
+        class_=AsyncSession,
+        sync_session_class=RetryingSession,
+        expire_on_commit=False,
+    )
+    if replica_engine is not None
+    else None
+)
+
+
+async def validate_idle_connections(
+    max_idle_seconds: float,
+    target: AsyncEngine | None = None,
+) -> int:
+    """
+    Ping pooled connections idle for at least `max_idle_seconds`.
+
+    Cycles once through the connections currently in the pool (checkouts
+    are FIFO); a connection that fails its ping is invalidated and replaced
+    on its next checkout, so requests do not pick up dead connections. No new
+    connections are opened for an empty pool, and these checkouts are not
+    recorded in the pool telemetry.
+
+    Args:
+        max_idle_seconds: Idle age that triggers a ping
+        target: Engine whose pool is validated (default: the primary)
+
+    Returns:
+        Number of dead connections found
+    """
+    target = target or engine
+    dead = 0
+    with untracked_checkouts():
+        for _ in range(target.pool.checkedin()):
+            async with target.connect() as conn:
+                if time.monotonic() - conn.info.get("idle_since", 0.0) < max_idle_seconds:
+                    continue
+                try:
+                    await conn.exec_driver_sql("SELECT 1")
+                except DBAPIError as e:
+                    if not e.connection_invalidated:
+                        raise
+                    dead += 1
+    return dead
+
+
+async def run_idle_validation(interval_seconds: float) -> None:
+    """
+    Validate idle pooled connections every `interval_seconds` (runs until cancelled).
+
+    Args:
+        interval_seconds: Delay between passes; also the idle age that triggers a ping
+    """
+    while True:
+        await asyncio.sleep(interval_seconds)
+        for target in filter(None, (engine, replica_engine)):
+            try:
+                dead = await validate_idle_connections(interval_seconds, target)
+                if dead:
+                    logger.info("Replaced %d dead pooled database connection(s)", dead)
+            except Exception as e:
+                logger.warning("Idle connection validation failed: %s", e)
+
+
+async def run_replica_lag_check(interval_seconds: float) -> None:
+    """
+    Measure replica lag every `interval_seconds` (runs until cancelled).
+
+    Args:
+        interval_seconds: Delay between measurements
+    """
+    while True:
+        try:
+            await check_replica_lag(replica_engine, replica_health)
+        except Exception as e:
+            logger.warning("Unable to measure replica lag, reading from primary: %s", e)
+        await asyncio.sleep(interval_seconds)
+
 
 async def test_db_connection() -> bool:
     """
@@ -121,8 +355,11 @@ async def init_db() -> None:
                 from app.models import (
                     Bookmark,
                     Comment,
+                    NewsletterArticleRecord,
                     NewsletterSubscription,
                     ReadingProgress,
+                    RefreshToken,
+                    RevokedToken,
                     Story,
                     StoryTheme,
                     Theme,
@@ -148,17 +385,77 @@ async def init_db() -> None:
             await asyncio.sleep(delay)
 
 
-async def get_session() -> AsyncSession:
+async def get_session(request: Request) -> AsyncSession:
     """
     Dependency to get async database session.
 
+    The session is lazy: it checks out a pooled connection on its first
+    statement (routes that never query never touch the pool) and returns it
+    on commit or rollback. On routes using SessionReleasingRoute it is also
+    closed as soon as the endpoint returns, before the response and
+    background tasks are sent, instead of at dependency teardown.
+
     Yields:
         AsyncSession: Database session
 
     Usage:
-        @app.get("/items")
+        router = APIRouter(route_class=SessionReleasingRoute)
+
+        @router.get("/items")
         async def get_items(session: AsyncSession = Depends(get_session)):
             ...
     """
     async with async_session_maker() as session:
+        if replica_engine is not None:
+            # Lets a commit keep this client's reads on the primary for a while
+            session.info["client_key"] = client_key(request)
+        request.scope.setdefault(REQUEST_SESSIONS_KEY, []).append(session)
+        yield session
+
+
+async def get_read_session(request: Request) -> AsyncSession:
+    """
+    Dependency to get a session for read-only work (GET routes).
+
+    Uses the read replica when one is configured, its lag is within
+    DB_REPLICA_MAX_LAG_SECONDS and the client has not written through the
+    primary in the last DB_READ_YOUR_WRITES_SECONDS; otherwise the primary.
+    Lazy and released early like get_session.
+
+    Yields:
+        AsyncSession: Database session (do not write through it)
+    """
+    session_maker = async_session_maker
+    if (
+        replica_session_maker is not None
+        and replica_health.usable
+        and not recent_writers.is_recent(client_key(request))
+    ):
+        session_maker = replica_session_maker
+
+    async with session_maker() as session:
+        request.scope.setdefault(REQUEST_SESSIONS_KEY, []).append(session)
         yield session
+
+
+class SessionReleasingRoute(APIRoute):
+    """
+    Route that closes the request's sessions once the endpoint has built its response.
+
+    FastAPI tears down yield dependencies only after the response has been
+    sent, so a read-only request would otherwise keep its connection (idle
+    in transaction) through serialization, the network write and any
+    background tasks.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def release_sessions_then_respond(request: Request) -> Response:
+            try:
+                return await handler(request)
+            finally:
+                for session in request.scope.pop(REQUEST_SESSIONS_KEY, ()):
+                    await session.close()
+
+        return release_sessions_then_respond
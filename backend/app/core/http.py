@@ -0,0 +1,46 @@
+"""
+Shared outbound HTTP client.
+"""
+
+import httpx
+
+# Connection pool limits for outbound requests (RSS feeds, third-party APIs)
+HTTP_MAX_CONNECTIONS = 20
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 10
+HTTP_USER_AGENT = "TheIncurableHumanist/1.0 (+https://theincurablehumanist.com)"
+
+_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the process-wide pooled httpx client.
+
+    The client is created lazily on first use so that importing this module
+    does not require a running event loop.
+
+    Returns:
+        httpx.AsyncClient: Shared client with keep-alive connection pooling
+    """
+    global _client
+
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            ),
+            headers={"User-Agent": HTTP_USER_AGENT},
+            follow_redirects=True,
+        )
+
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared client and release its pooled connections."""
+    global _client
+
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -0,0 +1,209 @@
+"""
+HTTP middleware: per-client rate limiting.
+
+Limits are configured per router prefix (RATE_LIMITS) as "<requests>/<period>"
+token buckets: the bucket holds <requests> tokens and refills at
+<requests>/<period>. Authenticated requests are charged to the user's bucket,
+anonymous ones to the client IP's, so users sharing an IP (offices, mobile
+carriers) do not throttle each other.
+
+State lives in process memory by default. With RATE_LIMIT_BACKEND=redis the
+buckets are shared by every worker and instance through an atomic Lua script;
+if Redis is unreachable requests are let through (fail open).
+"""
+
+import json
+import logging
+import time
+from dataclasses import dataclass
+from typing import Protocol
+
+from starlette.requests import Request
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from .config import settings
+from .ratelimit import TokenBuckets, client_ip
+from .security import decode_access_token
+
+logger = logging.getLogger(__name__)
+
+PERIOD_SECONDS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+
+# Atomic token bucket in Redis; uses the server clock so all workers agree.
+# Returns the wait in seconds as a string (Lua numbers become integers in replies).
+REDIS_TOKEN_BUCKET = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local updated = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - updated) * rate)
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+return tostring(wait)
+"""
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """
+    Token bucket parameters.
+
+    Attributes:
+        capacity: Burst size (requests)
+        rate: Refill rate (requests per second)
+    """
+
+    capacity: int
+    rate: float
+
+    @classmethod
+    def parse(cls, spec: str) -> "RateLimit":
+        """
+        Parse "<requests>/<period>", e.g. "120/minute".
+
+        Raises:
+            ValueError: If the spec is malformed
+        """
+        count, _, period = spec.partition("/")
+        if period not in PERIOD_SECONDS or not count.strip().isdigit() or int(count) < 1:
+            raise ValueError(f"Invalid rate limit {spec!r}, expected e.g. '120/minute'")
+        return cls(capacity=int(count), rate=int(count) / PERIOD_SECONDS[period])
+
+
+class RateLimitBackend(Protocol):
+    async def consume(self, key: str, limit: RateLimit) -> float:
+        """Take a token; returns 0.0 if allowed, else seconds until one is available."""
+        ...
+
+
+class MemoryRateLimitBackend:
+    """Per-process buckets (one TokenBuckets per distinct limit)."""
+
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        self._buckets: dict[RateLimit, TokenBuckets] = {}
+
+    async def consume(self, key: str, limit: RateLimit) -> float:
+        buckets = self._buckets.get(limit)
+        if buckets is None:
+            buckets = self._buckets[limit] = TokenBuckets(
+                rate=limit.rate, capacity=limit.capacity, max_keys=self.max_keys
+            )
+        return buckets.consume(key)
+
+
+class RedisRateLimitBackend:
+    """Buckets shared through Redis; fails open when Redis is unavailable."""
+
+    def __init__(self, url: str, key_prefix: str = "ratelimit:"):
+        # Imported lazily: only deployments using the Redis backend need a server
+        from redis.asyncio import Redis
+
+        self._redis = Redis.from_url(url, socket_timeout=0.25, socket_connect_timeout=0.25)
+        self._script = self._redis.register_script(REDIS_TOKEN_BUCKET)
+        self.key_prefix = key_prefix
+        self._last_warning = 0.0
+
+    async def consume(self, key: str, limit: RateLimit) -> float:
+        try:
+            wait = await self._script(
+                keys=[f"{self.key_prefix}{key}"], args=[limit.rate, limit.capacity]
+            )
+        except Exception as e:
+            now = time.monotonic()
+            if now - self._last_warning > 60:
+                self._last_warning = now
+                logger.warning("Rate limit backend unavailable, allowing requests: %s", e)
+            return 0.0
+        return float(wait)
+
+    async def close(self) -> None:
+        await self._redis.aclose()
+
+
+def client_key(request: Request) -> str:
+    """User id for authenticated requests, client IP otherwise."""
+    authorization = request.headers.get("authorization", "")
+    scheme, _, token = authorization.partition(" ")
+    if token and scheme.lower() == "bearer":
+        payload = decode_access_token(token)
+        if payload and payload.get("sub"):
+            return f"user:{payload['sub']}"
+    return f"ip:{client_ip(request)}"
+
+
+def create_rate_limit_backend() -> RateLimitBackend:
+    """Backend selected by RATE_LIMIT_BACKEND ("memory" or "redis")."""
+    if settings.RATE_LIMIT_BACKEND == "redis":
+        return RedisRateLimitBackend(settings.REDIS_URL)
+    if settings.RATE_LIMIT_BACKEND != "memory":
+        raise ValueError(f"Unknown RATE_LIMIT_BACKEND {settings.RATE_LIMIT_BACKEND!r}")
+    return MemoryRateLimitBackend()
+
+
+class RateLimitMiddleware:
+    """
+    ASGI middleware applying per-router token buckets.
+
+    Args:
+        app: Wrapped ASGI application
+        limits: Path prefix -> RateLimit; the longest matching prefix applies
+            and unmatched paths are not limited
+        backend: Bucket storage
+    """
+
+    def __init__(self, app: ASGIApp, limits: dict[str, RateLimit], backend: RateLimitBackend):
+        self.app = app
+        self.backend = backend
+        self.rules = sorted(limits.items(), key=lambda rule: len(rule[0]), reverse=True)
+
+    def _match(self, path: str) -> tuple[str, RateLimit] | None:
+        for prefix, limit in self.rules:
+            if path.startswith(prefix):
+                return prefix, limit
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        rule = self._match(scope["path"])
+        if rule is None:
+            await self.app(scope, receive, send)
+            return
+
+        prefix, limit = rule
+        key = f"{prefix}:{client_key(Request(scope))}"
+        retry_after = await self.backend.consume(key, limit)
+        if not retry_after:
+            await self.app(scope, receive, send)
+            return
+
+        body = json.dumps({"detail": "Too many requests. Please try again later."}).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 429,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"retry-after", str(max(1, int(retry_after + 0.999))).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+
+def configured_rate_limits() -> dict[str, RateLimit]:
+    """RATE_LIMITS parsed into RateLimit objects (validated at startup)."""
+    return {prefix: RateLimit.parse(spec) for prefix, spec in settings.RATE_LIMITS.items()}
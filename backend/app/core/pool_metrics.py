@@ -0,0 +1,179 @@
+"""
+Connection pool telemetry.
+
+Records, per checkout, how long the caller waited for a connection, how long
+the connection was held and how full the pool was, as fixed-bucket
+histograms (constant memory, cheap to update). Served by
+GET /api/metrics/db to size DB_POOL_SIZE / DB_MAX_OVERFLOW from data:
+waits and saturation near 1.0 mean the pool is too small; long holds point
+at routes keeping a connection across slow work. Checkouts made by
+maintenance tasks (idle validation) are left out, see untracked_checkouts.
+"""
+
+import bisect
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, Sequence
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool
+
+WAIT_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+HOLD_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+# Fraction of pool capacity (size + overflow) in use right after a checkout
+SATURATION_BUCKETS = (0.25, 0.5, 0.75, 0.9, 1.0)
+
+# True while the current task's checkouts should not be recorded
+_untracked: ContextVar[bool] = ContextVar("pool_checkouts_untracked", default=False)
+
+
+@contextmanager
+def untracked_checkouts() -> Iterator[None]:
+    """Leave checkouts made inside the block out of the pool telemetry."""
+    token = _untracked.set(True)
+    try:
+        yield
+    finally:
+        _untracked.reset(token)
+
+
+class Histogram:
+    """
+    Cumulative histogram over fixed upper bounds (plus an overflow bucket).
+
+    Args:
+        bounds: Increasing bucket upper bounds
+    """
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-quantile (max for the overflow bucket)."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                return min(self.bounds[index], self.max) if index < len(self.bounds) else self.max
+        return self.max
+
+    def snapshot(self) -> dict[str, Any]:
+        labels = [f"le_{bound:g}" for bound in self.bounds] + ["inf"]
+        return {
+            "count": self.count,
+            "avg": round(self.total / self.count, 3) if self.count else 0.0,
+            "p50": round(self.quantile(0.5), 3),
+            "p95": round(self.quantile(0.95), 3),
+            "p99": round(self.quantile(0.99), 3),
+            "max": round(self.max, 3),
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+class PoolMonitor:
+    """
+    Checkout wait, hold time and saturation histograms for one engine's pool.
+
+    Hold time and saturation come from the pool's checkout/checkin events;
+    wait time is recorded by InstrumentedAsyncQueuePool, since no pool event
+    fires when a checkout starts waiting.
+    """
+
+    def __init__(self):
+        self.wait_ms = Histogram(WAIT_BUCKETS_MS)
+        self.hold_ms = Histogram(HOLD_BUCKETS_MS)
+        self.saturation = Histogram(SATURATION_BUCKETS)
+        self.timeouts = 0
+        self.capacity = 0
+        self._target: Engine | Pool | None = None
+
+    @property
+    def pool(self) -> Pool | None:
+        # Engines replace their pool on dispose(); always look it up
+        return self._target.pool if isinstance(self._target, Engine) else self._target
+
+    def attach(self, target: Engine | Pool, capacity: int) -> None:
+        """
+        Listen to a pool's checkout/checkin events.
+
+        Args:
+            target: Sync engine (AsyncEngine.sync_engine) or pool
+            capacity: Connections the pool can hand out (pool_size + max_overflow)
+        """
+        self._target = target
+        self.capacity = capacity
+        event.listen(target, "checkout", self._on_checkout)
+        event.listen(target, "checkin", self._on_checkin)
+
+    def record_wait(self, seconds: float, timed_out: bool = False) -> None:
+        self.wait_ms.observe(seconds * 1000)
+        if timed_out:
+            self.timeouts += 1
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        if _untracked.get():
+            return
+        connection_record.info["checked_out_at"] = time.perf_counter()
+        pool = self.pool
+        if pool is not None and self.capacity > 0:
+            self.saturation.observe(pool.checkedout() / self.capacity)
+
+    def _on_checkin(self, dbapi_connection, connection_record) -> None:
+        checked_out_at = connection_record.info.pop("checked_out_at", None)
+        if checked_out_at is not None:
+            self.hold_ms.observe((time.perf_counter() - checked_out_at) * 1000)
+
+    def metrics(self) -> dict[str, Any]:
+        """Current pool gauges and the checkout histograms."""
+        pool = self.pool
+        gauges = {}
+        if pool is not None and hasattr(pool, "checkedout"):
+            gauges = {
+                "size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                "overflow": pool.overflow(),
+            }
+        return {
+            "capacity": self.capacity,
+            **gauges,
+            "timeouts": self.timeouts,
+            "checkout_wait_ms": self.wait_ms.snapshot(),
+            "hold_ms": self.hold_ms.snapshot(),
+            "saturation": self.saturation.snapshot(),
+        }
+
+
+pool_monitor = PoolMonitor()
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records how long each checkout waits in pool_monitor."""
+
+    def connect(self):
+        if _untracked.get():
+            return super().connect()
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            pool_monitor.record_wait(time.perf_counter() - started, timed_out=True)
+            raise
+        pool_monitor.record_wait(time.perf_counter() - started)
+        return connection
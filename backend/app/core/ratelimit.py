@@ -0,0 +1,241 @@
+"""
+Admission control primitives: keyed token buckets and a concurrency limiter
+with a bounded wait queue.
+"""
+
+import asyncio
+import math
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+
+from fastapi import Request
+
+from .config import settings
+
+
+class AdmissionRejected(Exception):
+    """
+    Raised when work is shed instead of queued.
+
+    Attributes:
+        retry_after: Suggested delay in seconds before the client retries
+    """
+
+    def __init__(self, retry_after: float):
+        super().__init__(f"Rejected, retry after {retry_after:.1f}s")
+        self.retry_after = retry_after
+
+    @property
+    def retry_after_header(self) -> str:
+        """Retry-After header value (whole seconds, at least 1)."""
+        return str(max(1, math.ceil(self.retry_after)))
+
+
+class TokenBuckets:
+    """
+    Independent token buckets per key (email, IP, ...).
+
+    Buckets refill continuously at `rate` tokens per second up to `capacity`.
+    The least recently used keys are evicted beyond `max_keys`, which only
+    ever forgives a client, so memory stays bounded under key-spraying.
+    """
+
+    def __init__(self, rate: float, capacity: int, max_keys: int = 10_000):
+        self.rate = rate
+        self.capacity = capacity
+        self.max_keys = max_keys
+        # key -> (tokens, last refill monotonic time)
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    def consume(self, key: str) -> float:
+        """
+        Take one token from the key's bucket.
+
+        Args:
+            key: Bucket key
+
+        Returns:
+            0.0 if a token was taken, otherwise seconds until one is available
+        """
+        now = time.monotonic()
+        tokens, updated = self._buckets.pop(key, (float(self.capacity), now))
+        tokens = min(float(self.capacity), tokens + (now - updated) * self.rate)
+
+        if tokens >= 1.0:
+            self._buckets[key] = (tokens - 1.0, now)
+            wait = 0.0
+        else:
+            self._buckets[key] = (tokens, now)
+            wait = (1.0 - tokens) / self.rate
+
+        while len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return wait
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+class ConcurrencyLimiter:
+    """
+    Caps concurrent executions of an expensive operation.
+
+    Callers beyond `max_concurrent` wait in a FIFO queue of at most
+    `max_queue` entries for up to `queue_timeout` seconds. A full queue or an
+    expired wait raises AdmissionRejected right away, so overload turns into
+    fast rejections instead of unbounded latency.
+    """
+
+    def __init__(self, max_concurrent: int, max_queue: int, queue_timeout: float):
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+
+        self._active = 0
+        self._waiters: deque[asyncio.Future] = deque()
+
+        self.admitted = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self._waits_ms: deque[float] = deque(maxlen=1024)
+        self._max_wait_ms = 0.0
+        self._peak_queue_depth = 0
+        # Exponential moving average of how long a slot is held
+        self._hold_seconds = 0.0
+
+    @property
+    def in_flight(self) -> int:
+        return self._active
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._waiters)
+
+    def retry_after(self) -> float:
+        """Estimated seconds until the current queue drains."""
+        if not self._hold_seconds:
+            return 1.0
+        return (self.queue_depth + 1) / self.max_concurrent * self._hold_seconds
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """
+        Hold one execution slot for the duration of the block.
+
+        Raises:
+            AdmissionRejected: If the wait queue is full or the wait timed out
+        """
+        waited = await self._acquire()
+        self._record_wait(waited)
+
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            held = time.monotonic() - started
+            if self._hold_seconds:
+                held = 0.8 * self._hold_seconds + 0.2 * held
+            self._hold_seconds = held
+            self._release()
+
+    async def _acquire(self) -> float:
+        """Take a slot, queueing if needed; returns the time waited in seconds."""
+        if self._active < self.max_concurrent and not self._waiters:
+            self._active += 1
+            return 0.0
+
+        if len(self._waiters) >= self.max_queue:
+            self.rejected += 1
+            raise AdmissionRejected(self.retry_after())
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self._peak_queue_depth = max(self._peak_queue_depth, len(self._waiters))
+        started = time.monotonic()
+
+        try:
+            # A releasing caller hands its slot over by resolving the future
+            await asyncio.wait_for(waiter, self.queue_timeout)
+        except asyncio.TimeoutError:
+            self._discard(waiter)
+            self.timed_out += 1
+            raise AdmissionRejected(self.retry_after()) from None
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Cancelled right after the slot was handed over: pass it on
+                self._release()
+            else:
+                self._discard(waiter)
+            raise
+
+        return time.monotonic() - started
+
+    def _discard(self, waiter: asyncio.Future) -> None:
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+
+    def _release(self) -> None:
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._active -= 1
+
+    def _record_wait(self, waited: float) -> None:
+        waited_ms = waited * 1000
+        self.admitted += 1
+        self._waits_ms.append(waited_ms)
+        self._max_wait_ms = max(self._max_wait_ms, waited_ms)
+
+    def metrics(self) -> dict[str, Any]:
+        """Current limiter state and wait-time statistics (recent 1024 admissions)."""
+        waits = sorted(self._waits_ms)
+        p95 = waits[min(len(waits) - 1, int(0.95 * len(waits)))] if waits else 0.0
+        return {
+            "max_concurrent": self.max_concurrent,
+            "max_queue": self.max_queue,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "peak_queue_depth": self._peak_queue_depth,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+            "wait_ms": {
+                "avg": round(sum(waits) / len(waits), 2) if waits else 0.0,
+                "p95": round(p95, 2),
+                "max": round(self._max_wait_ms, 2),
+            },
+            "avg_hold_ms": round(self._hold_seconds * 1000, 2),
+        }
+
+
+def client_ip(request: Request) -> str:
+    """
+    Best-effort client IP for rate limiting.
+
+    With TRUSTED_PROXY_HOPS > 0 the address is read from X-Forwarded-For,
+    counting that many proxies from the right (entries further left can be
+    forged by the client).
+
+    Args:
+        request: Incoming request
+
+    Returns:
+        Client IP address, or "unknown"
+    """
+    hops = settings.TRUSTED_PROXY_HOPS
+    if hops > 0:
+        forwarded = [
+            part.strip()
+            for part in request.headers.get("x-forwarded-for", "").split(",")
+            if part.strip()
+        ]
+        if forwarded:
+            return forwarded[-min(hops, len(forwarded))]
+
+    return request.client.host if request.client else "unknown"
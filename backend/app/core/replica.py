@@ -0,0 +1,139 @@
+"""
+Read replica routing state: replication lag health and read-your-writes stickiness.
+
+get_read_session sends a request to the replica only while the replica is
+known to be fresh (lag measured in the background by check_replica_lag)
+and the client has not written through the primary within
+DB_READ_YOUR_WRITES_SECONDS; otherwise reads fall back to the primary.
+"""
+
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# Seconds the replica is behind; 0 when it has replayed everything it received
+# (replay timestamps alone would report growing "lag" while the primary is idle).
+# NULL when the WAL receiver is not streaming: having replayed everything it
+# received says nothing about freshness once it is cut off from the primary.
+REPLICA_LAG_QUERY = text(
+    """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN NOT EXISTS (
+            SELECT 1 FROM pg_stat_wal_receiver WHERE status = 'streaming'
+        ) THEN NULL
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+    """
+)
+
+
+class ReplicaNotStreamingError(Exception):
+    """Raised when the replica's WAL receiver is not streaming from the primary."""
+
+
+class ReplicaHealth:
+    """
+    Last measured replication lag.
+
+    Args:
+        max_lag_seconds: Lag above which reads go to the primary
+        stale_after_seconds: Age after which a measurement no longer counts
+            (the replica is treated as unavailable)
+    """
+
+    def __init__(self, max_lag_seconds: float, stale_after_seconds: float):
+        self.max_lag_seconds = max_lag_seconds
+        self.stale_after_seconds = stale_after_seconds
+        self.lag_seconds: float | None = None
+        self.last_error: str | None = None
+        self.checked_at: datetime | None = None
+        self._measured_at = 0.0
+
+    def record(self, lag_seconds: float) -> None:
+        self.lag_seconds = lag_seconds
+        self.last_error = None
+        self.checked_at = datetime.utcnow()
+        self._measured_at = time.monotonic()
+
+    def record_failure(self, error: Exception) -> None:
+        self.lag_seconds = None
+        self.last_error = str(error)
+        self.checked_at = datetime.utcnow()
+
+    @property
+    def usable(self) -> bool:
+        """True if the last lag measurement is recent and within max_lag_seconds."""
+        return (
+            self.lag_seconds is not None
+            and self.lag_seconds <= self.max_lag_seconds
+            and time.monotonic() - self._measured_at <= self.stale_after_seconds
+        )
+
+    def metrics(self) -> dict[str, Any]:
+        return {
+            "usable": self.usable,
+            "lag_seconds": self.lag_seconds,
+            "max_lag_seconds": self.max_lag_seconds,
+            "checked_at": self.checked_at.isoformat() if self.checked_at else None,
+            "last_error": self.last_error,
+        }
+
+
+class RecentWriters:
+    """
+    Clients that wrote through the primary recently (TTL + LRU, per process).
+
+    Args:
+        window_seconds: How long a client's reads stay on the primary after a write
+        max_size: Maximum number of tracked clients
+    """
+
+    def __init__(self, window_seconds: float, max_size: int = 10_000):
+        self.window_seconds = window_seconds
+        self.max_size = max_size
+        # client key -> monotonic end of the sticky window
+        self._until: OrderedDict[str, float] = OrderedDict()
+
+    def mark(self, key: str) -> None:
+        if self.window_seconds <= 0:
+            return
+        self._until[key] = time.monotonic() + self.window_seconds
+        self._until.move_to_end(key)
+        while len(self._until) > self.max_size:
+            self._until.popitem(last=False)
+
+    def is_recent(self, key: str) -> bool:
+        until = self._until.get(key)
+        if until is None:
+            return False
+        if until <= time.monotonic():
+            del self._until[key]
+            return False
+        return True
+
+    def __len__(self) -> int:
+        return len(self._until)
+
+
+async def check_replica_lag(replica_engine: AsyncEngine, health: ReplicaHealth) -> None:
+    """
+    Measure replication lag on the replica and record it.
+
+    Failures, including a WAL receiver that is not streaming, mark the
+    replica unusable and are re-raised.
+    """
+    try:
+        async with replica_engine.connect() as conn:
+            lag = await conn.scalar(REPLICA_LAG_QUERY)
+        if lag is None:
+            raise ReplicaNotStreamingError("WAL receiver is not streaming")
+    except Exception as e:
+        health.record_failure(e)
+        raise
+    health.record(float(lag))
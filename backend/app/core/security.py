@@ -2,6 +2,16 @@
 Security utilities for authentication and authorization.
 """
 
+import asyncio
+import base64
+import hashlib
+import hmac
+import logging
+import math
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Any
 
@@ -9,10 +19,36 @@ from jose import JWTError, jwt
 from passlib.context import CryptContext
 
 from .config import settings
+from .ratelimit import ConcurrencyLimiter
+
+logger = logging.getLogger(__name__)
+
+# Bounds for the bcrypt cost picked by calibration
+BCRYPT_MIN_ROUNDS = 10
+BCRYPT_MAX_ROUNDS = 16
+
+# Stored instead of a hash for accounts without a password yet (e.g. imported
+# subscribers); it is not a valid hash, so no password can ever match it
+UNUSABLE_PASSWORD = "!"
 
 # Password hashing context
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Bounded pool for bcrypt work. bcrypt releases the GIL while hashing, so the
+# threads run in parallel across cores and the event loop stays free.
+_password_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    thread_name_prefix="password-hash",
+)
+
+# Admission control in front of the pool: overload is shed with
+# AdmissionRejected instead of piling up behind the workers
+password_limiter = ConcurrencyLimiter(
+    max_concurrent=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+    queue_timeout=settings.PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS,
+)
+
 
 def hash_password(password: str) -> str:
     """
@@ -41,6 +77,151 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def is_password_usable(hashed_password: str) -> bool:
+    """
+    Check whether a stored hash can be verified at all.
+
+    Args:
+        hashed_password: Stored password hash
+
+    Returns:
+        False for placeholder accounts that must set a password first
+    """
+    return not hashed_password.startswith(UNUSABLE_PASSWORD)
+
+
+async def hash_password_async(password: str) -> str:
+    """
+    Hash a password on the password hashing pool.
+
+    Args:
+        password: Plain text password
+
+    Returns:
+        Hashed password string
+
+    Raises:
+        AdmissionRejected: If the pool is saturated
+    """
+    loop = asyncio.get_running_loop()
+    async with password_limiter.slot():
+        return await loop.run_in_executor(_password_executor, hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password against its hash on the password hashing pool.
+
+    Args:
+        plain_password: Plain text password to verify
+        hashed_password: Hashed password to compare against
+
+    Returns:
+        True if password matches, False otherwise
+
+    Raises:
+        AdmissionRejected: If the pool is saturated
+    """
+    loop = asyncio.get_running_loop()
+    async with password_limiter.slot():
+        return await loop.run_in_executor(
+            _password_executor, verify_password, plain_password, hashed_password
+        )
+
+
+async def verify_and_update_password_async(
+    plain_password: str,
+    hashed_password: str,
+) -> tuple[bool, str | None]:
+    """
+    Verify a password and rehash it if its bcrypt cost differs from the current one.
+
+    Args:
+        plain_password: Plain text password to verify
+        hashed_password: Hashed password to compare against
+
+    Returns:
+        (matches, new hash to persist or None)
+
+    Raises:
+        AdmissionRejected: If the pool is saturated
+    """
+    loop = asyncio.get_running_loop()
+    async with password_limiter.slot():
+        return await loop.run_in_executor(
+            _password_executor, pwd_context.verify_and_update, plain_password, hashed_password
+        )
+
+
+def calibrate_bcrypt_rounds(target_ms: float, samples: int = 3) -> int:
+    """
+    Find the bcrypt cost whose hash time best fits a latency budget on this machine.
+
+    Each extra round doubles the work, so one cheap measurement is extrapolated
+    to the largest cost that stays within the budget.
+
+    Args:
+        target_ms: Latency budget for one hash in milliseconds
+        samples: Measurements to take (the fastest is used)
+
+    Returns:
+        bcrypt rounds, clamped to [BCRYPT_MIN_ROUNDS, BCRYPT_MAX_ROUNDS]
+    """
+    probe_rounds = BCRYPT_MIN_ROUNDS - 2
+    bcrypt_handler = pwd_context.handler("bcrypt").using(rounds=probe_rounds)
+
+    probe_ms = math.inf
+    for _ in range(samples):
+        started = time.perf_counter()
+        bcrypt_handler.hash("calibration-password")
+        probe_ms = min(probe_ms, (time.perf_counter() - started) * 1000)
+
+    rounds = probe_rounds + math.floor(math.log2(target_ms / probe_ms))
+    return max(BCRYPT_MIN_ROUNDS, min(BCRYPT_MAX_ROUNDS, rounds))
+
+
+def set_bcrypt_rounds(rounds: int) -> None:
+    """
+    Make `rounds` the bcrypt cost for new hashes and the only cost treated as current.
+
+    Stored hashes with any other cost are reported by verify_and_update so
+    they can be rehashed on the next successful login.
+
+    Args:
+        rounds: bcrypt cost
+    """
+    pwd_context.update(
+        bcrypt__default_rounds=rounds,
+        bcrypt__min_rounds=rounds,
+        bcrypt__max_rounds=rounds,
+    )
+
+
+async def configure_password_hashing() -> int:
+    """
+    Apply BCRYPT_ROUNDS, or calibrate to PASSWORD_HASH_TARGET_MS when it is 0.
+
+    Returns:
+        bcrypt rounds in use
+    """
+    rounds = settings.BCRYPT_ROUNDS
+    if rounds:
+        logger.info("bcrypt cost set to %d rounds (configured)", rounds)
+    else:
+        loop = asyncio.get_running_loop()
+        rounds = await loop.run_in_executor(
+            _password_executor, calibrate_bcrypt_rounds, settings.PASSWORD_HASH_TARGET_MS
+        )
+        logger.info(
+            "bcrypt cost calibrated to %d rounds for a %g ms budget",
+            rounds,
+            settings.PASSWORD_HASH_TARGET_MS,
+        )
+
+    set_bcrypt_rounds(rounds)
+    return rounds
+
+
 def create_access_token(data: dict[str, Any], expires_delta: timedelta | None = None) -> str:
     """
     Create a JWT access token.
@@ -60,23 +241,168 @@ def create_access_token(data: dict[str, Any], expires_delta: timedelta | None =
         expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
 
     to_encode.update({"exp": expire})
+    to_encode.setdefault("jti", uuid.uuid4().hex)
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
 
     return encoded_jwt
 
 
+class VerifiedTokenCache:
+    """
+    Bounded LRU cache of verified JWT payloads.
+
+    Keyed by a SHA-256 digest of the token (the token itself is never stored).
+    An entry is only served while the token's `exp` is in the future, so the
+    cache can never extend a token's lifetime; tokens without `exp` are not
+    cached.
+
+    Args:
+        max_size: Maximum number of cached tokens (0 disables the cache)
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        # token digest -> (payload, exp epoch seconds)
+        self._entries: OrderedDict[bytes, tuple[dict[str, Any], float]] = OrderedDict()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> dict[str, Any] | None:
+        """Cached payload (a copy) for a still-valid token, or None."""
+        key = self._key(token)
+        cached = self._entries.get(key)
+        if cached is None:
+            return None
+
+        payload, expires_at = cached
+        if time.time() >= expires_at:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return dict(payload)
+
+    def put(self, token: str, payload: dict[str, Any]) -> None:
+        """Cache the payload of a token that has just been verified."""
+        expires_at = payload.get("exp")
+        if self.max_size <= 0 or not isinstance(expires_at, (int, float)):
+            return
+
+        key = self._key(token)
+        self._entries[key] = (dict(payload), float(expires_at))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+token_cache = VerifiedTokenCache(max_size=settings.TOKEN_CACHE_MAX_SIZE)
+
+
 def decode_access_token(token: str) -> dict[str, Any] | None:
     """
     Decode and validate a JWT access token.
 
+    Tokens seen before are served from the verified-token cache until they
+    expire; only new tokens pay for signature verification.
+
     Args:
         token: JWT token string
 
     Returns:
         Decoded token payload dict, or None if invalid
     """
+    payload = token_cache.get(token)
+    if payload is not None:
+        return payload
+
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        return payload
     except JWTError:
         return None
+
+    token_cache.put(token, payload)
+    return payload
+
+
+def _reset_signing_key() -> bytes:
+    """Key for password-reset tokens, derived from SECRET_KEY for this purpose only."""
+    return hmac.new(settings.SECRET_KEY.encode(), b"password-reset", hashlib.sha256).digest()
+
+
+def password_fingerprint(hashed_password: str) -> str:
+    """
+    Short keyed fingerprint of a stored password hash.
+
+    Embedded in reset tokens: once the password changes, the fingerprint no
+    longer matches and every outstanding reset token stops working.
+
+    Args:
+        hashed_password: Stored password hash
+
+    Returns:
+        16 hex characters
+    """
+    digest = hmac.new(_reset_signing_key(), hashed_password.encode(), hashlib.sha256)
+    return digest.hexdigest()[:16]
+
+
+def create_password_reset_token(
+    user_id: int,
+    hashed_password: str,
+    expires_delta: timedelta | None = None,
+) -> str:
+    """
+    Create a stateless, HMAC-signed password reset token.
+
+    The token is `<user id>.<expiry epoch>.<password fingerprint>.<signature>`,
+    so it can be checked without any token table.
+
+    Args:
+        user_id: User requesting the reset
+        hashed_password: The user's current password hash
+        expires_delta: Token lifetime (defaults to PASSWORD_RESET_EXPIRE_MINUTES)
+
+    Returns:
+        URL-safe reset token
+    """
+    expires_delta = expires_delta or timedelta(minutes=settings.PASSWORD_RESET_EXPIRE_MINUTES)
+    expires_at = int(time.time() + expires_delta.total_seconds())
+    body = f"{user_id}.{expires_at}.{password_fingerprint(hashed_password)}"
+    return f"{body}.{_sign_reset_token(body)}"
+
+
+def read_password_reset_token(token: str) -> tuple[int, str] | None:
+    """
+    Check a reset token's signature and expiry.
+
+    Args:
+        token: Token from the reset link
+
+    Returns:
+        (user id, password fingerprint), or None if forged, malformed or expired.
+        The caller must still compare the fingerprint with the user's current hash.
+    """
+    body, _, signature = token.rpartition(".")
+    if not body or not hmac.compare_digest(
+        signature.encode(), _sign_reset_token(body).encode()
+    ):
+        return None
+
+    user_id, expires_at, fingerprint = body.split(".")
+    if int(expires_at) <= time.time():
+        return None
+
+    return int(user_id), fingerprint
+
+
+def _sign_reset_token(body: str) -> str:
+    signature = hmac.new(_reset_signing_key(), body.encode(), hashlib.sha256).digest()
+    return base64.urlsafe_b64encode(signature).rstrip(b"=").decode()
@@ -3,17 +3,35 @@ Main FastAPI application entry point.
 The Incurable Humanist - Personal Publication Platform
 """
 
+import asyncio
 import logging
 import os
 from contextlib import asynccontextmanager
 from pathlib import Path
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
-from app.api import auth, newsletter
-from app.core.database import db_ping
+from app.api import auth, metrics, newsletter
+from app.core.config import settings
+from app.core.database import (
+    db_ping,
+    replica_engine,
+    run_idle_validation,
+    run_replica_lag_check,
+)
+from app.core.http import close_http_client
+from app.core.middleware import (
+    RateLimitMiddleware,
+    RedisRateLimitBackend,
+    configured_rate_limits,
+    create_rate_limit_backend,
+)
+from app.core.security import configure_password_hashing
+from app.services.auth import get_current_author
+from app.services.newsletter import feed_cache
+from app.services.tokens import run_revocation_sync
 
 # Configure logging
 logging.basicConfig(
@@ -28,10 +46,35 @@ async def lifespan(app: FastAPI):
     """Application lifespan events."""
     # Startup: Do not block on database connection
     logger.info("Starting application...")
+    # Pick the bcrypt cost for this machine's hardware
+    await configure_password_hashing()
+    # Warm the newsletter cache from the last-known-good snapshot (no network)
+    await feed_cache.load_snapshot()
+    # Load revoked tokens in the background (retried until the DB is reachable)
+    revocation_sync = asyncio.create_task(run_revocation_sync(settings.REVOCATION_SYNC_SECONDS))
+    # Find connections dropped while idle before a request checks them out
+    idle_validation = None
+    if settings.DB_LIVENESS_MODE == "background" and settings.DB_IDLE_VALIDATION_SECONDS > 0:
+        idle_validation = asyncio.create_task(
+            run_idle_validation(settings.DB_IDLE_VALIDATION_SECONDS)
+        )
+    # Measure replica lag; reads stay on the primary until the replica is known fresh
+    replica_lag_check = None
+    if replica_engine is not None:
+        replica_lag_check = asyncio.create_task(
+            run_replica_lag_check(settings.DB_REPLICA_LAG_CHECK_SECONDS)
+        )
     logger.info("Application startup complete (DB connection not required for startup)")
     yield
     # Shutdown: cleanup if needed
     logger.info("Application shutting down...")
+    revocation_sync.cancel()
+    for task in (idle_validation, replica_lag_check):
+        if task is not None:
+            task.cancel()
+    await close_http_client()
+    if isinstance(rate_limit_backend, RedisRateLimitBackend):
+        await rate_limit_backend.close()
 
 
 app = FastAPI(
@@ -41,6 +84,19 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# Per-client rate limiting (added before CORS so 429 responses carry CORS headers)
+rate_limit_backend = create_rate_limit_backend()
+if settings.RATE_LIMIT_ENABLED:
+    app.add_middleware(
+        RateLimitMiddleware,
+        limits=configured_rate_limits(),
+        backend=rate_limit_backend,
+    )
+    if os.getenv("RAILWAY_ENVIRONMENT") and settings.TRUSTED_PROXY_HOPS == 0:
+        logger.warning(
+            "TRUSTED_PROXY_HOPS=0 behind Railway's proxy: all clients share one rate limit bucket"
+        )
+
 # CORS configuration for frontend
 import os
 allowed_origins = [
@@ -95,6 +151,12 @@ async def api_root():
 # Include API routers
 app.include_router(auth.router, prefix="/api/auth", tags=["Authentication"])
 app.include_router(newsletter.router, prefix="/api/newsletter", tags=["Newsletter"])
+app.include_router(
+    metrics.router,
+    prefix="/api/metrics",
+    tags=["Metrics"],
+    dependencies=[Depends(get_current_author)],
+)
 
 # TODO: Include other routers when implemented
 # app.include_router(stories.router, prefix="/api/stories", tags=["Stories"])
@@ -2,9 +2,10 @@
 Database models for The Incurable Humanist platform.
 """
 
+from .auth_token import RefreshToken, RevokedToken
 from .bookmark import Bookmark
 from .comment import Comment, CommentStatus
-from .newsletter import NewsletterFrequency, NewsletterSubscription
+from .newsletter import NewsletterArticleRecord, NewsletterFrequency, NewsletterSubscription
 from .reading_progress import ReadingProgress
 from .story import Story, StoryStatus
 from .theme import StoryTheme, Theme
@@ -21,5 +22,8 @@ __all__ = [
     "Bookmark",
     "NewsletterSubscription",
     "NewsletterFrequency",
+    "NewsletterArticleRecord",
     "ReadingProgress",
+    "RefreshToken",
+    "RevokedToken",
 ]
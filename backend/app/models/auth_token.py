@@ -0,0 +1,59 @@
+"""
+Token models: rotating refresh tokens and revoked token ids.
+"""
+
+from datetime import datetime
+
+from sqlmodel import Field, SQLModel
+
+
+class RefreshToken(SQLModel, table=True):
+    """
+    Refresh token issued at login and rotated on every use.
+
+    Only a SHA-256 digest of the opaque token is stored. Every token issued
+    from one login shares a session_id, so a whole session can be revoked at
+    once (logout, or reuse of an already rotated token).
+
+    Attributes:
+        id: Primary key
+        token_hash: SHA-256 hex digest of the refresh token (unique)
+        user_id: Foreign key to User
+        session_id: Login session the token belongs to
+        expires_at: Expiry timestamp (UTC)
+        created_at: Issue timestamp
+        revoked_at: Set when the token is rotated or its session is revoked
+    """
+
+    __tablename__ = "refresh_token"
+
+    id: int | None = Field(default=None, primary_key=True)
+    token_hash: str = Field(unique=True, index=True, max_length=64)
+    user_id: int = Field(foreign_key="user.id", index=True)
+    session_id: str = Field(index=True, max_length=32)
+    expires_at: datetime
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    revoked_at: datetime | None = Field(default=None)
+
+
+class RevokedToken(SQLModel, table=True):
+    """
+    Revoked access token or session id.
+
+    Rows are loaded into the in-process revocation filter and can be pruned
+    once `expires_at` has passed (no access token carrying the id is still
+    valid by then).
+
+    Attributes:
+        id: Primary key
+        token_id: Revoked `jti` or `sid` claim (unique)
+        expires_at: When the revocation stops mattering (UTC)
+        revoked_at: Revocation timestamp
+    """
+
+    __tablename__ = "revoked_token"
+
+    id: int | None = Field(default=None, primary_key=True)
+    token_id: str = Field(unique=True, max_length=64)
+    expires_at: datetime = Field(index=True)
+    revoked_at: datetime = Field(default_factory=datetime.utcnow)
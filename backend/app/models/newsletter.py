@@ -1,12 +1,12 @@
 """
-Newsletter subscription model for reader preferences.
+Newsletter models: reader subscription preferences and the article archive.
 """
 
 from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import JSON, Column
+from sqlalchemy import JSON, Column, Text
 from sqlmodel import Field, Relationship, SQLModel
 
 if TYPE_CHECKING:
@@ -48,3 +48,43 @@ class NewsletterSubscription(SQLModel, table=True):
 
     # Relationships
     user: "User" = Relationship(back_populates="subscription")
+
+
+class NewsletterArticleRecord(SQLModel, table=True):
+    """
+    Archived newsletter article ingested from the Substack RSS feed.
+
+    Rows are keyed by the feed entry GUID and upserted only when the entry is
+    new or its content hash changed, so the archive keeps growing past the
+    RSS window.
+
+    Attributes:
+        id: Primary key
+        guid: Feed entry GUID (unique)
+        title: Article title
+        link: Canonical article URL
+        description: Summary HTML from the feed
+        excerpt: Plain-text excerpt of the summary
+        published: Published date as served by the API (ISO 8601 when parseable)
+        published_at: Parsed publication timestamp (UTC) used for ordering
+        author: Optional author name
+        content_hash: Hash of the served fields, used to detect changed entries
+        first_seen_at: First ingestion timestamp
+        updated_at: Last content change timestamp
+    """
+
+    __tablename__ = "newsletter_article"
+
+    id: int | None = Field(default=None, primary_key=True)
+    guid: str = Field(unique=True, index=True, max_length=1000)
+    title: str = Field(max_length=500)
+    link: str = Field(max_length=1000)
+    description: str = Field(default="", sa_column=Column(Text, nullable=False))
+    excerpt: str | None = Field(default=None, sa_column=Column(Text, nullable=True))
+    published: str = Field(max_length=100)
+    published_at: datetime | None = Field(default=None, index=True)
+    author: str | None = Field(default=None, max_length=255)
+    content_hash: str = Field(max_length=64)
+
+    first_seen_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
@@ -2,21 +2,88 @@
 Authentication service for user registration and login.
 """
 
-from datetime import timedelta
+import hmac
+import logging
+from datetime import datetime, timedelta
 from typing import Any
 
-from fastapi import Depends, HTTPException, status
+from fastapi import BackgroundTasks, Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy import update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.core.config import settings
-from app.core.database import get_session
-from app.core.security import create_access_token, decode_access_token, hash_password, verify_password
+from app.core.database import get_read_session
+from app.core.ratelimit import AdmissionRejected, TokenBuckets
+from app.core.security import (
+    create_password_reset_token,
+    decode_access_token,
+    hash_password_async,
+    is_password_usable,
+    password_fingerprint,
+    read_password_reset_token,
+    verify_and_update_password_async,
+)
 from app.models import User
+from app.services.email import send_password_reset_email
+from app.services.principals import Principal, principal_cache
+from app.services.tokens import issue_tokens, revocation_filter, revoke_user_sessions
+
+logger = logging.getLogger(__name__)
 
 security = HTTPBearer()
 
+# Per-key budgets for password work, so a single abuser cannot take the whole
+# bcrypt pool (see password_limiter for the global cap)
+login_email_buckets = TokenBuckets(
+    rate=settings.LOGIN_EMAIL_RATE_PER_MINUTE / 60,
+    capacity=settings.LOGIN_EMAIL_BURST,
+)
+auth_ip_buckets = TokenBuckets(
+    rate=settings.AUTH_IP_RATE_PER_MINUTE / 60,
+    capacity=settings.AUTH_IP_BURST,
+)
+
+
+def too_many_requests(rejected: AdmissionRejected) -> HTTPException:
+    """
+    Build the 429 response for shed or rate-limited password work.
+
+    Args:
+        rejected: Rejection carrying the suggested retry delay
+
+    Returns:
+        HTTPException with a Retry-After header
+    """
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail="Too many requests. Please try again later.",
+        headers={"Retry-After": rejected.retry_after_header},
+    )
+
+
+def check_auth_rate(client_ip: str, email: str | None = None) -> None:
+    """
+    Charge one login or registration attempt to the client's rate budgets.
+
+    Args:
+        client_ip: Client IP address
+        email: Login email (None for registrations)
+
+    Raises:
+        HTTPException: 429 if the IP or email budget is exhausted
+    """
+    retry_after = auth_ip_buckets.consume(client_ip)
+    if email is not None:
+        retry_after = max(retry_after, login_email_buckets.consume(email.lower()))
+
+    if retry_after:
+        raise too_many_requests(AdmissionRejected(retry_after))
+
 
 async def register_user(
     email: str,
@@ -27,6 +94,10 @@ async def register_user(
     """
     Register a new user.
 
+    The password is hashed first, then the user is created with a single
+    INSERT ... ON CONFLICT DO NOTHING RETURNING, so an existing email costs
+    no extra query and concurrent registrations cannot race.
+
     Args:
         email: User email (unique)
         password: Plain text password (min 8 chars)
@@ -37,18 +108,9 @@ async def register_user(
         Created User instance
 
     Raises:
-        HTTPException: If email already exists or validation fails
+        HTTPException: If email already exists or validation fails, or 429
+            if password hashing is saturated
     """
-    # Check if email already exists
-    result = await session.execute(select(User).where(User.email == email.lower()))
-    existing_user = result.scalar_one_or_none()
-
-    if existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered",
-        )
-
     # Validate password length
     if len(password) < 8:
         raise HTTPException(
@@ -56,22 +118,40 @@ async def register_user(
             detail="Password must be at least 8 characters",
         )
 
-    # Create new user
-    hashed_password = hash_password(password)
+    # Hash before touching the database so bcrypt never holds a pooled connection
+    try:
+        hashed_password = await hash_password_async(password)
+    except AdmissionRejected as e:
+        raise too_many_requests(e) from None
 
-    # Check if this is the author (Denise)
-    is_author = email.lower() == settings.AUTHOR_EMAIL.lower()
+    email = email.lower()
 
-    user = User(
-        email=email.lower(),
-        hashed_password=hashed_password,
-        full_name=full_name,
-        is_author=is_author,
+    # Check if this is the author (Denise)
+    is_author = email == settings.AUTHOR_EMAIL.lower()
+
+    # One statement: the unique index on email decides races between registrations
+    stmt = (
+        insert(User)
+        .values(
+            email=email,
+            hashed_password=hashed_password,
+            full_name=full_name,
+            is_author=is_author,
+            is_active=True,
+            created_at=datetime.utcnow(),
+        )
+        .on_conflict_do_nothing(index_elements=[User.email])
+        .returning(User)
     )
+    user = (await session.scalars(stmt)).one_or_none()
+
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already registered",
+        )
 
-    session.add(user)
     await session.commit()
-    await session.refresh(user)
 
     return user
 
@@ -84,6 +164,9 @@ async def authenticate_user(
     """
     Authenticate user with email and password.
 
+    A password hashed with a bcrypt cost other than the current one is
+    rehashed and saved on successful login.
+
     Args:
         email: User email
         password: Plain text password
@@ -91,74 +174,209 @@ async def authenticate_user(
 
     Returns:
         User instance if authenticated, None otherwise
+
+    Raises:
+        HTTPException: 429 if password verification is saturated
     """
     result = await session.execute(select(User).where(User.email == email.lower()))
     user = result.scalar_one_or_none()
 
-    if not user:
+    # End the read transaction so the pooled connection is not held (idle in
+    # transaction) while bcrypt waits for a worker and runs
+    await session.commit()
+
+    if not user or not is_password_usable(user.hashed_password):
         return None
 
-    if not verify_password(password, user.hashed_password):
+    try:
+        verified, new_hash = await verify_and_update_password_async(
+            password, user.hashed_password
+        )
+    except AdmissionRejected as e:
+        raise too_many_requests(e) from None
+
+    if not verified:
         return None
 
+    if new_hash:
+        # Stored hash uses another bcrypt cost: upgrade it while we have the password
+        await _save_rehashed_password(user, new_hash, session)
+
+    # The client is about to use its new token: make its first request warm
+    principal_cache.put(Principal.from_user(user))
+
     return user
 
 
-def create_user_token(user: User) -> dict[str, Any]:
+async def _save_rehashed_password(user: User, new_hash: str, session: AsyncSession) -> None:
     """
-    Create access token for user.
+    Persist an upgraded password hash (best effort, never fails the login).
+
+    The user is detached first, so rolling back a failed write cannot
+    expire its loaded attributes.
+    """
+    session.expunge(user)
+    try:
+        await session.execute(
+            update(User).where(User.id == user.id).values(hashed_password=new_hash)
+        )
+        await session.commit()
+    except (SQLAlchemyError, OSError) as e:
+        await session.rollback()
+        logger.warning("Unable to save rehashed password for user %s: %s", user.id, e)
+        return
+
+    set_committed_value(user, "hashed_password", new_hash)
+
+
+async def request_password_reset(
+    email: str,
+    session: AsyncSession,
+    background_tasks: BackgroundTasks,
+) -> None:
+    """
+    Queue a password reset email if the account exists.
+
+    The email is sent after the response, so the request never waits on
+    SendGrid and its timing does not reveal whether the account exists.
+
+    Args:
+        email: Account email
+        session: Database session
+        background_tasks: Request background tasks
+    """
+    result = await session.execute(
+        select(User.id, User.email, User.hashed_password).where(User.email == email.lower())
+    )
+    user = result.first()
+
+    if user is not None:
+        token = create_password_reset_token(user.id, user.hashed_password)
+        background_tasks.add_task(send_password_reset_email, user.email, token)
+
+
+async def reset_password(token: str, new_password: str, session: AsyncSession) -> None:
+    """
+    Set a new password from a reset token.
+
+    The token is checked statelessly (signature, expiry) and against a
+    fingerprint of the current password hash, so it stops working once
+    any new password is set. All the user's login sessions are revoked.
+
+    Args:
+        token: Token from the reset email
+        new_password: New plain text password
+        session: Database session
+
+    Raises:
+        HTTPException: 400 if the token is invalid, expired or already used,
+            or 429 if password hashing is saturated
+    """
+    invalid = HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Invalid or expired token",
+    )
+
+    claims = read_password_reset_token(token)
+    if claims is None:
+        raise invalid
+    user_id, fingerprint = claims
+
+    # Hash before touching the database so bcrypt never holds a pooled connection
+    try:
+        new_hash = await hash_password_async(new_password)
+    except AdmissionRejected as e:
+        raise too_many_requests(e) from None
+
+    result = await session.execute(select(User.hashed_password).where(User.id == user_id))
+    current_hash = result.scalar_one_or_none()
+    if current_hash is None or not hmac.compare_digest(
+        password_fingerprint(current_hash), fingerprint
+    ):
+        raise invalid
+
+    # Compare-and-set: a concurrent reset with the same token cannot also succeed
+    result = await session.execute(
+        update(User)
+        .where(User.id == user_id, User.hashed_password == current_hash)
+        .values(hashed_password=new_hash)
+    )
+    if result.rowcount != 1:
+        await session.rollback()
+        raise invalid
+
+    await revoke_user_sessions(user_id, session)
+    principal_cache.invalidate(user_id)
+
+
+async def create_user_token(user: User, session: AsyncSession) -> dict[str, Any]:
+    """
+    Start a login session: a short-lived access token and a rotating refresh token.
 
     Args:
         user: User instance
+        session: Database session
 
     Returns:
-        Dict with access_token and token_type
+        Dict with access_token, refresh_token, token_type and expires_in
     """
-    access_token = create_access_token(
-        data={"sub": str(user.id), "email": user.email, "is_author": user.is_author}
-    )
+    return await issue_tokens(user, session)
 
-    return {
-        "access_token": access_token,
-        "token_type": "bearer",
-    }
+
+def _verified_claims(credentials: HTTPAuthorizationCredentials) -> dict[str, Any]:
+    """
+    Decode the bearer token and check it names a user and is not revoked.
+
+    Tokens without a `sid` or `jti` claim (issued before revocation existed)
+    could never be revoked, so they are rejected; clients log in again.
+
+    Raises:
+        HTTPException: If the token is invalid, revoked or not revocable
+    """
+    payload = decode_access_token(credentials.credentials)
+
+    if (
+        payload is None
+        or not str(payload.get("sub", "")).isdigit()
+        or not (payload.get("sid") or payload.get("jti"))
+        or revocation_filter.is_revoked(payload)
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid authentication credentials",
+        )
+
+    return payload
 
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    session: AsyncSession = Depends(get_session),
-) -> User:
+    session: AsyncSession = Depends(get_read_session),
+) -> Principal:
     """
     Get current authenticated user from JWT token.
 
+    The user row is read once per PRINCIPAL_CACHE_TTL_SECONDS; warm requests
+    are served from the principal cache without touching the database.
+    Cache misses read from the replica when one is usable.
+
     Args:
         credentials: HTTP Bearer credentials
         session: Database session
 
     Returns:
-        Current User instance
+        Current user's Principal
 
     Raises:
         HTTPException: If token is invalid or user not found
     """
-    token = credentials.credentials
-    payload = decode_access_token(token)
-
-    if payload is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid authentication credentials",
-        )
+    user_id = int(_verified_claims(credentials)["sub"])
 
-    user_id = payload.get("sub")
+    principal = principal_cache.get(user_id)
+    if principal is not None:
+        return principal
 
-    if user_id is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid authentication credentials",
-        )
-
-    result = await session.execute(select(User).where(User.id == int(user_id)))
+    result = await session.execute(select(User).where(User.id == user_id))
     user = result.scalar_one_or_none()
 
     if user is None:
@@ -167,12 +385,53 @@ async def get_current_user(
             detail="User not found",
         )
 
-    return user
+    principal = Principal.from_user(user)
+    principal_cache.put(principal)
+    return principal
+
+
+async def get_token_claims(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+) -> dict[str, Any]:
+    """
+    Get the verified, unrevoked claims of the bearer token.
+
+    Args:
+        credentials: HTTP Bearer credentials
+
+    Returns:
+        Token payload
+
+    Raises:
+        HTTPException: If token is invalid or revoked
+    """
+    return _verified_claims(credentials)
+
+
+async def get_token_principal(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+) -> Principal:
+    """
+    Get the current user from the token's claims alone (no cache, no database).
+
+    For read-only routes that only need the user id, email or author flag and
+    can accept claims that are at most one token lifetime old.
+
+    Args:
+        credentials: HTTP Bearer credentials
+
+    Returns:
+        Principal built from the `sub`, `email` and `is_author` claims
+
+    Raises:
+        HTTPException: If token is invalid
+    """
+    return Principal.from_claims(_verified_claims(credentials))
 
 
 async def get_current_author(
-    current_user: User = Depends(get_current_user),
-) -> User:
+    current_user: Principal = Depends(get_current_user),
+) -> Principal:
     """
     Verify current user is the author (Denise).
 
@@ -180,7 +439,7 @@ async def get_current_author(
         current_user: Current authenticated user
 
     Returns:
-        Author User instance
+        Author Principal
 
     Raises:
         HTTPException: If user is not the author
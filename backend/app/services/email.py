@@ -0,0 +1,74 @@
+"""
+Transactional email delivery through SendGrid.
+
+Emails are sent from background tasks so request handlers never wait on
+SendGrid; delivery failures are logged, never raised to the client.
+"""
+
+import asyncio
+import logging
+
+from sendgrid import SendGridAPIClient
+from sendgrid.helpers.mail import Mail
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+async def send_email(to_email: str, subject: str, text: str) -> bool:
+    """
+    Send a plain-text email (intended to run as a background task).
+
+    Without SENDGRID_API_KEY (local development) the email is logged instead.
+
+    Args:
+        to_email: Recipient address
+        subject: Subject line
+        text: Plain-text body
+
+    Returns:
+        True if SendGrid accepted the email
+    """
+    if not settings.SENDGRID_API_KEY:
+        logger.info("SENDGRID_API_KEY not set; email to %s not sent: %s", to_email, subject)
+        return False
+
+    message = Mail(
+        from_email=settings.EMAIL_FROM,
+        to_emails=to_email,
+        subject=subject,
+        plain_text_content=text,
+    )
+
+    try:
+        # The SendGrid client is blocking
+        response = await asyncio.to_thread(
+            SendGridAPIClient(settings.SENDGRID_API_KEY).send, message
+        )
+    except Exception as e:
+        logger.warning("Unable to send email to %s: %s", to_email, e)
+        return False
+
+    return 200 <= response.status_code < 300
+
+
+async def send_password_reset_email(to_email: str, reset_token: str) -> bool:
+    """
+    Send the password reset link.
+
+    Args:
+        to_email: Recipient address
+        reset_token: Token from create_password_reset_token
+
+    Returns:
+        True if SendGrid accepted the email
+    """
+    link = f"{settings.FRONTEND_URL.rstrip('/')}/reset-password/{reset_token}"
+    minutes = settings.PASSWORD_RESET_EXPIRE_MINUTES
+    text = (
+        "Someone (hopefully you) asked to reset your password for The Incurable Humanist.\n\n"
+        f"Choose a new password here within {minutes} minutes:\n{link}\n\n"
+        "If you did not ask for this, you can ignore this email."
+    )
+    return await send_email(to_email, "Reset your password", text)
@@ -0,0 +1,191 @@
+"""
+Normalization of parsed feed entries into API articles.
+
+This is the per-entry hot path of a feed refresh, so it avoids the generic
+tools the rest of the code can afford:
+
+- Dates come from feedparser's pre-parsed `published_parsed` tuple, then a
+  strict RFC 822 parser; dateutil is only the last resort.
+- Fields are read with dict lookups instead of `hasattr` probing.
+- Articles are built with `model_construct`, since every value is already a
+  plain string and re-validating it per entry is pure overhead.
+- The summary HTML is reduced to a plain-text excerpt once, at ingest time.
+"""
+
+import html
+import logging
+import re
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+from dateutil import parser as date_parser
+
+from app.api.schemas import NewsletterArticle
+
+logger = logging.getLogger(__name__)
+
+# Default length of plain-text excerpts, in characters
+DEFAULT_EXCERPT_LENGTH = 280
+
+_SCRIPT_STYLE_RE = re.compile(r"<(script|style)\b.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+_SCRIPT_STYLE_OPEN_RE = re.compile(r"<(script|style)\b", re.IGNORECASE)
+_TAG_RE = re.compile(r"<[^>]*>")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+@dataclass
+class FeedEntry:
+    """
+    A feed entry converted to its API representation.
+
+    Attributes:
+        guid: Stable entry identifier (RSS guid / Atom id, falling back to the link)
+        article: Article as served by the API
+        published_at: Parsed publication time (naive UTC), None if unparseable
+    """
+
+    guid: str
+    article: NewsletterArticle
+    published_at: datetime | None = None
+
+
+def _strip_markup(markup: str) -> str:
+    """Remove tags, scripts and entities and collapse whitespace."""
+    text = markup
+    if "<" in text:
+        text = _TAG_RE.sub(" ", _SCRIPT_STYLE_RE.sub(" ", text))
+    if "&" in text:
+        text = html.unescape(text)
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+def html_to_excerpt(markup: str, max_length: int = DEFAULT_EXCERPT_LENGTH) -> str:
+    """
+    Reduce summary HTML to a plain-text excerpt.
+
+    Only a prefix of the markup is stripped, growing until it yields enough
+    text, so long posts cost about as much as short ones.
+
+    Args:
+        markup: Summary HTML from the feed
+        max_length: Maximum excerpt length; longer text is cut at a word
+            boundary and ends with an ellipsis
+
+    Returns:
+        Plain-text excerpt
+    """
+    # Scripts and styles could span the cut, so such markup is stripped whole
+    window = max_length * 4 if not _SCRIPT_STYLE_OPEN_RE.search(markup) else len(markup)
+    while True:
+        if window >= len(markup):
+            text = _strip_markup(markup)
+            break
+        prefix = markup[:window]
+        # Never cut inside a tag
+        if prefix.rfind("<") > prefix.rfind(">"):
+            prefix = prefix[: prefix.rfind("<")]
+        text = _strip_markup(prefix)
+        if len(text) > max_length:
+            break
+        window *= 2
+
+    if len(text) <= max_length:
+        return text
+
+    cut = text.rfind(" ", 0, max_length)
+    if cut < max_length // 2:
+        cut = max_length - 1
+    return text[:cut].rstrip(" ,;:.-") + "…"
+
+
+def normalize_published(entry: Any) -> tuple[str, datetime | None]:
+    """
+    Resolve an entry's publication date.
+
+    Args:
+        entry: feedparser entry
+
+    Returns:
+        (ISO 8601 string as served by the API, naive UTC datetime or None).
+        An unparseable date is served as the original string.
+    """
+    parsed = entry.get("published_parsed")
+    if parsed:
+        # feedparser has already parsed and normalized the date to UTC
+        published_at = datetime(*parsed[:6])
+        return published_at.replace(tzinfo=timezone.utc).isoformat(), published_at
+
+    raw = entry.get("published", "")
+    if not raw:
+        return datetime.utcnow().isoformat(), None
+
+    try:
+        value = parsedate_to_datetime(raw)
+    except (TypeError, ValueError):
+        try:
+            value = date_parser.parse(raw)
+        except (ValueError, TypeError, OverflowError):
+            # If date parsing fails, use the original string
+            return raw, None
+
+    if value.tzinfo is None:
+        return value.isoformat(), value
+    return value.isoformat(), value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def normalize_entry(entry: Any, excerpt_length: int = DEFAULT_EXCERPT_LENGTH) -> FeedEntry:
+    """
+    Convert one feedparser entry into a FeedEntry.
+
+    Args:
+        entry: feedparser entry
+        excerpt_length: Maximum length of the plain-text excerpt
+
+    Returns:
+        FeedEntry with its API article
+    """
+    published, published_at = normalize_published(entry)
+
+    author = entry.get("author")
+    if author is None:
+        authors = entry.get("authors")
+        if authors:
+            author = authors[0].get("name")
+
+    link = entry.get("link", "")
+    description = entry.get("summary", "")
+    article = NewsletterArticle.model_construct(
+        title=entry.get("title", "Untitled"),
+        link=link,
+        description=description,
+        excerpt=html_to_excerpt(description, excerpt_length),
+        published=published,
+        author=author,
+    )
+
+    return FeedEntry(guid=entry.get("id") or link, article=article, published_at=published_at)
+
+
+def normalize_entries(
+    entries: list[Any],
+    excerpt_length: int = DEFAULT_EXCERPT_LENGTH,
+) -> list[FeedEntry]:
+    """
+    Normalize feed entries, skipping (and logging) entries that cannot be converted.
+
+    Args:
+        entries: feedparser entries
+        excerpt_length: Maximum length of the plain-text excerpts
+
+    Returns:
+        FeedEntry list in feed order
+    """
+    normalized = []
+    for entry in entries:
+        try:
+            normalized.append(normalize_entry(entry, excerpt_length))
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            logger.warning("Skipping malformed feed entry %r: %s", entry.get("id"), e)
+    return normalized
@@ -0,0 +1,783 @@
+"""
+Newsletter service for fetching, merging and caching the newsletter RSS feeds.
+"""
+
+import asyncio
+import base64
+import bisect
+import heapq
+import json
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Iterable
+
+import feedparser
+import httpx
+
+from app.api.schemas import NewsletterArticle, NewsletterResponse
+from app.core.circuit_breaker import CircuitBreaker
+from app.core.config import settings
+from app.core.database import async_session_maker
+from app.core.http import get_http_client
+from app.services.feed_normalize import FeedEntry, normalize_entries
+from app.services.newsletter_archive import NewsletterArchive
+from app.services.newsletter_snapshot import SourceSnapshot, load_snapshot, save_snapshot
+
+logger = logging.getLogger(__name__)
+
+# Article fields that are always returned, whatever the requested projection
+REQUIRED_ARTICLE_FIELDS = frozenset({"title", "link"})
+
+# Bounded pool for feed parsing so XML/date work never runs on the event loop
+_parse_executor = ThreadPoolExecutor(
+    max_workers=settings.FEED_PARSE_WORKERS,
+    thread_name_prefix="feed-parse",
+)
+
+
+class FeedUnavailableError(Exception):
+    """Raised when the RSS feed cannot be fetched or yields no articles."""
+
+
+@dataclass
+class FeedFetchResult:
+    """
+    Outcome of a conditional feed fetch.
+
+    Attributes:
+        entries: Parsed feed entries, or None when upstream answered 304
+        etag: Upstream ETag validator to send on the next fetch
+        last_modified: Upstream Last-Modified validator to send on the next fetch
+        feed_title: Channel title from the feed
+        fetch_ms: Download time in milliseconds
+        parse_ms: Parse and conversion time in milliseconds (0 on 304)
+    """
+
+    entries: list[FeedEntry] | None
+    etag: str | None = None
+    last_modified: str | None = None
+    feed_title: str | None = None
+    fetch_ms: float = 0.0
+    parse_ms: float = 0.0
+
+    @property
+    def not_modified(self) -> bool:
+        """True if the upstream feed has not changed since the last fetch."""
+        return self.entries is None
+
+
+def extract_feed_entries(feed: Any) -> list[FeedEntry]:
+    """
+    Convert a parsed feed into FeedEntry objects.
+
+    Args:
+        feed: Result of feedparser.parse
+
+    Returns:
+        One FeedEntry per valid feed entry, in feed order
+
+    Raises:
+        FeedUnavailableError: If the feed has parsing errors or no valid articles
+    """
+    # Check if feed was successfully parsed
+    if feed.bozo:
+        error_msg = getattr(feed, "bozo_exception", "Unknown parsing error")
+        raise FeedUnavailableError(f"Failed to parse RSS feed: {str(error_msg)}")
+
+    # Check if feed has entries
+    if not hasattr(feed, "entries") or not feed.entries:
+        raise FeedUnavailableError("RSS feed contains no articles")
+
+    entries = normalize_entries(feed.entries, settings.NEWSLETTER_EXCERPT_LENGTH)
+    if not entries:
+        raise FeedUnavailableError("No valid articles found in RSS feed")
+
+    return entries
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def _sort_key(entry: FeedEntry) -> tuple[bool, float, str, str]:
+    """Newest first; entries without a parseable date last; link, then guid, break ties."""
+    link = entry.article.link
+    if entry.published_at is None:
+        return (True, 0.0, link, entry.guid)
+    return (False, -entry.published_at.replace(tzinfo=timezone.utc).timestamp(), link, entry.guid)
+
+
+def encode_cursor(key: tuple[bool, float, str, str]) -> str:
+    """Encode a sort key as an opaque URL-safe cursor."""
+    raw = json.dumps(list(key), separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[bool, float, str, str]:
+    """
+    Decode a cursor produced by encode_cursor (cursors issued before guids
+    were part of the key decode with an empty guid).
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        undated, neg_ts, link, *guid = json.loads(raw)
+        if len(guid) > 1:
+            raise ValueError("Too many cursor fields")
+        return (bool(undated), float(neg_ts), str(link), str(guid[0]) if guid else "")
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError("Invalid pagination cursor") from e
+
+
+class ArticleIndex:
+    """
+    Immutable, pre-sorted view of the newsletter articles held by the cache.
+
+    Articles are ordered newest first and de-duplicated by link, or by guid
+    for entries without a link (the newest copy wins). Pages are located by
+    bisecting the sort keys, so a cursor stays stable when new articles are
+    published.
+
+    Attributes:
+        entries: Feed entries in serving order
+        articles: Articles in serving order
+        total_count: Number of articles in the index
+        response: Prebuilt NewsletterResponse with every article
+    """
+
+    def __init__(self, entries: Iterable[FeedEntry], presorted: bool = False):
+        ordered = entries if presorted else sorted(entries, key=_sort_key)
+        self.entries = _unique_links(ordered)
+        self.articles = [entry.article for entry in self.entries]
+        self.total_count = len(self.articles)
+        self._keys = [_sort_key(entry) for entry in self.entries]
+        self.response = NewsletterResponse(articles=self.articles, total_count=self.total_count)
+
+    def page(
+        self,
+        limit: int | None = None,
+        cursor: str | None = None,
+        fields: set[str] | None = None,
+    ) -> NewsletterResponse:
+        """
+        Return one page of articles.
+
+        Args:
+            limit: Maximum number of articles (all remaining if None)
+            cursor: Cursor from a previous page's next_cursor
+            fields: Optional article fields to include besides title and link
+
+        Returns:
+            NewsletterResponse with total_count covering the whole index
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        if limit is None and cursor is None and fields is None:
+            return self.response
+
+        start = bisect.bisect_right(self._keys, decode_cursor(cursor)) if cursor else 0
+        end = self.total_count if limit is None else min(start + limit, self.total_count)
+        articles = self.articles[start:end]
+
+        if fields is not None:
+            keep = fields | REQUIRED_ARTICLE_FIELDS
+            articles = [
+                NewsletterArticle.model_construct(
+                    _fields_set=keep,
+                    **{name: getattr(article, name) for name in keep},
+                )
+                for article in articles
+            ]
+
+        next_cursor = encode_cursor(self._keys[end - 1]) if end < self.total_count else None
+        return NewsletterResponse(
+            articles=articles,
+            total_count=self.total_count,
+            next_cursor=next_cursor,
+        )
+
+    @classmethod
+    def merge(cls, feeds: list[list[FeedEntry]]) -> "ArticleIndex":
+        """
+        Merge several feeds into one index with a k-way heap merge.
+
+        Args:
+            feeds: Entry lists, each already in serving order
+
+        Returns:
+            ArticleIndex over all feeds, de-duplicated as in __init__
+        """
+        return cls(heapq.merge(*feeds, key=_sort_key), presorted=True)
+
+
+def _unique_links(entries: Iterable[FeedEntry]) -> list[FeedEntry]:
+    """
+    Drop entries whose link was already seen, keeping the first occurrence.
+
+    Entries without a link (podcast or guest items) are keyed by guid
+    instead; entries with neither are always kept.
+    """
+    seen = set()
+    unique = []
+    for entry in entries:
+        key = ("link", entry.article.link) if entry.article.link else ("guid", entry.guid)
+        if key[1]:
+            if key in seen:
+                continue
+            seen.add(key)
+        unique.append(entry)
+    return unique
+
+
+def build_newsletter_response(feed: Any) -> NewsletterResponse:
+    """
+    Build a NewsletterResponse from a parsed feed.
+
+    Args:
+        feed: Result of feedparser.parse
+
+    Returns:
+        NewsletterResponse with one article per valid feed entry
+
+    Raises:
+        FeedUnavailableError: If the feed has parsing errors or no valid articles
+    """
+    return ArticleIndex(extract_feed_entries(feed)).response
+
+
+def parse_feed(content: bytes, response_headers: dict[str, str] | None = None) -> Any:
+    """
+    Parse a raw RSS/Atom document (CPU-bound, blocking).
+
+    Args:
+        content: Raw feed document
+        response_headers: Upstream response headers (used for encoding detection)
+
+    Returns:
+        feedparser result
+    """
+    return feedparser.parse(content, response_headers=response_headers)
+
+
+def parse_newsletter(
+    content: bytes,
+    response_headers: dict[str, str] | None = None,
+) -> FeedFetchResult:
+    """
+    Parse raw feed bytes into feed entries (CPU-bound, blocking).
+
+    Args:
+        content: Raw feed document
+        response_headers: Upstream response headers (used for encoding detection)
+
+    Returns:
+        FeedFetchResult with entries, feed title and parse time
+    """
+    started = time.perf_counter()
+    feed = parse_feed(content, response_headers)
+    entries = extract_feed_entries(feed)
+    feed_title = feed.feed.get("title") if hasattr(feed, "feed") else None
+
+    return FeedFetchResult(
+        entries=entries,
+        feed_title=feed_title,
+        parse_ms=(time.perf_counter() - started) * 1000,
+    )
+
+
+async def download_feed(
+    url: str,
+    etag: str | None = None,
+    last_modified: str | None = None,
+) -> httpx.Response:
+    """
+    Download a feed with the shared pooled HTTP client.
+
+    Args:
+        url: RSS feed URL
+        etag: ETag from a previous fetch (sent as If-None-Match)
+        last_modified: Last-Modified from a previous fetch (sent as If-Modified-Since)
+
+    Returns:
+        Successful httpx.Response (status 304 if the validators still match)
+
+    Raises:
+        FeedUnavailableError: On network errors or 4xx/5xx responses
+    """
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+
+    try:
+        response = await get_http_client().get(
+            url,
+            headers=headers,
+            timeout=settings.FEED_FETCH_TIMEOUT_SECONDS,
+        )
+        # httpx treats 304 as an error status; for a conditional GET it is success
+        if response.status_code != 304:
+            response.raise_for_status()
+    except httpx.HTTPError as e:
+        raise FeedUnavailableError(f"Unable to fetch newsletter articles: {str(e)}") from e
+
+    return response
+
+
+async def fetch_newsletter(
+    url: str,
+    etag: str | None = None,
+    last_modified: str | None = None,
+) -> FeedFetchResult:
+    """
+    Conditionally download the feed and parse its entries off the loop.
+
+    When the upstream answers 304 Not Modified the body is neither downloaded
+    nor parsed, and the result carries no entries.
+
+    Args:
+        url: RSS feed URL
+        etag: ETag from the previous successful fetch
+        last_modified: Last-Modified from the previous successful fetch
+
+    Returns:
+        FeedFetchResult with the parsed entries and fresh validators
+    """
+    started = time.perf_counter()
+    response = await download_feed(url, etag=etag, last_modified=last_modified)
+    fetch_ms = (time.perf_counter() - started) * 1000
+
+    if response.status_code == 304:
+        return FeedFetchResult(
+            entries=None,
+            etag=etag,
+            last_modified=last_modified,
+            fetch_ms=fetch_ms,
+        )
+
+    loop = asyncio.get_running_loop()
+    result = await loop.run_in_executor(
+        _parse_executor,
+        parse_newsletter,
+        response.content,
+        dict(response.headers),
+    )
+
+    result.etag = response.headers.get("etag")
+    result.last_modified = response.headers.get("last-modified")
+    result.fetch_ms = fetch_ms
+    return result
+
+
+@dataclass
+class FeedTelemetry:
+    """
+    Timings and counters from the most recent feed refreshes.
+
+    Attributes:
+        last_success_at: UTC time of the last successful fetch (200 or 304)
+        last_attempt_at: UTC time of the last refresh attempt
+        fetch_ms: Download time of the last successful fetch
+        parse_ms: Parse time of the last fetch that returned a body
+        entry_count: Entries in the feed window at the last parse
+        feed_title: Channel title at the last parse
+        not_modified: True if the last successful fetch was a 304
+        last_error: Message of the most recent failure
+    """
+
+    last_success_at: datetime | None = None
+    last_attempt_at: datetime | None = None
+    fetch_ms: float | None = None
+    parse_ms: float | None = None
+    entry_count: int | None = None
+    feed_title: str | None = None
+    not_modified: bool = False
+    last_error: str | None = None
+
+    def record_success(self, result: FeedFetchResult) -> None:
+        """Record a successful fetch result."""
+        self.last_success_at = datetime.utcnow()
+        self.fetch_ms = result.fetch_ms
+        self.not_modified = result.not_modified
+        if not result.not_modified:
+            self.parse_ms = result.parse_ms
+            self.entry_count = len(result.entries)
+            self.feed_title = result.feed_title or self.feed_title
+
+
+def _isoformat(value: datetime | None) -> str | None:
+    """Format a naive UTC datetime for JSON output."""
+    return value.isoformat() + "Z" if value else None
+
+
+def _round_ms(value: float | None) -> float | None:
+    """Round a millisecond timing for JSON output."""
+    return round(value, 2) if value is not None else None
+
+
+class FeedSource:
+    """
+    One upstream feed aggregated by the newsletter cache.
+
+    Holds the feed's conditional-GET validators, circuit breaker, telemetry
+    and the entries from its last successful parse, so a failing or slow
+    feed keeps contributing its last known good articles.
+    """
+
+    def __init__(self, url: str, timeout: float, breaker: CircuitBreaker | None = None):
+        self.url = url
+        self.timeout = timeout
+        self.breaker = breaker or CircuitBreaker(
+            failure_threshold=settings.FEED_CIRCUIT_FAILURE_THRESHOLD,
+            reset_timeout=settings.FEED_CIRCUIT_RESET_SECONDS,
+        )
+        self.entries: list[FeedEntry] | None = None
+        self.etag: str | None = None
+        self.last_modified: str | None = None
+        self.fetched_wall: float | None = None
+        self.last_error: Exception | None = None
+        self.telemetry = FeedTelemetry()
+
+    async def refresh(self) -> bool:
+        """
+        Conditionally fetch the feed, bounded by the per-feed timeout.
+
+        Returns:
+            True if the feed returned new content
+        """
+        self.telemetry.last_attempt_at = datetime.utcnow()
+        if not self.breaker.allow_request():
+            if self.last_error is None:
+                self.last_error = FeedUnavailableError(f"RSS feed circuit is open: {self.url}")
+            return False
+
+        # Validators are only useful while we still hold the body they describe
+        has_entries = self.entries is not None
+        try:
+            result = await asyncio.wait_for(
+                fetch_newsletter(
+                    self.url,
+                    etag=self.etag if has_entries else None,
+                    last_modified=self.last_modified if has_entries else None,
+                ),
+                timeout=self.timeout,
+            )
+        except Exception as e:
+            if isinstance(e, asyncio.TimeoutError):
+                e = FeedUnavailableError(f"Timed out fetching {self.url} after {self.timeout}s")
+            elif not isinstance(e, FeedUnavailableError):
+                e = FeedUnavailableError(f"Unable to fetch newsletter articles: {str(e)}")
+            logger.warning("Newsletter feed refresh failed: %s", e)
+            self.breaker.record_failure()
+            self.last_error = e
+            self.telemetry.last_error = str(e)
+            return False
+
+        self.breaker.record_success()
+        self.etag = result.etag
+        self.last_modified = result.last_modified
+        self.fetched_wall = time.time()
+        self.last_error = None
+        self.telemetry.record_success(result)
+
+        if result.not_modified:
+            return False
+
+        self.entries = sorted(result.entries, key=_sort_key)
+        return True
+
+    def health(self) -> dict[str, Any]:
+        """Report this feed's telemetry and circuit state."""
+        telemetry = self.telemetry
+        return {
+            "feed_url": self.url,
+            "feed_title": telemetry.feed_title or "Unknown",
+            "last_success_at": _isoformat(telemetry.last_success_at),
+            "last_attempt_at": _isoformat(telemetry.last_attempt_at),
+            "fetch_ms": _round_ms(telemetry.fetch_ms),
+            "parse_ms": _round_ms(telemetry.parse_ms),
+            "entry_count": telemetry.entry_count,
+            "not_modified": telemetry.not_modified,
+            "consecutive_failures": self.breaker.consecutive_failures,
+            "circuit_state": self.breaker.state.value,
+            "last_error": str(self.last_error) if self.last_error else None,
+        }
+
+
+class NewsletterFeedCache:
+    """
+    In-process stale-while-revalidate cache for the newsletter feeds.
+
+    Requests are answered from memory. Once the cached response is older than
+    the TTL it is still served, and a single background refresh is started.
+    Only a cold cache (first request after startup) waits on the upstream feeds.
+
+    Every configured feed is fetched concurrently with its own timeout and
+    circuit breaker; the results are merged newest first with a k-way heap
+    merge and de-duplicated by link. A slow or failing feed only costs its
+    own timeout and keeps contributing its last known good entries; a cold
+    cache is published as soon as the primary (first) feed is in, and the
+    other feeds are merged in when they arrive.
+
+    With an archive configured, every refresh that returns new content is
+    ingested into the newsletter_article table and the cached response is the
+    full archive rather than just the current RSS windows.
+
+    With a snapshot path configured, every successful parse is persisted to
+    disk and can be loaded at startup (see load_snapshot).
+    """
+
+    def __init__(
+        self,
+        urls: list[str],
+        ttl_seconds: float,
+        archive: NewsletterArchive | None = None,
+        snapshot_path: str | None = None,
+        timeout: float | None = None,
+    ):
+        timeout = timeout or settings.FEED_FETCH_TIMEOUT_SECONDS
+        self.sources = [FeedSource(url, timeout) for url in urls]
+        self.ttl_seconds = ttl_seconds
+        self.archive = archive
+        self.snapshot_path = snapshot_path
+        self._archive_loaded = False
+        self._response: ArticleIndex | None = None
+        self._fetched_at: float | None = None
+        self._refresh_task: asyncio.Task | None = None
+        # Set by a refresh once a response is published (may precede its end)
+        self._published: asyncio.Event | None = None
+
+    def is_stale(self) -> bool:
+        """Return True if the cached response is missing or older than the TTL."""
+        if self._fetched_at is None:
+            return True
+        return time.monotonic() - self._fetched_at >= self.ttl_seconds
+
+    @property
+    def degraded(self) -> bool:
+        """True if a feed's last refresh failed and stale data is being served."""
+        return any(source.last_error for source in self.sources)
+
+    def age_seconds(self) -> float | None:
+        """Seconds since the oldest cached feed data was fetched upstream."""
+        fetched = [s.fetched_wall for s in self.sources if s.entries and s.fetched_wall]
+        if not fetched:
+            return None
+        return max(0.0, time.time() - min(fetched))
+
+    async def load_snapshot(self) -> bool:
+        """
+        Warm the cache from the on-disk snapshot.
+
+        Returns:
+            True if a snapshot was loaded
+        """
+        if not self.snapshot_path or self._response is not None:
+            return False
+
+        snapshots = await asyncio.to_thread(load_snapshot, self.snapshot_path)
+        by_url = {snapshot.url: snapshot for snapshot in snapshots or []}
+
+        for source in self.sources:
+            snapshot = by_url.get(source.url)
+            if snapshot is None or not snapshot.entries:
+                continue
+            source.entries = sorted((FeedEntry(*row) for row in snapshot.entries), key=_sort_key)
+            source.etag = snapshot.etag
+            source.last_modified = snapshot.last_modified
+            source.fetched_wall = snapshot.saved_at
+
+        age = self.age_seconds()
+        if age is None:
+            return False
+
+        self._response = self._merge_sources()
+        self._fetched_at = time.monotonic() - age
+        logger.info(
+            "Loaded newsletter snapshot: %d articles, %.0fs old",
+            self._response.total_count,
+            age,
+        )
+        return True
+
+    async def get(self) -> ArticleIndex:
+        """
+        Return the cached articles, refreshing them in the background when stale.
+
+        Returns:
+            Cached ArticleIndex
+
+        Raises:
+            FeedUnavailableError: If the cache is cold and every fetch fails
+        """
+        if self._response is None:
+            refresh = self._ensure_refresh()
+            # Not awaiting the refresh itself: secondary feeds may still be loading
+            published = asyncio.create_task(self._published.wait())
+            try:
+                await asyncio.wait({refresh, published}, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                published.cancel()
+            if self._response is None:
+                if refresh.done():
+                    refresh.result()
+                raise self._first_error() or FeedUnavailableError("RSS feed unavailable")
+        elif self.is_stale():
+            self._ensure_refresh()
+
+        return self._response
+
+    async def drain(self) -> None:
+        """
+        Wait for the refresh in flight, if any, including its snapshot write.
+
+        A cold get() returns once the primary feed is in, before secondary
+        feeds and the snapshot are done; await this before relying on either.
+        """
+        task = self._refresh_task
+        if task is not None and not task.done():
+            await task
+
+    def _ensure_refresh(self) -> asyncio.Task:
+        """Start a refresh unless one is already in flight (single-flight)."""
+        task = self._refresh_task
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            self._published = asyncio.Event()
+            task = asyncio.create_task(self._refresh())
+            self._refresh_task = task
+        return task
+
+    def _first_error(self) -> Exception | None:
+        """The first feed error, in configuration order."""
+        for source in self.sources:
+            if source.last_error is not None:
+                return source.last_error
+        return None
+
+    def _merge_sources(self) -> ArticleIndex:
+        """Merge the last good entries of every feed."""
+        return ArticleIndex.merge([source.entries for source in self.sources if source.entries])
+
+    async def _refresh(self) -> None:
+        """Fetch all feeds concurrently and swap the merged result into the cache."""
+        fetches = [asyncio.create_task(source.refresh()) for source in self.sources]
+        if self._response is None:
+            # Cold cache: serve as soon as the primary feed is in
+            await asyncio.wait(fetches[:1])
+            if self.sources[0].entries:
+                self._response = self._merge_sources()
+                self._published.set()
+        changed = await asyncio.gather(*fetches)
+        has_entries = any(source.entries for source in self.sources)
+
+        if all(source.last_error for source in self.sources):
+            if self._response is None and self.archive is not None:
+                # Cold cache with every feed down: serve whatever was archived
+                archived = await self._sync_archive([])
+                if archived is not None and archived.total_count:
+                    self._response = archived
+            return
+
+        self._fetched_at = time.monotonic()
+        if not has_entries:
+            return
+
+        needs_archive = self.archive is not None and not self._archive_loaded
+        if any(changed) or needs_archive or self._response is None:
+            merged = self._merge_sources()
+            archived = None
+            if self.archive is not None:
+                archived = await self._sync_archive(merged.entries)
+            self._response = archived or merged
+            if any(changed):
+                await self._save_snapshot()
+
+    def health(self) -> dict[str, Any]:
+        """
+        Report feed health from cached state (no network calls).
+
+        Top-level fields describe the primary feed; `feeds` lists every
+        aggregated feed.
+
+        Returns:
+            Dict with status, cache contents and fetch telemetry. Status is
+            "healthy", "degraded" (serving stale data after failures) or
+            "unhealthy" (nothing to serve)
+        """
+        if self._response is None:
+            status = "unhealthy"
+        elif self.degraded:
+            status = "degraded"
+        else:
+            status = "healthy"
+
+        age = self.age_seconds()
+        feeds = [source.health() for source in self.sources]
+        return {
+            **feeds[0],
+            "status": status,
+            "article_count": self._response.total_count if self._response else 0,
+            "cache_age_seconds": round(age, 1) if age is not None else None,
+            "feeds": feeds,
+        }
+
+    async def _save_snapshot(self) -> None:
+        """Persist every feed's last good entries as the last-known-good snapshot."""
+        if not self.snapshot_path:
+            return
+
+        snapshots = [
+            SourceSnapshot(
+                url=source.url,
+                saved_at=source.fetched_wall,
+                entries=[(e.guid, e.article, e.published_at) for e in source.entries],
+                etag=source.etag,
+                last_modified=source.last_modified,
+            )
+            for source in self.sources
+            if source.entries and source.fetched_wall
+        ]
+        try:
+            await asyncio.to_thread(save_snapshot, self.snapshot_path, snapshots)
+        except Exception as e:
+            logger.warning("Unable to write newsletter snapshot: %s", e)
+
+    async def _sync_archive(self, entries: list[FeedEntry]) -> ArticleIndex | None:
+        """
+        Ingest changed entries and reload the archive.
+
+        Returns:
+            ArticleIndex for the whole archive, or None if the database
+            is unavailable (callers then fall back to the feed windows)
+        """
+        if self._archive_loaded and not self.archive.changed_entries(entries):
+            # Nothing new since the archive was last loaded into the cache
+            return self._response
+
+        try:
+            async with async_session_maker() as session:
+                await self.archive.ingest(session, entries)
+                archived = await self.archive.load(session)
+        except Exception as e:
+            logger.warning("Newsletter archive unavailable, serving feed windows: %s", e)
+            self._archive_loaded = False
+            return None
+
+        self._archive_loaded = True
+        return ArticleIndex([FeedEntry(*row) for row in archived])
+
+
+# Shared cache instance used by the newsletter router
+feed_cache = NewsletterFeedCache(
+    urls=[settings.SUBSTACK_RSS_URL, *settings.NEWSLETTER_FEED_URLS],
+    ttl_seconds=settings.NEWSLETTER_CACHE_TTL_SECONDS,
+    archive=NewsletterArchive() if settings.NEWSLETTER_ARCHIVE_ENABLED else None,
+    snapshot_path=settings.NEWSLETTER_SNAPSHOT_PATH or None,
+)
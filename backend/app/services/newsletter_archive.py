@@ -0,0 +1,181 @@
+"""
+Persistent newsletter article archive backed by the newsletter_article table.
+"""
+
+import hashlib
+import json
+import logging
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.api.schemas import NewsletterArticle
+from app.models import NewsletterArticleRecord
+
+if TYPE_CHECKING:
+    from app.services.newsletter import FeedEntry
+
+logger = logging.getLogger(__name__)
+
+# Rows per INSERT statement (keeps bind parameters well under asyncpg's 32767 limit)
+INGEST_BATCH_SIZE = 1000
+
+
+def content_hash(article: NewsletterArticle) -> str:
+    """
+    Hash the served fields of an article to detect changed feed entries.
+
+    Args:
+        article: Article as served by the API
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    payload = json.dumps(article.model_dump(), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class NewsletterArchive:
+    """
+    Incremental ingestion into the newsletter_article table.
+
+    Remembers the content hash of every GUID it has written, so a refresh
+    that returns the same feed window issues no database statements at all.
+    """
+
+    def __init__(self):
+        self._known_hashes: dict[str, str] = {}
+
+    def changed_entries(self, entries: list["FeedEntry"]) -> list[tuple["FeedEntry", str]]:
+        """
+        Return entries that are new or changed since they were last ingested.
+
+        Args:
+            entries: Parsed feed entries
+
+        Returns:
+            (entry, content_hash) pairs that need to be written
+        """
+        changed = []
+        for entry in entries:
+            digest = content_hash(entry.article)
+            if self._known_hashes.get(entry.guid) != digest:
+                changed.append((entry, digest))
+        return changed
+
+    async def ingest(self, session: AsyncSession, entries: list["FeedEntry"]) -> int:
+        """
+        Upsert new or changed feed entries with batched INSERT ... ON CONFLICT.
+
+        Rows whose stored content hash already matches are left untouched by
+        the ON CONFLICT ... WHERE clause, so concurrent workers stay cheap too.
+
+        Args:
+            session: Database session
+            entries: Parsed feed entries
+
+        Returns:
+            Number of rows inserted or updated
+        """
+        changed = self.changed_entries(entries)
+        if not changed:
+            return 0
+
+        now = datetime.utcnow()
+        rows = {}
+        for entry, digest in changed:
+            # Last occurrence wins if a feed repeats a GUID
+            rows[entry.guid] = {
+                "guid": entry.guid,
+                "title": entry.article.title,
+                "link": entry.article.link,
+                "description": entry.article.description,
+                "excerpt": entry.article.excerpt,
+                "published": entry.article.published,
+                "published_at": entry.published_at,
+                "author": entry.article.author,
+                "content_hash": digest,
+                "first_seen_at": now,
+                "updated_at": now,
+            }
+
+        table = NewsletterArticleRecord.__table__
+        values = list(rows.values())
+        written = 0
+        for start in range(0, len(values), INGEST_BATCH_SIZE):
+            stmt = insert(table).values(values[start : start + INGEST_BATCH_SIZE])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[table.c.guid],
+                set_={
+                    "title": stmt.excluded.title,
+                    "link": stmt.excluded.link,
+                    "description": stmt.excluded.description,
+                    "excerpt": stmt.excluded.excerpt,
+                    "published": stmt.excluded.published,
+                    "published_at": stmt.excluded.published_at,
+                    "author": stmt.excluded.author,
+                    "content_hash": stmt.excluded.content_hash,
+                    "updated_at": stmt.excluded.updated_at,
+                },
+                where=table.c.content_hash != stmt.excluded.content_hash,
+            ).returning(table.c.id)
+
+            result = await session.execute(stmt)
+            written += len(result.fetchall())
+
+        await session.commit()
+
+        for entry, digest in changed:
+            self._known_hashes[entry.guid] = digest
+
+        logger.info("Ingested %d newsletter articles (%d candidates)", written, len(changed))
+        return written
+
+    async def load(
+        self,
+        session: AsyncSession,
+    ) -> list[tuple[str, NewsletterArticle, datetime | None]]:
+        """
+        Load the archive, newest first.
+
+        Args:
+            session: Database session
+
+        Returns:
+            (guid, article, published_at) tuples ordered by publication date
+        """
+        table = NewsletterArticleRecord.__table__
+        result = await session.execute(
+            select(
+                table.c.guid,
+                table.c.title,
+                table.c.link,
+                table.c.description,
+                table.c.excerpt,
+                table.c.published,
+                table.c.published_at,
+                table.c.author,
+                table.c.content_hash,
+            ).order_by(
+                table.c.published_at.desc().nulls_last(),
+                table.c.id.desc(),
+            )
+        )
+
+        entries = []
+        for row in result:
+            article = NewsletterArticle(
+                title=row.title,
+                link=row.link,
+                description=row.description,
+                excerpt=row.excerpt,
+                published=row.published,
+                author=row.author,
+            )
+            entries.append((row.guid, article, row.published_at))
+            self._known_hashes[row.guid] = row.content_hash
+
+        return entries
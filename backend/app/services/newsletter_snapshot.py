@@ -0,0 +1,140 @@
+"""
+Last-known-good on-disk snapshot of the newsletter feed.
+
+The snapshot is a gzipped JSON document written after every successful
+refresh and loaded at startup, so the feed cache is warm before the first
+request and can still serve articles while Substack is down.
+"""
+
+import gzip
+import json
+import logging
+import os
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+from app.api.schemas import NewsletterArticle
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 3
+
+
+@dataclass
+class SourceSnapshot:
+    """
+    State of one feed persisted to disk.
+
+    Attributes:
+        url: Feed URL
+        saved_at: Wall-clock time (epoch seconds) the data was fetched upstream
+        entries: (guid, article, published_at) tuples in serving order
+        etag: Upstream ETag for conditional GETs after a restart
+        last_modified: Upstream Last-Modified for conditional GETs after a restart
+    """
+
+    url: str
+    saved_at: float
+    entries: list[tuple[str, NewsletterArticle, datetime | None]]
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+def save_snapshot(path: str | Path, snapshots: list[SourceSnapshot]) -> None:
+    """
+    Atomically write a snapshot (blocking; call from a worker thread).
+
+    Args:
+        path: Snapshot file path
+        snapshots: State of every feed to persist
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    document = {
+        "version": SNAPSHOT_VERSION,
+        "sources": [
+            {
+                "url": snapshot.url,
+                "saved_at": snapshot.saved_at,
+                "etag": snapshot.etag,
+                "last_modified": snapshot.last_modified,
+                # Positional rows keep the file compact
+                "entries": [
+                    [
+                        guid,
+                        article.title,
+                        article.link,
+                        article.description,
+                        article.excerpt,
+                        article.published,
+                        article.author,
+                        published_at.isoformat() if published_at else None,
+                    ]
+                    for guid, article, published_at in snapshot.entries
+                ],
+            }
+            for snapshot in snapshots
+        ],
+    }
+    payload = json.dumps(document, separators=(",", ":")).encode("utf-8")
+
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with gzip.open(tmp_path, "wb", compresslevel=6) as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+
+def load_snapshot(path: str | Path) -> list[SourceSnapshot] | None:
+    """
+    Read a snapshot written by save_snapshot (blocking).
+
+    Args:
+        path: Snapshot file path
+
+    Returns:
+        SourceSnapshot per feed, or None if the file is missing, corrupt or outdated
+    """
+    path = Path(path)
+    if not path.exists():
+        return None
+
+    try:
+        with gzip.open(path, "rb") as f:
+            document = json.loads(f.read())
+
+        if document.get("version") != SNAPSHOT_VERSION:
+            logger.info("Ignoring newsletter snapshot with version %s", document.get("version"))
+            return None
+
+        return [_load_source(source) for source in document["sources"]]
+
+    except Exception as e:
+        logger.warning("Unable to load newsletter snapshot %s: %s", path, e)
+        return None
+
+
+def _load_source(source: dict) -> SourceSnapshot:
+    """Rebuild one feed's SourceSnapshot from its JSON document."""
+    entries = []
+    for row in source["entries"]:
+        guid, title, link, description, excerpt, published, author, published_at = row
+        article = NewsletterArticle(
+            title=title,
+            link=link,
+            description=description,
+            excerpt=excerpt,
+            published=published,
+            author=author,
+        )
+        parsed_at = datetime.fromisoformat(published_at) if published_at else None
+        entries.append((guid, article, parsed_at))
+
+    return SourceSnapshot(
+        url=source["url"],
+        saved_at=float(source["saved_at"]),
+        entries=entries,
+        etag=source.get("etag"),
+        last_modified=source.get("last_modified"),
+    )
@@ -0,0 +1,132 @@
+"""
+In-process cache of authenticated principals.
+
+get_current_user resolves the token subject to a Principal, an immutable
+snapshot of the user row, so warm requests skip the users SELECT entirely.
+Entries expire after PRINCIPAL_CACHE_TTL_SECONDS and are dropped explicitly
+whenever a User row is updated or deleted through the ORM.
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import event
+
+from app.core.config import settings
+from app.models import User
+
+
+@dataclass(frozen=True)
+class Principal:
+    """
+    Authenticated user as seen by request handlers.
+
+    Attributes:
+        id: User primary key
+        email: User email
+        is_author: True only for the author
+        full_name: User's full name (None when built from token claims)
+        is_active: Account active status
+        created_at: Account creation timestamp (None when built from token claims)
+    """
+
+    id: int
+    email: str
+    is_author: bool = False
+    full_name: str | None = None
+    is_active: bool = True
+    created_at: datetime | None = None
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        """Snapshot a User row."""
+        return cls(
+            id=user.id,
+            email=user.email,
+            is_author=user.is_author,
+            full_name=user.full_name,
+            is_active=user.is_active,
+            created_at=user.created_at,
+        )
+
+    @classmethod
+    def from_claims(cls, payload: dict[str, Any]) -> "Principal":
+        """
+        Build a principal from verified token claims alone.
+
+        Raises:
+            ValueError: If the claims do not identify a user
+        """
+        return cls(
+            id=int(payload["sub"]),
+            email=payload.get("email", ""),
+            is_author=bool(payload.get("is_author", False)),
+        )
+
+
+class PrincipalCache:
+    """
+    TTL + LRU cache of principals keyed by user id.
+
+    Args:
+        max_size: Maximum number of cached principals
+        ttl_seconds: Lifetime of a cached principal
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        # user id -> (principal, monotonic expiry)
+        self._entries: OrderedDict[int, tuple[Principal, float]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id: int) -> Principal | None:
+        """Cached principal for `user_id`, or None if missing or expired."""
+        cached = self._entries.get(user_id)
+        if cached is None or cached[1] <= time.monotonic():
+            if cached is not None:
+                del self._entries[user_id]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(user_id)
+        self.hits += 1
+        return cached[0]
+
+    def put(self, principal: Principal) -> None:
+        """Cache a principal, evicting the least recently used beyond max_size."""
+        if self.max_size <= 0 or self.ttl_seconds <= 0:
+            return
+
+        self._entries[principal.id] = (principal, time.monotonic() + self.ttl_seconds)
+        self._entries.move_to_end(principal.id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: int) -> None:
+        """Drop a user's cached principal (call after changing the user row)."""
+        self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+principal_cache = PrincipalCache(
+    max_size=settings.PRINCIPAL_CACHE_MAX_SIZE,
+    ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_changed_user(mapper, connection, target: User) -> None:
+    """Keep the cache coherent with ORM writes to users."""
+    if target.id is not None:
+        principal_cache.invalidate(target.id)
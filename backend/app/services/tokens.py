@@ -0,0 +1,329 @@
+"""
+Token lifecycle: short-lived access tokens, rotating refresh tokens and the
+in-process revocation filter.
+
+Access tokens carry a `jti` and the login session id (`sid`). Revoking a
+session writes its id to the revoked_token table; every instance reloads
+that table into a sorted in-memory array every REVOCATION_SYNC_SECONDS, so
+revocation is enforced without a per-request query.
+"""
+
+import asyncio
+import bisect
+import hashlib
+import logging
+import secrets
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Iterable
+
+from sqlalchemy import delete, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.core.config import settings
+from app.core.database import async_session_maker
+from app.core.security import create_access_token
+from app.models import RefreshToken, RevokedToken, User
+
+logger = logging.getLogger(__name__)
+
+# Entropy of opaque refresh tokens, in bytes
+REFRESH_TOKEN_BYTES = 32
+
+
+class InvalidRefreshTokenError(Exception):
+    """Raised when a refresh token is unknown, expired, revoked or already used."""
+
+
+class RevocationFilter:
+    """
+    Revoked token ids as a sorted array (binary search, no per-request I/O).
+
+    Ids revoked by this process are visible immediately; ids revoked by other
+    instances become visible at the next rebuild.
+    """
+
+    def __init__(self):
+        self._sorted: list[str] = []
+        # Revoked locally since the last rebuild: token id -> monotonic time
+        self._recent: dict[str, float] = {}
+        self.loaded_at: datetime | None = None
+
+    def is_revoked(self, payload: dict[str, Any]) -> bool:
+        """True if the token's `jti` or `sid` claim has been revoked."""
+        for claim in ("jti", "sid"):
+            token_id = payload.get(claim)
+            if token_id and (token_id in self._recent or self._contains(token_id)):
+                return True
+        return False
+
+    def _contains(self, token_id: str) -> bool:
+        index = bisect.bisect_left(self._sorted, token_id)
+        return index < len(self._sorted) and self._sorted[index] == token_id
+
+    def add(self, token_id: str) -> None:
+        """Record a revocation made by this process."""
+        self._recent[token_id] = time.monotonic()
+
+    def rebuild(self, token_ids: Iterable[str], started_at: float) -> None:
+        """
+        Replace the filter with the ids loaded from the database.
+
+        Args:
+            token_ids: Currently revoked ids
+            started_at: Monotonic time the load started; local revocations
+                made after it may be missing from `token_ids` and are kept
+        """
+        self._sorted = sorted(set(token_ids))
+        self._recent = {
+            token_id: added for token_id, added in self._recent.items() if added >= started_at
+        }
+        self.loaded_at = datetime.utcnow()
+
+    def __len__(self) -> int:
+        return len(self._sorted) + len(self._recent)
+
+
+revocation_filter = RevocationFilter()
+
+
+def hash_refresh_token(refresh_token: str) -> str:
+    """SHA-256 hex digest under which a refresh token is stored."""
+    return hashlib.sha256(refresh_token.encode()).hexdigest()
+
+
+async def issue_tokens(
+    user: User,
+    session: AsyncSession,
+    session_id: str | None = None,
+) -> dict[str, Any]:
+    """
+    Issue an access token and a refresh token for a user.
+
+    Args:
+        user: Authenticated user
+        session: Database session (committed)
+        session_id: Login session to continue (None starts a new one)
+
+    Returns:
+        Dict with access_token, refresh_token, token_type and expires_in
+    """
+    session_id = session_id or uuid.uuid4().hex
+    refresh_token = secrets.token_urlsafe(REFRESH_TOKEN_BYTES)
+
+    session.add(
+        RefreshToken(
+            token_hash=hash_refresh_token(refresh_token),
+            user_id=user.id,
+            session_id=session_id,
+            expires_at=datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+        )
+    )
+    await session.commit()
+
+    access_token = create_access_token(
+        data={
+            "sub": str(user.id),
+            "email": user.email,
+            "is_author": user.is_author,
+            "sid": session_id,
+        }
+    )
+
+    return {
+        "access_token": access_token,
+        "refresh_token": refresh_token,
+        "token_type": "bearer",
+        "expires_in": settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+    }
+
+
+async def rotate_refresh_token(refresh_token: str, session: AsyncSession) -> dict[str, Any]:
+    """
+    Exchange a refresh token for a new token pair (the old refresh token is spent).
+
+    Presenting a refresh token that was already rotated means it was copied:
+    the whole login session is revoked. A token whose session was revoked
+    while it was being claimed (a refresh racing logout) is refused.
+
+    Args:
+        refresh_token: Refresh token from the client
+        session: Database session
+
+    Returns:
+        New token pair, as issue_tokens
+
+    Raises:
+        InvalidRefreshTokenError: If the token cannot be used
+    """
+    token_hash = hash_refresh_token(refresh_token)
+    now = datetime.utcnow()
+    table = RefreshToken.__table__
+
+    # Claim the token atomically so concurrent refreshes cannot both rotate it
+    result = await session.execute(
+        update(table)
+        .where(
+            table.c.token_hash == token_hash,
+            table.c.revoked_at.is_(None),
+            table.c.expires_at > now,
+        )
+        .values(revoked_at=now)
+        .returning(table.c.user_id, table.c.session_id)
+    )
+    claimed = result.first()
+
+    if claimed is None:
+        result = await session.execute(
+            select(table.c.session_id, table.c.revoked_at).where(table.c.token_hash == token_hash)
+        )
+        spent = result.first()
+        if spent is not None and spent.revoked_at is not None:
+            logger.warning("Refresh token reuse detected, revoking session %s", spent.session_id)
+            await revoke_session(spent.session_id, session)
+        raise InvalidRefreshTokenError("Invalid or expired refresh token")
+
+    if await _session_revoked(claimed.session_id, session):
+        await session.commit()
+        raise InvalidRefreshTokenError("Invalid or expired refresh token")
+
+    user = await session.get(User, claimed.user_id)
+    if user is None or not user.is_active:
+        await session.commit()
+        raise InvalidRefreshTokenError("Invalid or expired refresh token")
+
+    return await issue_tokens(user, session, session_id=claimed.session_id)
+
+
+async def _session_revoked(session_id: str, session: AsyncSession) -> bool:
+    """True if a login session was revoked, by this process or (per the database) any other."""
+    if revocation_filter.is_revoked({"sid": session_id}):
+        return True
+    revoked = await session.scalar(
+        select(RevokedToken.token_id).where(RevokedToken.token_id == session_id)
+    )
+    return revoked is not None
+
+
+async def revoke_session(session_id: str, session: AsyncSession) -> None:
+    """
+    Revoke a login session: its refresh tokens and every access token carrying its `sid`.
+
+    Args:
+        session_id: Login session id
+        session: Database session (committed)
+    """
+    await _revoke(
+        session_id,
+        datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES),
+        session,
+    )
+
+
+async def revoke_access_token(payload: dict[str, Any], session: AsyncSession) -> None:
+    """
+    Revoke what a verified access token grants: its session, or for tokens
+    issued without a session, the token itself.
+
+    Args:
+        payload: Verified access token claims
+        session: Database session (committed)
+    """
+    if payload.get("sid"):
+        await revoke_session(payload["sid"], session)
+    elif payload.get("jti"):
+        await _revoke(payload["jti"], datetime.utcfromtimestamp(payload["exp"]), session)
+
+
+async def revoke_user_sessions(user_id: int, session: AsyncSession) -> None:
+    """
+    Revoke every active login session of a user (e.g. after a password reset).
+
+    Commits the session, together with any pending changes.
+
+    Args:
+        user_id: User whose sessions are revoked
+        session: Database session
+    """
+    now = datetime.utcnow()
+    result = await session.execute(
+        update(RefreshToken)
+        .where(RefreshToken.user_id == user_id, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=now)
+        .returning(RefreshToken.session_id)
+    )
+    session_ids = set(result.scalars())
+
+    if session_ids:
+        expires_at = now + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        await session.execute(
+            insert(RevokedToken.__table__)
+            .values(
+                [
+                    {"token_id": session_id, "expires_at": expires_at, "revoked_at": now}
+                    for session_id in session_ids
+                ]
+            )
+            .on_conflict_do_nothing(index_elements=["token_id"])
+        )
+    await session.commit()
+
+    for session_id in session_ids:
+        revocation_filter.add(session_id)
+
+
+async def _revoke(token_id: str, expires_at: datetime, session: AsyncSession) -> None:
+    """Revoke refresh tokens of a session id and record the id as revoked."""
+    now = datetime.utcnow()
+    await session.execute(
+        update(RefreshToken)
+        .where(RefreshToken.session_id == token_id, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=now)
+    )
+    await session.execute(
+        insert(RevokedToken.__table__)
+        .values(token_id=token_id, expires_at=expires_at, revoked_at=now)
+        .on_conflict_do_nothing(index_elements=["token_id"])
+    )
+    await session.commit()
+    revocation_filter.add(token_id)
+
+
+async def sync_revocations() -> int:
+    """
+    Reload the revocation filter from the database and prune expired rows.
+
+    Returns:
+        Number of revoked ids loaded
+    """
+    started_at = time.monotonic()
+    now = datetime.utcnow()
+
+    async with async_session_maker() as session:
+        result = await session.execute(
+            select(RevokedToken.token_id).where(RevokedToken.expires_at > now)
+        )
+        token_ids = result.scalars().all()
+        await session.execute(delete(RevokedToken).where(RevokedToken.expires_at <= now))
+        await session.commit()
+
+    revocation_filter.rebuild(token_ids, started_at)
+    return len(token_ids)
+
+
+async def run_revocation_sync(interval_seconds: float) -> None:
+    """
+    Keep the revocation filter in sync with the database (runs until cancelled).
+
+    Args:
+        interval_seconds: Delay between reloads
+    """
+    while True:
+        try:
+            await sync_revocations()
+        except Exception as e:
+            logger.warning("Unable to reload token revocations: %s", e)
+        await asyncio.sleep(interval_seconds)
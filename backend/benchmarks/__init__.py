@@ -0,0 +1,7 @@
+"""
+Benchmarks for backend hot paths.
+
+Run from the backend directory, e.g.:
+
+    python -m benchmarks.bench_newsletter
+"""
@@ -0,0 +1,94 @@
+"""
+Micro-benchmark for per-request authentication overhead.
+
+Times the token and principal work done by get_current_user for a bearer
+token reused across requests, with the verified-token cache off and on:
+
+    decode         decode_access_token (signature check + claims parsing)
+    current_user   get_current_user on a warm principal cache
+
+No database is needed: the principal cache is pre-warmed and the session
+passed to get_current_user refuses to run queries.
+
+Usage (from the backend directory):
+
+    python -m benchmarks.bench_auth
+    python -m benchmarks.bench_auth --iterations 50000 --json results.json
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from datetime import datetime
+
+from fastapi.security import HTTPAuthorizationCredentials
+
+from app.core import security
+from app.core.security import VerifiedTokenCache, create_access_token, decode_access_token
+from app.services.auth import get_current_user
+from app.services.principals import Principal, principal_cache
+
+
+class NoQuerySession:
+    """Session stand-in: the benchmark must never reach the database."""
+
+    async def execute(self, *args, **kwargs):
+        raise RuntimeError("get_current_user queried the database")
+
+
+def bench_decode(token: str, iterations: int) -> float:
+    """Mean decode_access_token time in microseconds."""
+    decode_access_token(token)
+    started = time.perf_counter()
+    for _ in range(iterations):
+        decode_access_token(token)
+    return (time.perf_counter() - started) * 1e6 / iterations
+
+
+async def bench_current_user(token: str, iterations: int) -> float:
+    """Mean get_current_user time in microseconds."""
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+    session = NoQuerySession()
+    await get_current_user(credentials, session)
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        await get_current_user(credentials, session)
+    return (time.perf_counter() - started) * 1e6 / iterations
+
+
+def run(iterations: int) -> dict[str, dict[str, float]]:
+    principal = Principal(id=1, email="reader@example.com", created_at=datetime.utcnow())
+    principal_cache.put(principal)
+    token = create_access_token({"sub": "1", "email": principal.email, "is_author": False})
+
+    results = {}
+    for label, max_size in (("uncached", 0), ("cached", 10_000)):
+        security.token_cache = VerifiedTokenCache(max_size=max_size)
+        results[label] = {
+            "decode_us": round(bench_decode(token, iterations), 2),
+            "current_user_us": round(asyncio.run(bench_current_user(token, iterations)), 2),
+        }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark per-request auth overhead")
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--json", dest="json_path", help="Also write results to this file")
+    args = parser.parse_args()
+
+    results = run(args.iterations)
+
+    print(f"{'token cache':<12} {'decode us':>10} {'current_user us':>16}")
+    for label, stats in results.items():
+        print(f"{label:<12} {stats['decode_us']:>10.2f} {stats['current_user_us']:>16.2f}")
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
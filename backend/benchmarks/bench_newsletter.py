@@ -0,0 +1,139 @@
+"""
+Per-stage benchmark for the newsletter feed pipeline.
+
+Serves synthetic feeds from the local stand-in (benchmarks.feed_server) and
+times each stage of a refresh separately:
+
+    fetch      download with the shared httpx client
+    fetch_304  conditional re-fetch answered with 304 Not Modified
+    parse      feedparser.parse of the downloaded bytes
+    normalize  feed entries -> FeedEntry / NewsletterArticle (dates, excerpts)
+    index      ArticleIndex construction (sort, de-duplicate, prebuild response)
+    serialize  JSON encoding of the full response and of a 20-item page
+
+Usage (from the backend directory):
+
+    python -m benchmarks.bench_newsletter
+    python -m benchmarks.bench_newsletter --sizes 10 100 1000 10000 --latency-ms 50
+    python -m benchmarks.bench_newsletter --malformed 0.1 --json results.json
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import statistics
+import time
+
+from app.core.http import close_http_client
+from app.services.newsletter import ArticleIndex, download_feed, extract_feed_entries, parse_feed
+from benchmarks.feed_server import FeedServer
+
+STAGES = ("fetch", "fetch_304", "parse", "normalize", "index", "serialize")
+
+
+def _summary(samples: list[float], entries: int) -> dict[str, float]:
+    """Median, p95 and per-entry cost (microseconds) for a list of ms timings."""
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))]
+    median = statistics.median(ordered)
+    return {
+        "median_ms": round(median, 3),
+        "p95_ms": round(p95, 3),
+        "per_entry_us": round(median * 1000 / max(entries, 1), 2),
+    }
+
+
+async def bench_size(server: FeedServer, entries: int, args: argparse.Namespace) -> dict:
+    """Run every stage `args.repeat` times against a feed with `entries` items."""
+    url = server.feed_url(entries, latency_ms=args.latency_ms, malformed=args.malformed)
+    timings = {stage: [] for stage in STAGES}
+    valid = 0
+
+    # Warm-up: open the pooled connection and fill the server's document cache
+    await download_feed(url)
+
+    for _ in range(args.repeat):
+        started = time.perf_counter()
+        response = await download_feed(url)
+        timings["fetch"].append((time.perf_counter() - started) * 1000)
+
+        started = time.perf_counter()
+        await download_feed(url, etag=response.headers.get("etag"))
+        timings["fetch_304"].append((time.perf_counter() - started) * 1000)
+
+        started = time.perf_counter()
+        feed = parse_feed(response.content, dict(response.headers))
+        timings["parse"].append((time.perf_counter() - started) * 1000)
+
+        # Collect feedparser's garbage now so it is not billed to the next stage
+        gc.collect()
+        started = time.perf_counter()
+        feed_entries = extract_feed_entries(feed)
+        timings["normalize"].append((time.perf_counter() - started) * 1000)
+        valid = len(feed_entries)
+
+        started = time.perf_counter()
+        index = ArticleIndex(feed_entries)
+        timings["index"].append((time.perf_counter() - started) * 1000)
+
+        started = time.perf_counter()
+        index.response.model_dump_json()
+        index.page(limit=20, fields={"published"}).model_dump_json(exclude_unset=True)
+        timings["serialize"].append((time.perf_counter() - started) * 1000)
+
+    return {
+        "entries": entries,
+        "valid_entries": valid,
+        "bytes": len(response.content),
+        "stages": {stage: _summary(samples, entries) for stage, samples in timings.items()},
+    }
+
+
+def print_report(results: list[dict]) -> None:
+    """Print results as a fixed-width table."""
+    header = f"{'entries':>8} {'stage':<10} {'median ms':>10} {'p95 ms':>10} {'us/entry':>10}"
+    print(header)
+    print("-" * len(header))
+    for result in results:
+        for stage, stats in result["stages"].items():
+            print(
+                f"{result['entries']:>8} {stage:<10} {stats['median_ms']:>10.3f} "
+                f"{stats['p95_ms']:>10.3f} {stats['per_entry_us']:>10.2f}"
+            )
+        print(
+            f"{'':>8} {'':<10} valid entries: {result['valid_entries']}, "
+            f"feed size: {result['bytes'] / 1024:.0f} KiB"
+        )
+
+
+async def run(args: argparse.Namespace) -> list[dict]:
+    results = []
+    with FeedServer() as server:
+        try:
+            for size in args.sizes:
+                results.append(await bench_size(server, size, args))
+        finally:
+            await close_http_client()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the newsletter feed pipeline")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=5, help="Samples per stage")
+    parser.add_argument("--latency-ms", type=float, default=0, help="Simulated upstream latency")
+    parser.add_argument("--malformed", type=float, default=0.0, help="Fraction of broken items")
+    parser.add_argument("--json", dest="json_path", help="Also write results to this file")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    print_report(results)
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
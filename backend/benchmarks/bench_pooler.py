@@ -0,0 +1,146 @@
+"""
+Benchmark direct Postgres connections against PgBouncer (transaction mode).
+
+Each simulated client stands for one worker process holding its own pooled
+connection and running short transactions back to back (checkout, one
+parameterized query, checkin), like a request handler. For every client
+count the benchmark reports throughput, latency percentiles and errors:
+
+    direct   DATABASE_URL with asyncpg statement caching
+    pooled   --pooled-url with DB_POOLER_MODE=transaction connect args
+
+Client counts above Postgres's max_connections fail on the direct target
+("too many clients") while PgBouncer multiplexes them onto its server pool.
+
+Usage (from the backend directory, with a reachable database):
+
+    python -m benchmarks.bench_pooler --pooled-url postgresql://app:pw@pgbouncer:6432/tih_db
+    python -m benchmarks.bench_pooler --pooled-url ... --clients 10,50,200 --json out.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from app.core.config import settings
+from app.core.database import pooler_connect_args
+from app.core.settings import normalize_database_url
+
+# Parameterized so every execution goes through a prepared statement
+QUERY = text("SELECT relname FROM pg_class WHERE oid = :oid")
+OIDS = (1247, 1249, 1255, 1259)
+
+
+def make_engine(url: str, pooler_mode: str, clients: int) -> AsyncEngine:
+    return create_async_engine(
+        url,
+        pool_size=clients,
+        max_overflow=0,
+        pool_timeout=30,
+        connect_args=pooler_connect_args(pooler_mode),
+    )
+
+
+async def client_loop(engine: AsyncEngine, deadline: float, latencies: list[float]) -> int:
+    """Run transactions until the deadline; returns the number of failures."""
+    errors = 0
+    i = 0
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        try:
+            async with engine.connect() as conn:
+                await conn.scalar(QUERY, {"oid": OIDS[i % len(OIDS)]})
+        except Exception:
+            errors += 1
+            await asyncio.sleep(0.01)
+            continue
+        latencies.append(time.perf_counter() - started)
+        i += 1
+    return errors
+
+
+async def bench(url: str, pooler_mode: str, clients: int, seconds: float) -> dict[str, float]:
+    engine = make_engine(url, pooler_mode, clients)
+    latencies: list[float] = []
+    try:
+        # Warm up: open the connections before timing
+        await asyncio.gather(
+            *(client_loop(engine, time.perf_counter() + 0.5, []) for _ in range(clients))
+        )
+        deadline = time.perf_counter() + seconds
+        errors = await asyncio.gather(
+            *(client_loop(engine, deadline, latencies) for _ in range(clients))
+        )
+    finally:
+        await engine.dispose()
+
+    latencies.sort()
+
+    def percentile(q: float) -> float:
+        if not latencies:
+            return 0.0
+        return round(latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000, 2)
+
+    return {
+        "clients": clients,
+        "requests_per_s": round(len(latencies) / seconds, 1),
+        "p50_ms": percentile(0.50),
+        "p95_ms": percentile(0.95),
+        "p99_ms": percentile(0.99),
+        "errors": sum(errors),
+    }
+
+
+async def run(
+    direct_url: str, pooled_url: str, clients: list[int], seconds: float
+) -> dict[str, list[dict[str, float]]]:
+    results: dict[str, list[dict[str, float]]] = {"direct": [], "pooled": []}
+    for count in clients:
+        results["direct"].append(await bench(direct_url, "none", count, seconds))
+        results["pooled"].append(await bench(pooled_url, "transaction", count, seconds))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark direct vs PgBouncer connections")
+    parser.add_argument("--direct-url", default=settings.DATABASE_URL)
+    parser.add_argument("--pooled-url", default=os.getenv("PGBOUNCER_URL"))
+    parser.add_argument("--clients", default="10,50,200", help="Comma-separated client counts")
+    parser.add_argument("--seconds", type=float, default=10.0, help="Duration per measurement")
+    parser.add_argument("--json", dest="json_path", help="Also write results to this file")
+    args = parser.parse_args()
+
+    if not args.pooled_url:
+        parser.error("--pooled-url (or PGBOUNCER_URL) is required")
+
+    results = asyncio.run(
+        run(
+            normalize_database_url(args.direct_url),
+            normalize_database_url(args.pooled_url),
+            [int(count) for count in args.clients.split(",")],
+            args.seconds,
+        )
+    )
+
+    print(f"{'target':<8} {'clients':>7} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} "
+          f"{'p99 ms':>8} {'errors':>7}")
+    for target, rows in results.items():
+        for row in rows:
+            print(
+                f"{target:<8} {row['clients']:>7} {row['requests_per_s']:>9.1f} "
+                f"{row['p50_ms']:>8.2f} {row['p95_ms']:>8.2f} {row['p99_ms']:>8.2f} "
+                f"{row['errors']:>7}"
+            )
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
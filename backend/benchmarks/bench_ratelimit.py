@@ -0,0 +1,120 @@
+"""
+Micro-benchmark for the rate limiting middleware's own overhead.
+
+Drives a bare ASGI endpoint directly (no server, no routing) with and
+without RateLimitMiddleware and reports the mean time per request:
+
+    baseline     endpoint only
+    anonymous    middleware, bucket keyed by client IP
+    bearer       middleware, bucket keyed by user id (warm token cache)
+
+The limit is set high enough that no request is rejected. Pass --redis-url
+to also time the shared Redis backend (one round trip per request).
+
+Usage (from the backend directory):
+
+    python -m benchmarks.bench_ratelimit
+    python -m benchmarks.bench_ratelimit --redis-url redis://localhost:6379/15 --json results.json
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from app.core.middleware import (
+    MemoryRateLimitBackend,
+    RateLimit,
+    RateLimitMiddleware,
+    RedisRateLimitBackend,
+)
+from app.core.security import create_access_token
+
+LIMIT = RateLimit(capacity=10**9, rate=10**9)
+
+
+async def endpoint(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"{}"})
+
+
+async def receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def send(message):
+    pass
+
+
+def make_scope(headers: list[tuple[bytes, bytes]]) -> dict:
+    return {
+        "type": "http",
+        "method": "GET",
+        "path": "/api/newsletter/articles",
+        "raw_path": b"/api/newsletter/articles",
+        "query_string": b"",
+        "headers": headers,
+        "client": ("203.0.113.7", 51234),
+        "server": ("test", 80),
+        "scheme": "http",
+    }
+
+
+async def bench(app, scope: dict, iterations: int) -> float:
+    """Mean time per request in microseconds."""
+    await app(scope, receive, send)
+    started = time.perf_counter()
+    for _ in range(iterations):
+        await app(scope, receive, send)
+    return (time.perf_counter() - started) * 1e6 / iterations
+
+
+async def run(iterations: int, redis_url: str | None) -> dict[str, dict[str, float]]:
+    token = create_access_token({"sub": "1", "email": "reader@example.com"})
+    scopes = {
+        "anonymous": make_scope([]),
+        "bearer": make_scope([(b"authorization", f"Bearer {token}".encode())]),
+    }
+
+    backends = {"memory": MemoryRateLimitBackend()}
+    if redis_url:
+        backends["redis"] = RedisRateLimitBackend(redis_url)
+
+    results = {"baseline": {"anonymous_us": 0.0, "bearer_us": 0.0}}
+    for label, scope in scopes.items():
+        results["baseline"][f"{label}_us"] = round(await bench(endpoint, scope, iterations), 2)
+
+    for name, backend in backends.items():
+        app = RateLimitMiddleware(endpoint, {"/api/newsletter": LIMIT}, backend)
+        # Redis round trips are orders of magnitude slower; keep the run short
+        count = iterations if name == "memory" else max(1, iterations // 20)
+        results[name] = {
+            f"{label}_us": round(await bench(app, scope, count), 2)
+            for label, scope in scopes.items()
+        }
+        if isinstance(backend, RedisRateLimitBackend):
+            await backend.close()
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark rate limiting middleware overhead")
+    parser.add_argument("--iterations", type=int, default=50000)
+    parser.add_argument("--redis-url", help="Also benchmark the Redis backend")
+    parser.add_argument("--json", dest="json_path", help="Also write results to this file")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.iterations, args.redis_url))
+
+    print(f"{'backend':<10} {'anonymous us':>13} {'bearer us':>10}")
+    for label, stats in results.items():
+        print(f"{label:<10} {stats['anonymous_us']:>13.2f} {stats['bearer_us']:>10.2f}")
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""
+Local stand-in for the Substack RSS feed.
+
+Serves synthetic RSS documents with a configurable number of entries,
+upstream latency and share of malformed entries, so the newsletter pipeline
+can be measured without touching the network.
+
+    GET /feed?entries=1000&latency_ms=200&malformed=0.05
+
+Responses carry an ETag and honour If-None-Match with a 304, like Substack.
+
+Standalone usage:
+
+    python -m benchmarks.feed_server --port 8765
+"""
+
+import argparse
+import hashlib
+import random
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+from xml.sax.saxutils import escape
+
+PARAGRAPH = (
+    "<p>Humanism is not a doctrine but a practice: paying attention, "
+    "<em>with care</em>, to the people in front of us. "
+    "<a href=\"https://example.com\">Read more</a>.</p>"
+)
+
+
+@lru_cache(maxsize=64)
+def build_feed(entries: int, malformed: float = 0.0, seed: int = 42) -> bytes:
+    """
+    Build a synthetic RSS 2.0 document.
+
+    Args:
+        entries: Number of <item> elements
+        malformed: Fraction of items with a broken date, no link or no title
+        seed: Random seed (same arguments always produce the same document)
+
+    Returns:
+        UTF-8 encoded RSS document
+    """
+    rng = random.Random(seed)
+    newest = datetime(2025, 6, 1, 9, 0, tzinfo=timezone.utc)
+
+    items = []
+    for i in range(entries):
+        published = format_datetime(newest - timedelta(hours=6 * i), usegmt=True)
+        title = f"Essay {i}: notes on an incurable humanism"
+        link = f"https://theincurablehumanist.substack.com/p/essay-{i}"
+        description = escape(PARAGRAPH * rng.randint(2, 12))
+
+        if rng.random() < malformed:
+            kind = rng.choice(("date", "link", "title"))
+            if kind == "date":
+                published = "sometime last spring"
+            elif kind == "link":
+                link = ""
+            else:
+                title = ""
+
+        parts = [
+            "<item>",
+            f"<title>{escape(title)}</title>" if title else "",
+            f"<link>{escape(link)}</link>" if link else "",
+            f'<guid isPermaLink="false">essay-{i}</guid>',
+            f"<description>{description}</description>",
+            f"<pubDate>{published}</pubDate>",
+            "<dc:creator>Denise Rodriguez Dao</dc:creator>",
+            "</item>",
+        ]
+        items.append("".join(parts))
+
+    document = (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<rss version="2.0" xmlns:dc="http://purl.org/dc/elements/1.1/">'
+        "<channel><title>The Incurable Humanist</title>"
+        "<link>https://theincurablehumanist.substack.com</link>"
+        "<description>Synthetic benchmark feed</description>"
+        f"{''.join(items)}</channel></rss>"
+    )
+    return document.encode("utf-8")
+
+
+class FeedRequestHandler(BaseHTTPRequestHandler):
+    """Serves /feed with query-string controlled size, latency and malformed share."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):  # noqa: N802 (http.server naming)
+        url = urlparse(self.path)
+        if url.path != "/feed":
+            self.send_error(404)
+            return
+
+        params = parse_qs(url.query)
+        entries = int(params.get("entries", ["20"])[0])
+        latency_ms = float(params.get("latency_ms", ["0"])[0])
+        malformed = float(params.get("malformed", ["0"])[0])
+
+        if latency_ms:
+            time.sleep(latency_ms / 1000)
+
+        body = build_feed(entries, malformed)
+        etag = '"' + hashlib.md5(body).hexdigest() + '"'
+
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/rss+xml; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        """Silence per-request logging."""
+
+
+class FeedServer:
+    """
+    Feed stand-in running on a background thread.
+
+    Usage:
+        with FeedServer() as server:
+            url = server.feed_url(entries=1000, latency_ms=50)
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self._server = ThreadingHTTPServer((host, port), FeedRequestHandler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def feed_url(self, entries: int, latency_ms: float = 0, malformed: float = 0) -> str:
+        """URL of a synthetic feed with the given shape."""
+        return (
+            f"{self.base_url}/feed?entries={entries}"
+            f"&latency_ms={latency_ms:g}&malformed={malformed:g}"
+        )
+
+    def start(self) -> "FeedServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "FeedServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve synthetic RSS feeds for benchmarks")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    server = FeedServer(args.host, args.port)
+    print(f"Serving synthetic feeds at {server.feed_url(entries=100)}")
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""
+Unit tests for the authentication service.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from fastapi import BackgroundTasks, HTTPException
+from sqlalchemy.dialects import postgresql
+
+from app.core.security import read_password_reset_token
+from app.models import User
+from app.services import auth as auth_service
+
+
+class RecordingSession:
+    """Session stand-in that records statements and returns a canned RETURNING row."""
+
+    def __init__(self, returned: User | None):
+        self.returned = returned
+        self.statements = []
+        self.commits = 0
+
+    async def scalars(self, stmt):
+        self.statements.append(str(stmt.compile(dialect=postgresql.dialect())))
+        returned = self.returned
+
+        class Result:
+            def one_or_none(self):
+                return returned
+
+        return Result()
+
+    async def commit(self):
+        self.commits += 1
+
+
+class TestRegisterUser:
+    """Tests for single-statement registration."""
+
+    @pytest.fixture(autouse=True)
+    def fast_hash(self, monkeypatch):
+        async def fake_hash(password):
+            return f"hashed:{password}"
+
+        monkeypatch.setattr(auth_service, "hash_password_async", fake_hash)
+
+    @pytest.mark.asyncio
+    async def test_single_upsert_statement(self):
+        created = User(id=1, email="reader@example.com", hashed_password="hashed:secret123")
+        session = RecordingSession(returned=created)
+
+        user = await auth_service.register_user("Reader@Example.com", "secret123", "R", session)
+
+        assert user is created
+        assert session.commits == 1
+        [statement] = session.statements
+        assert statement.startswith('INSERT INTO "user"')
+        assert "ON CONFLICT (email) DO NOTHING RETURNING" in statement
+
+    @pytest.mark.asyncio
+    async def test_conflict_maps_to_400(self):
+        session = RecordingSession(returned=None)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await auth_service.register_user("reader@example.com", "secret123", "R", session)
+
+        assert exc_info.value.status_code == 400
+        assert exc_info.value.detail == "Email already registered"
+        assert session.commits == 0
+
+    @pytest.mark.asyncio
+    async def test_short_password_rejected_before_database(self):
+        session = RecordingSession(returned=None)
+
+        with pytest.raises(HTTPException):
+            await auth_service.register_user("reader@example.com", "short", "R", session)
+
+        assert session.statements == []
+
+
+class TestPasswordReset:
+    """Tests for the password reset flow."""
+
+    @pytest.mark.asyncio
+    async def test_reset_email_is_queued(self):
+        class LookupSession:
+            async def execute(self, stmt):
+                class Result:
+                    def first(self):
+                        return SimpleNamespace(
+                            id=3, email="reader@example.com", hashed_password="h"
+                        )
+
+                return Result()
+
+        background_tasks = BackgroundTasks()
+
+        await auth_service.request_password_reset(
+            "Reader@example.com", LookupSession(), background_tasks
+        )
+
+        [task] = background_tasks.tasks
+        assert task.func is auth_service.send_password_reset_email
+        assert task.args[0] == "reader@example.com"
+        assert read_password_reset_token(task.args[1])[0] == 3
+
+    @pytest.mark.asyncio
+    async def test_invalid_token_is_rejected_before_hashing(self, monkeypatch):
+        async def fail_hash(password):
+            raise AssertionError("hashed a password for an invalid token")
+
+        monkeypatch.setattr(auth_service, "hash_password_async", fail_hash)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await auth_service.reset_password("invalid-token", "secret123", RecordingSession(None))
+
+        assert exc_info.value.status_code == 400
+
+
+class LoginSession:
+    """Session stand-in for authenticate_user that records the order of operations."""
+
+    def __init__(self, user: User | None, events: list[str]):
+        self.user = user
+        self.events = events
+
+    async def execute(self, stmt):
+        self.events.append(stmt.__visit_name__)
+        user = self.user
+
+        class Result:
+            def scalar_one_or_none(self):
+                return user
+
+        return Result()
+
+    async def commit(self):
+        self.events.append("commit")
+
+    async def rollback(self):
+        self.events.append("rollback")
+
+    def expunge(self, instance):
+        pass
+
+
+class TestAuthenticateUser:
+    """Tests for login: no pooled connection is held during password work."""
+
+    @pytest.fixture
+    def events(self, monkeypatch):
+        events = []
+
+        async def fake_verify(password, hashed_password):
+            events.append("verify")
+            return password == "secret123", None
+
+        monkeypatch.setattr(auth_service, "verify_and_update_password_async", fake_verify)
+        return events
+
+    @pytest.mark.asyncio
+    async def test_read_transaction_ends_before_verification(self, events):
+        user = User(id=1, email="reader@example.com", hashed_password="h")
+
+        authenticated = await auth_service.authenticate_user(
+            "reader@example.com", "secret123", LoginSession(user, events)
+        )
+
+        assert authenticated is user
+        assert events == ["select", "commit", "verify"]
+
+    @pytest.mark.asyncio
+    async def test_wrong_password(self, events):
+        user = User(id=1, email="reader@example.com", hashed_password="h")
+
+        authenticated = await auth_service.authenticate_user(
+            "reader@example.com", "wrong-password", LoginSession(user, events)
+        )
+
+        assert authenticated is None
+
+    @pytest.mark.asyncio
+    async def test_rehash_is_saved_through_request_session(self, monkeypatch):
+        events = []
+
+        async def fake_verify(password, hashed_password):
+            events.append("verify")
+            return True, "new-hash"
+
+        monkeypatch.setattr(auth_service, "verify_and_update_password_async", fake_verify)
+        user = User(id=1, email="reader@example.com", hashed_password="old-hash")
+
+        await auth_service.authenticate_user(
+            "reader@example.com", "secret123", LoginSession(user, events)
+        )
+
+        assert events == ["select", "commit", "verify", "update", "commit"]
+        assert user.hashed_password == "new-hash"
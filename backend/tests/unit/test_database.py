@@ -0,0 +1,128 @@
+"""
+Unit tests for connection handling in the database module.
+"""
+
+import sqlite3
+
+import httpx
+import pytest
+from fastapi import APIRouter, BackgroundTasks, Depends, FastAPI
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.exc import DBAPIError
+
+from app.core.database import (
+    RetryingSession,
+    SessionReleasingRoute,
+    get_session,
+    liveness_pre_ping,
+    pooler_connect_args,
+)
+
+
+@pytest.fixture
+def flaky_engine():
+    """SQLite engine whose next statements fail as if the server dropped the connection."""
+    engine = create_engine("sqlite://")
+    engine.drops_left = 0
+    do_execute = engine.dialect.do_execute
+
+    def drop_connection(cursor, statement, parameters, context=None):
+        if engine.drops_left:
+            engine.drops_left -= 1
+            raise sqlite3.OperationalError("server closed the connection unexpectedly")
+        do_execute(cursor, statement, parameters, context)
+
+    engine.dialect.do_execute = drop_connection
+
+    @event.listens_for(engine, "handle_error")
+    def mark_disconnect(context):
+        context.is_disconnect = True
+
+    yield engine
+    engine.dispose()
+
+
+class TestRetryingSession:
+    """Tests for the first-statement retry on dropped connections."""
+
+    def test_retries_first_statement_once(self, flaky_engine):
+        flaky_engine.drops_left = 1
+
+        with RetryingSession(bind=flaky_engine) as session:
+            assert session.scalar(text("SELECT 1")) == 1
+
+    def test_gives_up_after_second_drop(self, flaky_engine):
+        flaky_engine.drops_left = 2
+
+        with RetryingSession(bind=flaky_engine) as session:
+            with pytest.raises(DBAPIError):
+                session.execute(text("SELECT 1"))
+
+    def test_does_not_retry_inside_transaction(self, flaky_engine):
+        with RetryingSession(bind=flaky_engine) as session:
+            session.execute(text("SELECT 1"))
+            flaky_engine.drops_left = 1
+
+            with pytest.raises(DBAPIError):
+                session.scalars(text("SELECT 1")).all()
+
+
+class TestSessionReleasingRoute:
+    """Tests for releasing request sessions before the response is sent."""
+
+    @pytest.mark.asyncio
+    async def test_session_closed_before_background_tasks(self):
+        events = []
+        router = APIRouter(route_class=SessionReleasingRoute)
+
+        @router.get("/items")
+        async def items(background_tasks: BackgroundTasks, session=Depends(get_session)):
+            close = session.close
+
+            async def recording_close():
+                events.append("closed")
+                await close()
+
+            session.close = recording_close
+            background_tasks.add_task(events.append, "background task")
+            return {"ok": True}
+
+        app = FastAPI()
+        app.include_router(router)
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get("/items")
+
+        assert response.status_code == 200
+        assert events[:2] == ["closed", "background task"]
+
+
+class TestPoolerConnectArgs:
+    """Tests for PgBouncer transaction-mode compatibility."""
+
+    def test_direct_mode_keeps_driver_defaults(self):
+        assert pooler_connect_args("none") == {}
+
+    def test_transaction_mode_disables_caching_with_unique_names(self):
+        connect_args = pooler_connect_args("transaction")
+
+        assert connect_args["statement_cache_size"] == 0
+        assert connect_args["prepared_statement_cache_size"] == 0
+        name_func = connect_args["prepared_statement_name_func"]
+        assert name_func() != name_func()
+
+    def test_unknown_mode(self):
+        with pytest.raises(ValueError):
+            pooler_connect_args("statement")
+
+
+class TestLivenessPrePing:
+    """Tests for DB_LIVENESS_MODE."""
+
+    def test_modes(self):
+        assert liveness_pre_ping("pre_ping") is True
+        assert liveness_pre_ping("background") is False
+
+    def test_unknown_mode(self):
+        with pytest.raises(ValueError):
+            liveness_pre_ping("prepping")
@@ -0,0 +1,89 @@
+"""
+Unit tests for feed entry normalization.
+"""
+
+import time
+from datetime import datetime
+
+import feedparser
+
+from app.services.feed_normalize import (
+    html_to_excerpt,
+    normalize_entries,
+    normalize_entry,
+    normalize_published,
+)
+
+
+def make_entry(**fields) -> feedparser.FeedParserDict:
+    entry = {"title": "Essay", "link": "https://example.com/p/essay", "summary": "<p>Hi</p>"}
+    entry.update(fields)
+    return feedparser.FeedParserDict(entry)
+
+
+class TestNormalizePublished:
+    """Tests for publication date resolution."""
+
+    def test_uses_published_parsed(self):
+        parsed = time.strptime("2025-01-06 10:00:00", "%Y-%m-%d %H:%M:%S")
+        entry = make_entry(published="not even looked at", published_parsed=parsed)
+
+        assert normalize_published(entry) == (
+            "2025-01-06T10:00:00+00:00",
+            datetime(2025, 1, 6, 10, 0),
+        )
+
+    def test_rfc822_fallback_converts_to_utc(self):
+        entry = make_entry(published="Mon, 06 Jan 2025 12:00:00 +0200")
+
+        published, published_at = normalize_published(entry)
+
+        assert published == "2025-01-06T12:00:00+02:00"
+        assert published_at == datetime(2025, 1, 6, 10, 0)
+
+    def test_dateutil_fallback(self):
+        published, published_at = normalize_published(make_entry(published="2025-01-06 10:00"))
+
+        assert published == "2025-01-06T10:00:00"
+        assert published_at == datetime(2025, 1, 6, 10, 0)
+
+    def test_unparseable_date_is_kept_verbatim(self):
+        entry = make_entry(published="sometime last spring")
+
+        assert normalize_published(entry) == ("sometime last spring", None)
+
+
+class TestHtmlToExcerpt:
+    """Tests for summary HTML to plain-text excerpts."""
+
+    def test_strips_tags_scripts_and_entities(self):
+        markup = "<p>Care &amp; <em>attention</em></p><script>alert(1)</script>\n<p>daily</p>"
+
+        assert html_to_excerpt(markup) == "Care & attention daily"
+
+    def test_truncates_at_word_boundary(self):
+        excerpt = html_to_excerpt("<p>" + "humanism " * 50 + "</p>", max_length=40)
+
+        assert len(excerpt) <= 40
+        assert excerpt.endswith("humanism…")
+
+
+class TestNormalizeEntries:
+    """Tests for converting feedparser entries into FeedEntry objects."""
+
+    def test_builds_article(self):
+        entry = make_entry(id="essay-1", authors=[{"name": "Denise"}])
+
+        normalized = normalize_entry(entry)
+
+        assert normalized.guid == "essay-1"
+        assert normalized.article.author == "Denise"
+        assert normalized.article.description == "<p>Hi</p>"
+        assert normalized.article.excerpt == "Hi"
+
+    def test_skips_malformed_entries(self):
+        broken = make_entry(title="Broken", authors=[None])
+
+        normalized = normalize_entries([broken, make_entry(title="Fine")])
+
+        assert [entry.article.title for entry in normalized] == ["Fine"]
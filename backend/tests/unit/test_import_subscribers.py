@@ -0,0 +1,57 @@
+"""
+Unit tests for the subscriber import command.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from app.cli.import_subscribers import asyncpg_dsn, merge_statement, read_subscribers
+from app.core.security import UNUSABLE_PASSWORD, is_password_usable
+
+EXPORT = """Email,name,created_at,email_disabled,active_subscription
+Reader@Example.com,Reader One,2024-03-01T12:00:00.000Z,false,false
+reader@example.com,Duplicate,2024-05-01T12:00:00.000Z,false,false
+muted@example.com,,not a date,true,false
+not-an-email,Nobody,,false,false
+"""
+
+
+class TestReadSubscribers:
+    """Tests for streaming and de-duplicating the CSV export."""
+
+    def test_dedupes_and_normalizes(self):
+        subscribers, rows_read = read_subscribers(EXPORT.splitlines(keepends=True))
+
+        assert rows_read == 4
+        assert list(subscribers) == ["reader@example.com", "muted@example.com"]
+
+        reader = subscribers["reader@example.com"]
+        assert reader.full_name == "Reader One"
+        assert reader.subscribed_at == datetime(2024, 3, 1, 12, 0)
+        assert reader.is_active
+
+        muted = subscribers["muted@example.com"]
+        assert (muted.full_name, muted.subscribed_at, muted.is_active) == (None, None, False)
+
+    def test_requires_email_column(self):
+        with pytest.raises(ValueError):
+            read_subscribers(["name\n", "Reader\n"])
+
+
+class TestMerge:
+    """Tests for the staging merge."""
+
+    def test_merge_is_one_statement_with_placeholder_passwords(self):
+        statement = merge_statement()
+
+        assert statement.count(";") == 0
+        assert f"'{UNUSABLE_PASSWORD}'" in statement
+        assert 'INSERT INTO "user"' in statement
+        assert 'INSERT INTO "newslettersubscription"' in statement
+        assert not is_password_usable(UNUSABLE_PASSWORD)
+
+    def test_asyncpg_dsn(self):
+        dsn = asyncpg_dsn("postgresql+asyncpg://user:secret@db:5432/tih")
+
+        assert dsn == "postgresql://user:secret@db:5432/tih"
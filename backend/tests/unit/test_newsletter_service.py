@@ -0,0 +1,428 @@
+"""
+Unit tests for the newsletter feed service.
+"""
+
+import asyncio
+from datetime import datetime
+
+import feedparser
+import httpx
+import pytest
+
+from app.api.schemas import NewsletterArticle
+from app.core.circuit_breaker import CircuitBreaker, CircuitState
+from app.services import newsletter as newsletter_service
+from app.services.newsletter import (
+    ArticleIndex,
+    FeedEntry,
+    FeedFetchResult,
+    FeedUnavailableError,
+    InvalidCursorError,
+    NewsletterFeedCache,
+    build_newsletter_response,
+    extract_feed_entries,
+    fetch_newsletter,
+)
+from app.services.newsletter_archive import NewsletterArchive
+
+SAMPLE_FEED = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0">
+  <channel>
+    <title>The Incurable Humanist</title>
+    <item>
+      <title>First essay</title>
+      <link>https://example.com/p/first</link>
+      <description>&lt;p&gt;Hello&lt;/p&gt;</description>
+      <pubDate>Mon, 06 Jan 2025 10:00:00 GMT</pubDate>
+      <author>Denise</author>
+    </item>
+    <item>
+      <title>Second essay</title>
+      <link>https://example.com/p/second</link>
+      <description>World</description>
+      <pubDate>Tue, 07 Jan 2025 10:00:00 GMT</pubDate>
+    </item>
+  </channel>
+</rss>
+"""
+
+
+RSS_HEADERS = {"content-type": "application/rss+xml; charset=utf-8"}
+
+
+def make_entries(title: str) -> list[FeedEntry]:
+    article = NewsletterArticle(
+        title=title,
+        link=f"https://example.com/p/{title}",
+        description="",
+        published="2025-01-06T10:00:00+00:00",
+    )
+    return [FeedEntry(guid=article.link, article=article)]
+
+
+class TestBuildNewsletterResponse:
+    """Tests for converting a parsed feed into a NewsletterResponse."""
+
+    def test_builds_articles(self):
+        response = build_newsletter_response(feedparser.parse(SAMPLE_FEED))
+
+        assert response.total_count == 2
+        # Newest first
+        assert response.articles[0].title == "Second essay"
+        assert response.articles[1].published == "2025-01-06T10:00:00+00:00"
+
+    def test_empty_feed_raises(self):
+        empty = SAMPLE_FEED.split("<item>")[0] + "</channel></rss>"
+
+        with pytest.raises(FeedUnavailableError):
+            build_newsletter_response(feedparser.parse(empty))
+
+
+class TestArticleIndex:
+    """Tests for cursor pagination and field projection."""
+
+    def make_index(self, count: int) -> ArticleIndex:
+        entries = []
+        for day in range(1, count + 1):
+            article = NewsletterArticle(
+                title=f"Essay {day}",
+                link=f"https://example.com/p/{day}",
+                description="<p>Long HTML</p>",
+                published=f"2025-01-{day:02d}T10:00:00",
+                author="Denise",
+            )
+            entries.append(FeedEntry(article.link, article, datetime(2025, 1, day, 10)))
+        return ArticleIndex(entries)
+
+    def test_cursor_walks_every_article_once(self):
+        index = self.make_index(7)
+        seen, cursor = [], None
+
+        while True:
+            page = index.page(limit=3, cursor=cursor)
+            assert page.total_count == 7
+            seen.extend(article.title for article in page.articles)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        assert seen == [f"Essay {day}" for day in range(7, 0, -1)]
+
+    def test_cursor_is_stable_when_new_articles_arrive(self):
+        first_page = self.make_index(5).page(limit=2)
+        grown = self.make_index(6)
+
+        second_page = grown.page(limit=2, cursor=first_page.next_cursor)
+
+        assert [a.title for a in second_page.articles] == ["Essay 3", "Essay 2"]
+
+    def test_projection_drops_description(self):
+        page = self.make_index(2).page(fields={"published"})
+
+        dumped = page.model_dump(exclude_unset=True)["articles"][0]
+        assert set(dumped) == {"title", "link", "published"}
+
+    def test_invalid_cursor_raises(self):
+        with pytest.raises(InvalidCursorError):
+            self.make_index(2).page(cursor="not-a-cursor")
+
+    def test_linkless_entries_kept_by_guid(self):
+        entries = []
+        for guid in ("episode-1", "episode-2", "episode-2"):
+            article = NewsletterArticle(title=guid, link="", description="", published="")
+            entries.append(FeedEntry(guid, article))
+
+        index = ArticleIndex(entries)
+        first = index.page(limit=1)
+        second = index.page(limit=1, cursor=first.next_cursor)
+
+        assert index.total_count == 2
+        assert [a.title for a in first.articles + second.articles] == ["episode-1", "episode-2"]
+
+
+class TestFetchNewsletter:
+    """Tests for the async download + pooled parse path."""
+
+    @pytest.mark.asyncio
+    async def test_fetch_parses_downloaded_feed(self, monkeypatch):
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, content=SAMPLE_FEED, headers=RSS_HEADERS)
+        )
+        client = httpx.AsyncClient(transport=transport)
+        monkeypatch.setattr(newsletter_service, "get_http_client", lambda: client)
+
+        result = await fetch_newsletter("https://feed.test")
+
+        assert len(result.entries) == 2
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_conditional_fetch_not_modified(self, monkeypatch):
+        seen_headers = []
+
+        def handler(request):
+            seen_headers.append(request.headers)
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304)
+            headers = {**RSS_HEADERS, "etag": '"v1"', "last-modified": "Mon, 06 Jan 2025"}
+            return httpx.Response(200, content=SAMPLE_FEED, headers=headers)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(newsletter_service, "get_http_client", lambda: client)
+        cache = NewsletterFeedCache(["https://feed.test"], ttl_seconds=60)
+
+        first = await cache.get()
+        cache._fetched_at -= 120
+        await cache._refresh()
+
+        assert seen_headers[1]["if-none-match"] == '"v1"'
+        assert seen_headers[1]["if-modified-since"] == "Mon, 06 Jan 2025"
+        assert await cache.get() is first
+        assert not cache.is_stale()
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_fetch_upstream_error_raises(self, monkeypatch):
+        transport = httpx.MockTransport(lambda request: httpx.Response(502))
+        client = httpx.AsyncClient(transport=transport)
+        monkeypatch.setattr(newsletter_service, "get_http_client", lambda: client)
+
+        with pytest.raises(FeedUnavailableError):
+            await fetch_newsletter("https://feed.test")
+        await client.aclose()
+
+
+class TestNewsletterFeedCache:
+    """Tests for the stale-while-revalidate feed cache."""
+
+    @pytest.mark.asyncio
+    async def test_cold_cache_fetches_once(self, monkeypatch):
+        calls = []
+
+        async def fake_fetch(url, etag=None, last_modified=None):
+            calls.append(url)
+            await asyncio.sleep(0)
+            return FeedFetchResult(make_entries("fresh"))
+
+        monkeypatch.setattr(newsletter_service, "fetch_newsletter", fake_fetch)
+        cache = NewsletterFeedCache(["https://feed.test"], ttl_seconds=60)
+
+        results = await asyncio.gather(*(cache.get() for _ in range(10)))
+
+        assert len(calls) == 1
+        assert all(r.articles[0].title == "fresh" for r in results)
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_served_while_refreshing(self, monkeypatch):
+        responses = iter([make_entries("old"), make_entries("new")])
+
+        async def fake_fetch(url, etag=None, last_modified=None):
+            return FeedFetchResult(next(responses))
+
+        monkeypatch.setattr(newsletter_service, "fetch_newsletter", fake_fetch)
+        cache = NewsletterFeedCache(["https://feed.test"], ttl_seconds=60)
+
+        assert (await cache.get()).articles[0].title == "old"
+        cache._fetched_at -= 120
+        # Stale: the old entry is returned immediately and a refresh is started
+        assert (await cache.get()).articles[0].title == "old"
+        await cache.drain()
+        assert (await cache.get()).articles[0].title == "new"
+
+    @pytest.mark.asyncio
+    async def test_cold_cache_failure_raises(self, monkeypatch):
+        async def failing_fetch(url, etag=None, last_modified=None):
+            raise FeedUnavailableError("RSS feed contains no articles")
+
+        monkeypatch.setattr(newsletter_service, "fetch_newsletter", failing_fetch)
+        cache = NewsletterFeedCache(["https://feed.test"], ttl_seconds=60)
+
+        with pytest.raises(FeedUnavailableError):
+            await cache.get()
+
+
+class TestNewsletterArchive:
+    """Tests for incremental archive change detection."""
+
+    def test_only_new_or_changed_entries_are_written(self):
+        archive = NewsletterArchive()
+        entries = extract_feed_entries(feedparser.parse(SAMPLE_FEED))
+
+        assert len(archive.changed_entries(entries)) == 2
+
+        for entry, digest in archive.changed_entries(entries):
+            archive._known_hashes[entry.guid] = digest
+        assert archive.changed_entries(entries) == []
+
+        entries[0].article.title = "First essay (revised)"
+        assert [entry.guid for entry, _ in archive.changed_entries(entries)] == [entries[0].guid]
+
+    def test_entries_carry_guid_and_utc_timestamp(self):
+        entries = extract_feed_entries(feedparser.parse(SAMPLE_FEED))
+
+        assert entries[0].guid == "https://example.com/p/first"
+        assert entries[0].published_at == datetime(2025, 1, 6, 10, 0)
+
+
+class TestSnapshotAndCircuitBreaker:
+    """Tests for the last-known-good snapshot and the feed circuit breaker."""
+
+    @pytest.mark.asyncio
+    async def test_snapshot_round_trip_warms_cache(self, monkeypatch, tmp_path):
+        async def fake_fetch(url, etag=None, last_modified=None):
+            return FeedFetchResult(make_entries("saved"), etag='"v1"')
+
+        monkeypatch.setattr(newsletter_service, "fetch_newsletter", fake_fetch)
+        path = str(tmp_path / "snapshot.json.gz")
+        cache = NewsletterFeedCache(["https://feed.test"], 60, snapshot_path=path)
+        await cache.get()
+        await cache.drain()
+
+        restarted = NewsletterFeedCache(["https://feed.test"], 60, snapshot_path=path)
+        assert await restarted.load_snapshot()
+
+        assert restarted.sources[0].etag == '"v1"'
+        assert not restarted.is_stale()
+        assert (await restarted.get()).articles[0].title == "saved"
+
+    @pytest.mark.asyncio
+    async def test_cold_get_returns_before_secondary_feeds_and_snapshot(
+        self, monkeypatch, tmp_path
+    ):
+        secondary_done = asyncio.Event()
+
+        async def fake_fetch(url, etag=None, last_modified=None):
+            if url == "https://guest.test":
+                await secondary_done.wait()
+                return FeedFetchResult(make_entries("guest"))
+            return FeedFetchResult(make_entries("essay"))
+
+        monkeypatch.setattr(newsletter_service, "fetch_newsletter", fake_fetch)
+        path = tmp_path / "snapshot.json.gz"
+        feeds = ["https://substack.test", "https://guest.test"]
+        cache = NewsletterFeedCache(feeds, 60, snapshot_path=str(path))
+
+        await cache.get()
+        assert not path.exists()
+
+        secondary_done.set()
+        await cache.drain()
+        assert path.exists()
+        restarted = NewsletterFeedCache(feeds, 60, snapshot_path=str(path))
+        assert await restarted.load_snapshot()
+        assert sorted(a.title for a in (await restarted.get()).articles) == ["essay", "guest"]
+
+    @pytest.mark.asyncio
+    async def test_failing_feed_serves_stale_and_opens_circuit(self, monkeypatch):
+        calls = []
+
+        async def flaky_fetch(url, etag=None, last_modified=None):
+            calls.append(url)
+            if len(calls) == 1:
+                return FeedFetchResult(make_entries("good"))
+            raise FeedUnavailableError("Unable to fetch newsletter articles: timeout")
+
+        monkeypatch.setattr(newsletter_service, "fetch_newsletter", flaky_fetch)
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+        cache = NewsletterFeedCache(["https://feed.test"], 60)
+        cache.sources[0].breaker = breaker
+        await cache.get()
+
+        for _ in range(5):
+            cache._fetched_at -= 120
+            assert (await cache.get()).articles[0].title == "good"
+            await cache.drain()
+
+        assert cache.degraded
+        assert cache.age_seconds() is not None
+        assert breaker.state == CircuitState.OPEN
+        # One successful fetch plus two failures; the open circuit skipped the rest
+        assert len(calls) == 3
+
+
+class TestFeedHealth:
+    """Tests for cache-backed health reporting."""
+
+    @pytest.mark.asyncio
+    async def test_health_reports_telemetry_without_fetching(self, monkeypatch):
+        calls = []
+
+        async def fake_fetch(url, etag=None, last_modified=None):
+            calls.append(url)
+            return FeedFetchResult(
+                make_entries("one"), feed_title="TIH", fetch_ms=12.5, parse_ms=3.25
+            )
+
+        monkeypatch.setattr(newsletter_service, "fetch_newsletter", fake_fetch)
+        cache = NewsletterFeedCache(["https://feed.test"], 60)
+
+        assert cache.health()["status"] == "unhealthy"
+        await cache.get()
+        health = cache.health()
+
+        assert len(calls) == 1
+        assert health["status"] == "healthy"
+        assert health["feed_title"] == "TIH"
+        assert health["fetch_ms"] == 12.5
+        assert health["parse_ms"] == 3.25
+        assert health["entry_count"] == 1
+        assert health["circuit_state"] == "closed"
+        assert health["last_success_at"] is not None
+
+
+class TestFeedAggregation:
+    """Tests for concurrent multi-feed aggregation."""
+
+    @pytest.mark.asyncio
+    async def test_feeds_merged_by_date_and_deduplicated(self, monkeypatch):
+        def entry(link, day):
+            article = NewsletterArticle(
+                title=link,
+                link=f"https://example.com/{link}",
+                description="",
+                published=f"2025-01-{day:02d}",
+            )
+            return FeedEntry(article.link, article, datetime(2025, 1, day))
+
+        feeds = {
+            "https://substack.test": [entry("essay", 5), entry("shared", 3), entry("old", 1)],
+            "https://guest.test": [entry("guest", 4), entry("shared", 3)],
+            "https://slow.test": [entry("slow", 6)],
+        }
+
+        async def fake_fetch(url, etag=None, last_modified=None):
+            if url == "https://slow.test":
+                await asyncio.sleep(10)
+            return FeedFetchResult(list(feeds[url]))
+
+        monkeypatch.setattr(newsletter_service, "fetch_newsletter", fake_fetch)
+        cache = NewsletterFeedCache(list(feeds), ttl_seconds=60, timeout=0.05)
+
+        await cache.get()
+        await cache.drain()
+        index = await cache.get()
+
+        assert [a.title for a in index.articles] == ["essay", "guest", "shared", "old"]
+        assert cache.degraded
+        assert cache.health()["feeds"][2]["last_error"].startswith("Timed out")
+
+    @pytest.mark.asyncio
+    async def test_cold_cache_served_before_secondary_feeds(self, monkeypatch):
+        secondary_done = asyncio.Event()
+
+        async def fake_fetch(url, etag=None, last_modified=None):
+            if url == "https://guest.test":
+                await secondary_done.wait()
+                return FeedFetchResult(make_entries("guest"))
+            return FeedFetchResult(make_entries("essay"))
+
+        monkeypatch.setattr(newsletter_service, "fetch_newsletter", fake_fetch)
+        cache = NewsletterFeedCache(["https://substack.test", "https://guest.test"], 60)
+
+        index = await asyncio.wait_for(cache.get(), timeout=1)
+        assert [a.title for a in index.articles] == ["essay"]
+
+        secondary_done.set()
+        await cache.drain()
+        index = await cache.get()
+        assert sorted(a.title for a in index.articles) == ["essay", "guest"]
@@ -0,0 +1,109 @@
+"""
+Unit tests for connection pool telemetry.
+"""
+
+import sqlite3
+
+import httpx
+import pytest
+from sqlalchemy import exc
+from sqlalchemy.util import greenlet_spawn
+
+from app.core.pool_metrics import (
+    Histogram,
+    InstrumentedAsyncQueuePool,
+    PoolMonitor,
+    pool_monitor,
+    untracked_checkouts,
+)
+
+
+class TestHistogram:
+    """Tests for the fixed-bucket histogram."""
+
+    def test_observe_and_snapshot(self):
+        histogram = Histogram((1, 10, 100))
+        for value in (0.5, 5, 5, 50, 500):
+            histogram.observe(value)
+
+        snapshot = histogram.snapshot()
+
+        assert snapshot["count"] == 5
+        assert snapshot["buckets"] == {"le_1": 1, "le_10": 2, "le_100": 1, "inf": 1}
+        assert snapshot["max"] == 500
+        assert snapshot["p50"] == 10
+        # The overflow bucket reports the observed maximum
+        assert snapshot["p99"] == 500
+
+    def test_empty(self):
+        snapshot = Histogram((1, 10)).snapshot()
+
+        assert snapshot["count"] == 0
+        assert snapshot["p95"] == 0.0
+
+
+class TestPoolMonitor:
+    """Tests for checkout instrumentation on a real pool."""
+
+    @pytest.mark.asyncio
+    async def test_records_wait_hold_saturation_and_timeouts(self):
+        pool = InstrumentedAsyncQueuePool(
+            lambda: sqlite3.connect(":memory:", check_same_thread=False),
+            pool_size=1,
+            max_overflow=1,
+            timeout=0.05,
+        )
+        monitor = PoolMonitor()
+        monitor.attach(pool, capacity=2)
+        waits_before = pool_monitor.wait_ms.count
+        timeouts_before = pool_monitor.timeouts
+
+        first = await greenlet_spawn(pool.connect)
+        second = await greenlet_spawn(pool.connect)
+        with pytest.raises(exc.TimeoutError):
+            await greenlet_spawn(pool.connect)
+        first.close()
+        second.close()
+
+        metrics = monitor.metrics()
+        assert metrics["checked_out"] == 0
+        assert metrics["hold_ms"]["count"] == 2
+        assert metrics["saturation"]["count"] == 2
+        assert metrics["saturation"]["max"] == 1.0
+        assert pool_monitor.wait_ms.count - waits_before == 3
+        assert pool_monitor.timeouts - timeouts_before == 1
+        assert pool_monitor.wait_ms.max >= 50
+        pool.dispose()
+
+    @pytest.mark.asyncio
+    async def test_untracked_checkouts_are_not_recorded(self):
+        pool = InstrumentedAsyncQueuePool(
+            lambda: sqlite3.connect(":memory:", check_same_thread=False), pool_size=1
+        )
+        monitor = PoolMonitor()
+        monitor.attach(pool, capacity=1)
+        waits_before = pool_monitor.wait_ms.count
+
+        with untracked_checkouts():
+            connection = await greenlet_spawn(pool.connect)
+            connection.close()
+
+        metrics = monitor.metrics()
+        assert metrics["hold_ms"]["count"] == 0
+        assert metrics["saturation"]["count"] == 0
+        assert pool_monitor.wait_ms.count == waits_before
+        pool.dispose()
+
+
+class TestMetricsEndpoint:
+    """Tests for access to the metrics router."""
+
+    @pytest.mark.asyncio
+    async def test_requires_authentication(self):
+        from app.main import app
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get("/api/metrics/db")
+
+        assert response.status_code == 403
@@ -0,0 +1,95 @@
+"""
+Unit tests for the principal cache and token-based user resolution.
+"""
+
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+
+from app.core.security import create_access_token
+from app.models import User
+from app.services import auth as auth_service
+from app.services.principals import Principal, PrincipalCache, principal_cache
+
+
+def bearer(token: str) -> HTTPAuthorizationCredentials:
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+def make_user(user_id: int = 7) -> User:
+    return User(
+        id=user_id,
+        email="reader@example.com",
+        hashed_password="x",
+        full_name="Reader",
+        created_at=datetime(2025, 1, 1),
+    )
+
+
+class NoQuerySession:
+    """Session stand-in that fails the test if a query is issued."""
+
+    async def execute(self, *args, **kwargs):
+        raise AssertionError("unexpected database query")
+
+
+class TestPrincipalCache:
+    """Tests for TTL + LRU behaviour."""
+
+    def test_lru_eviction_and_invalidation(self):
+        cache = PrincipalCache(max_size=2, ttl_seconds=60)
+        for user_id in (1, 2):
+            cache.put(Principal(id=user_id, email=f"{user_id}@example.com"))
+
+        cache.get(1)
+        cache.put(Principal(id=3, email="3@example.com"))
+
+        assert cache.get(2) is None
+        assert cache.get(1) is not None
+
+        cache.invalidate(1)
+        assert cache.get(1) is None
+
+    def test_expired_entries_are_not_served(self, monkeypatch):
+        cache = PrincipalCache(max_size=10, ttl_seconds=60)
+        cache.put(Principal(id=1, email="1@example.com"))
+
+        monkeypatch.setattr("app.services.principals.time.monotonic", lambda: float("inf"))
+
+        assert cache.get(1) is None
+        assert len(cache) == 0
+
+
+class TestGetCurrentUser:
+    """Tests for get_current_user and get_token_principal."""
+
+    @pytest.mark.asyncio
+    async def test_warm_cache_skips_database(self):
+        principal_cache.put(Principal.from_user(make_user()))
+        token = create_access_token({"sub": "7", "email": "reader@example.com"})
+
+        try:
+            principal = await auth_service.get_current_user(bearer(token), NoQuerySession())
+        finally:
+            principal_cache.clear()
+
+        assert principal.full_name == "Reader"
+
+    @pytest.mark.asyncio
+    async def test_token_principal_uses_claims(self):
+        token = create_access_token({"sub": "7", "email": "a@example.com", "is_author": True})
+
+        principal = await auth_service.get_token_principal(bearer(token))
+
+        assert (principal.id, principal.email, principal.is_author) == (7, "a@example.com", True)
+
+    @pytest.mark.asyncio
+    async def test_invalid_subject_is_unauthorized(self):
+        token = create_access_token({"sub": "not-a-number"})
+
+        with pytest.raises(HTTPException) as exc_info:
+            await auth_service.get_current_user(bearer(token), NoQuerySession())
+
+        assert exc_info.value.status_code == 401
@@ -0,0 +1,101 @@
+"""
+Unit tests for the per-client rate limiting middleware.
+"""
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from app.core.middleware import (
+    MemoryRateLimitBackend,
+    RateLimit,
+    RateLimitMiddleware,
+    RedisRateLimitBackend,
+)
+from app.core.security import create_access_token
+
+
+def make_client(limits: dict[str, str]) -> httpx.AsyncClient:
+    app = FastAPI()
+
+    @app.get("/api/auth/me")
+    async def me():
+        return {"ok": True}
+
+    @app.get("/api/newsletter/articles")
+    async def articles():
+        return {"ok": True}
+
+    @app.get("/health")
+    async def health():
+        return {"ok": True}
+
+    app.add_middleware(
+        RateLimitMiddleware,
+        limits={prefix: RateLimit.parse(spec) for prefix, spec in limits.items()},
+        backend=MemoryRateLimitBackend(),
+    )
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+def bearer(user_id: int) -> dict[str, str]:
+    token = create_access_token({"sub": str(user_id), "email": f"u{user_id}@example.com"})
+    return {"Authorization": f"Bearer {token}"}
+
+
+class TestRateLimit:
+    """Tests for rate limit specs."""
+
+    def test_parse(self):
+        limit = RateLimit.parse("120/minute")
+
+        assert limit.capacity == 120
+        assert limit.rate == pytest.approx(2.0)
+
+    @pytest.mark.parametrize("spec", ["", "10", "10/fortnight", "0/minute", "x/second"])
+    def test_parse_rejects_malformed(self, spec):
+        with pytest.raises(ValueError):
+            RateLimit.parse(spec)
+
+
+class TestRateLimitMiddleware:
+    """Tests for per-router, per-client limiting."""
+
+    @pytest.mark.asyncio
+    async def test_limits_per_router(self):
+        async with make_client({"/api/auth": "2/minute", "/api/newsletter": "5/minute"}) as client:
+            assert (await client.get("/api/auth/me")).status_code == 200
+            assert (await client.get("/api/auth/me")).status_code == 200
+
+            rejected = await client.get("/api/auth/me")
+            assert rejected.status_code == 429
+            assert int(rejected.headers["retry-after"]) >= 1
+            assert rejected.json()["detail"]
+
+            # Other routers keep their own budget; unlisted paths are not limited
+            assert (await client.get("/api/newsletter/articles")).status_code == 200
+            for _ in range(5):
+                assert (await client.get("/health")).status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_authenticated_clients_have_own_buckets(self):
+        async with make_client({"/api/auth": "1/minute"}) as client:
+            assert (await client.get("/api/auth/me", headers=bearer(1))).status_code == 200
+            assert (await client.get("/api/auth/me", headers=bearer(1))).status_code == 429
+
+            # Same IP, different user; and anonymous requests use the IP bucket
+            assert (await client.get("/api/auth/me", headers=bearer(2))).status_code == 200
+            assert (await client.get("/api/auth/me")).status_code == 200
+            assert (await client.get("/api/auth/me")).status_code == 429
+
+
+class TestRedisRateLimitBackend:
+    """Tests for the shared backend's failure mode."""
+
+    @pytest.mark.asyncio
+    async def test_fails_open_when_unreachable(self):
+        backend = RedisRateLimitBackend("redis://127.0.0.1:1/0")
+        try:
+            assert await backend.consume("ip:1.2.3.4", RateLimit.parse("1/minute")) == 0.0
+        finally:
+            await backend.close()
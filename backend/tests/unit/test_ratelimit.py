@@ -0,0 +1,97 @@
+"""
+Unit tests for admission control primitives.
+"""
+
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.ratelimit import AdmissionRejected, ConcurrencyLimiter, TokenBuckets
+from app.services import auth as auth_service
+
+
+class TestTokenBuckets:
+    """Tests for per-key token buckets."""
+
+    def test_burst_then_reject(self):
+        buckets = TokenBuckets(rate=1.0, capacity=2)
+
+        assert buckets.consume("a") == 0.0
+        assert buckets.consume("a") == 0.0
+        assert buckets.consume("a") == pytest.approx(1.0, abs=0.05)
+        # Other keys have their own budget
+        assert buckets.consume("b") == 0.0
+
+    def test_evicts_least_recently_used(self):
+        buckets = TokenBuckets(rate=1.0, capacity=1, max_keys=2)
+
+        for key in ("a", "b", "c"):
+            buckets.consume(key)
+
+        assert len(buckets) == 2
+        # "a" was evicted, so it starts with a full bucket again
+        assert buckets.consume("a") == 0.0
+
+
+class TestConcurrencyLimiter:
+    """Tests for the bounded-queue concurrency limiter."""
+
+    @pytest.mark.asyncio
+    async def test_queues_then_sheds(self):
+        limiter = ConcurrencyLimiter(max_concurrent=1, max_queue=1, queue_timeout=1.0)
+        release = asyncio.Event()
+
+        async def hold():
+            async with limiter.slot():
+                await release.wait()
+
+        first = asyncio.create_task(hold())
+        second = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+
+        assert limiter.in_flight == 1
+        assert limiter.queue_depth == 1
+
+        with pytest.raises(AdmissionRejected):
+            async with limiter.slot():
+                pass
+
+        release.set()
+        await asyncio.gather(first, second)
+
+        metrics = limiter.metrics()
+        assert metrics["admitted"] == 2
+        assert metrics["rejected"] == 1
+        assert metrics["in_flight"] == 0
+        assert metrics["peak_queue_depth"] == 1
+
+    @pytest.mark.asyncio
+    async def test_queue_timeout(self):
+        limiter = ConcurrencyLimiter(max_concurrent=1, max_queue=4, queue_timeout=0.01)
+
+        async with limiter.slot():
+            with pytest.raises(AdmissionRejected):
+                async with limiter.slot():
+                    pass
+
+        assert limiter.timed_out == 1
+        assert limiter.queue_depth == 0
+        # The slot is free again
+        async with limiter.slot():
+            assert limiter.in_flight == 1
+
+
+class TestAuthRateLimits:
+    """Tests for per-email and per-IP login budgets."""
+
+    def test_email_budget_returns_429(self, monkeypatch):
+        monkeypatch.setattr(auth_service, "auth_ip_buckets", TokenBuckets(rate=1.0, capacity=100))
+        monkeypatch.setattr(auth_service, "login_email_buckets", TokenBuckets(rate=0.1, capacity=1))
+
+        auth_service.check_auth_rate("10.0.0.1", email="Reader@example.com")
+        with pytest.raises(HTTPException) as exc_info:
+            auth_service.check_auth_rate("10.0.0.2", email="reader@example.com")
+
+        assert exc_info.value.status_code == 429
+        assert exc_info.value.headers["Retry-After"] == "10"
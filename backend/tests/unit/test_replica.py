@@ -0,0 +1,174 @@
+"""
+Unit tests for read replica routing.
+"""
+
+from contextlib import asynccontextmanager
+
+import pytest
+from sqlalchemy import column, create_engine, insert, table, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from starlette.requests import Request
+
+from app.core import database
+from app.core.database import RetryingSession, get_read_session
+from app.core.replica import (
+    RecentWriters,
+    ReplicaHealth,
+    ReplicaNotStreamingError,
+    check_replica_lag,
+)
+from app.core.security import create_access_token
+
+
+def make_request(user_id: int) -> Request:
+    token = create_access_token({"sub": str(user_id), "email": f"u{user_id}@example.com"})
+    return Request(
+        {
+            "type": "http",
+            "headers": [(b"authorization", f"Bearer {token}".encode())],
+            "client": ("203.0.113.7", 1234),
+        }
+    )
+
+
+class TestReplicaHealth:
+    """Tests for lag-based replica usability."""
+
+    def test_usable_only_when_fresh_and_measured(self):
+        health = ReplicaHealth(max_lag_seconds=5, stale_after_seconds=30)
+        assert not health.usable
+
+        health.record(1.5)
+        assert health.usable
+
+        health.record(12.0)
+        assert not health.usable
+
+        health.record_failure(OSError("connection refused"))
+        assert not health.usable
+        assert health.metrics()["last_error"] == "connection refused"
+
+    def test_stale_measurement_is_not_trusted(self):
+        health = ReplicaHealth(max_lag_seconds=5, stale_after_seconds=0)
+        health.record(0.0)
+
+        assert not health.usable
+
+
+class TestCheckReplicaLag:
+    """Tests for recording lag measurements."""
+
+    def make_engine(self, lag):
+        class Connection:
+            async def scalar(self, stmt):
+                return lag
+
+        class Engine:
+            @asynccontextmanager
+            async def connect(self):
+                yield Connection()
+
+        return Engine()
+
+    @pytest.mark.asyncio
+    async def test_records_lag(self):
+        health = ReplicaHealth(max_lag_seconds=5, stale_after_seconds=30)
+
+        await check_replica_lag(self.make_engine(0.5), health)
+
+        assert health.usable
+        assert health.lag_seconds == 0.5
+
+    @pytest.mark.asyncio
+    async def test_receiver_not_streaming_is_unusable(self):
+        health = ReplicaHealth(max_lag_seconds=5, stale_after_seconds=30)
+        health.record(0.0)
+
+        with pytest.raises(ReplicaNotStreamingError):
+            await check_replica_lag(self.make_engine(None), health)
+
+        assert not health.usable
+        assert health.metrics()["last_error"] == "WAL receiver is not streaming"
+
+
+class TestRecentWriters:
+    """Tests for the read-your-writes window."""
+
+    def test_window(self):
+        writers = RecentWriters(window_seconds=60)
+        writers.mark("user:1")
+
+        assert writers.is_recent("user:1")
+        assert not writers.is_recent("user:2")
+
+    def test_disabled(self):
+        writers = RecentWriters(window_seconds=0)
+        writers.mark("user:1")
+
+        assert not writers.is_recent("user:1")
+
+
+class TestWriteTracking:
+    """Tests for marking clients that committed writes."""
+
+    @pytest.fixture
+    def sqlite_session(self, monkeypatch):
+        monkeypatch.setattr(database, "recent_writers", RecentWriters(window_seconds=60))
+        engine = create_engine("sqlite://")
+        with RetryingSession(bind=engine) as session:
+            session.execute(text("CREATE TABLE t (x integer)"))
+            session.commit()
+            session.info["client_key"] = "user:1"
+            yield session
+        engine.dispose()
+
+    def test_commit_with_writes_marks_client(self, sqlite_session):
+        sqlite_session.execute(text("SELECT 1"))
+        sqlite_session.commit()
+        assert not database.recent_writers.is_recent("user:1")
+
+        sqlite_session.execute(insert(table("t", column("x"))).values(x=1))
+        sqlite_session.commit()
+        assert database.recent_writers.is_recent("user:1")
+
+
+class TestGetReadSession:
+    """Tests for routing reads to the replica or the primary."""
+
+    @pytest.fixture
+    def replica(self, monkeypatch):
+        replica_engine = create_async_engine("postgresql+asyncpg://replica/tih_db")
+        health = ReplicaHealth(max_lag_seconds=5, stale_after_seconds=30)
+        writers = RecentWriters(window_seconds=60)
+        monkeypatch.setattr(
+            database,
+            "replica_session_maker",
+            sessionmaker(replica_engine, class_=AsyncSession),
+        )
+        monkeypatch.setattr(database, "replica_health", health)
+        monkeypatch.setattr(database, "recent_writers", writers)
+        yield replica_engine, health, writers
+
+    async def _bind(self, request: Request):
+        dependency = get_read_session(request)
+        session = await dependency.__anext__()
+        await dependency.aclose()
+        return session.bind
+
+    @pytest.mark.asyncio
+    async def test_routes_by_lag_and_recent_writes(self, replica):
+        replica_engine, health, writers = replica
+
+        # No lag measurement yet
+        assert await self._bind(make_request(1)) is database.engine
+
+        health.record(0.2)
+        assert await self._bind(make_request(1)) is replica_engine
+
+        writers.mark("user:1")
+        assert await self._bind(make_request(1)) is database.engine
+        assert await self._bind(make_request(2)) is replica_engine
+
+        health.record(60.0)
+        assert await self._bind(make_request(2)) is database.engine
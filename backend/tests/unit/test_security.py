@@ -0,0 +1,147 @@
+"""
+Unit tests for password hashing and token helpers.
+"""
+
+import asyncio
+import time
+from datetime import timedelta
+
+import pytest
+
+from app.core.security import (
+    BCRYPT_MAX_ROUNDS,
+    BCRYPT_MIN_ROUNDS,
+    VerifiedTokenCache,
+    calibrate_bcrypt_rounds,
+    create_access_token,
+    create_password_reset_token,
+    decode_access_token,
+    hash_password_async,
+    password_fingerprint,
+    pwd_context,
+    read_password_reset_token,
+    set_bcrypt_rounds,
+    token_cache,
+    verify_and_update_password_async,
+    verify_password,
+    verify_password_async,
+)
+
+
+class TestPasswordHashingPool:
+    """Tests for the async bcrypt API."""
+
+    @pytest.mark.asyncio
+    async def test_hash_and_verify_roundtrip(self):
+        hashed = await hash_password_async("correct horse")
+
+        assert verify_password("correct horse", hashed)
+        assert await verify_password_async("correct horse", hashed)
+        assert not await verify_password_async("wrong horse", hashed)
+
+    @pytest.mark.asyncio
+    async def test_event_loop_not_blocked(self):
+        hashed = await hash_password_async("correct horse")
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.005)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        started = time.perf_counter()
+        await asyncio.gather(*(verify_password_async("correct horse", hashed) for _ in range(3)))
+        elapsed = time.perf_counter() - started
+        task.cancel()
+
+        # The loop kept ticking while bcrypt ran on the pool
+        assert ticks >= elapsed / 0.005 / 4
+
+
+class TestBcryptCost:
+    """Tests for bcrypt cost calibration and rehash detection."""
+
+    def test_calibration_is_clamped(self):
+        low = calibrate_bcrypt_rounds(target_ms=1, samples=1)
+        high = calibrate_bcrypt_rounds(target_ms=10_000_000, samples=1)
+
+        assert low == BCRYPT_MIN_ROUNDS
+        assert high == BCRYPT_MAX_ROUNDS
+
+    @pytest.mark.asyncio
+    async def test_rehash_when_cost_differs(self):
+        legacy = pwd_context.handler("bcrypt").using(rounds=11).hash("correct horse")
+        saved_policy = pwd_context.to_dict()
+        try:
+            set_bcrypt_rounds(10)
+
+            verified, new_hash = await verify_and_update_password_async("correct horse", legacy)
+            assert verified
+            assert new_hash.startswith("$2b$10$")
+
+            # A hash at the current cost is left alone
+            assert await verify_and_update_password_async("correct horse", new_hash) == (
+                True,
+                None,
+            )
+            # A wrong password never produces a new hash
+            assert await verify_and_update_password_async("wrong horse", legacy) == (False, None)
+        finally:
+            pwd_context.load(saved_policy)
+
+
+class TestVerifiedTokenCache:
+    """Tests for the verified-token cache."""
+
+    def test_serves_copy_until_expiry(self, monkeypatch):
+        cache = VerifiedTokenCache(max_size=10)
+        cache.put("token", {"sub": "1", "exp": 1_000})
+
+        monkeypatch.setattr("app.core.security.time.time", lambda: 999.0)
+        payload = cache.get("token")
+        payload["sub"] = "2"
+        assert cache.get("token") == {"sub": "1", "exp": 1_000}
+
+        monkeypatch.setattr("app.core.security.time.time", lambda: 1_000.0)
+        assert cache.get("token") is None
+        assert len(cache) == 0
+
+    def test_tokens_without_exp_are_not_cached(self):
+        cache = VerifiedTokenCache(max_size=10)
+        cache.put("token", {"sub": "1"})
+
+        assert len(cache) == 0
+
+    def test_decode_uses_cache_and_rejects_bad_tokens(self):
+        token = create_access_token({"sub": "1"})
+        token_cache.clear()
+
+        assert decode_access_token(token)["sub"] == "1"
+        assert token_cache.get(token) is not None
+        assert decode_access_token(token + "x") is None
+
+
+class TestPasswordResetTokens:
+    """Tests for stateless password reset tokens."""
+
+    def test_roundtrip(self):
+        token = create_password_reset_token(42, "$2b$12$current")
+
+        assert read_password_reset_token(token) == (42, password_fingerprint("$2b$12$current"))
+
+    def test_fingerprint_changes_with_password(self):
+        assert password_fingerprint("$2b$12$old") != password_fingerprint("$2b$12$new")
+
+    def test_expired_forged_and_malformed_tokens_are_rejected(self):
+        expired = create_password_reset_token(42, "hash", expires_delta=timedelta(seconds=-1))
+        user_id, expires_at, fingerprint, signature = create_password_reset_token(
+            42, "hash"
+        ).split(".")
+        forged = f"1.{expires_at}.{fingerprint}.{signature}"
+
+        assert read_password_reset_token(expired) is None
+        assert read_password_reset_token(forged) is None
+        assert read_password_reset_token("invalid-token") is None
+        assert read_password_reset_token("1.2.3.ünïcode") is None
@@ -0,0 +1,209 @@
+"""
+Unit tests for token revocation.
+"""
+
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from jose import jwt
+
+from app.core.config import settings
+from app.core.security import create_access_token, decode_access_token
+from app.models import User
+from app.services import auth as auth_service
+from app.services.tokens import (
+    InvalidRefreshTokenError,
+    RevocationFilter,
+    hash_refresh_token,
+    revocation_filter,
+    rotate_refresh_token,
+)
+
+
+class TestRevocationFilter:
+    """Tests for the in-memory revocation filter."""
+
+    def test_lookup_by_jti_or_sid(self):
+        revoked = RevocationFilter()
+        revoked.rebuild(["session-b", "token-a"], started_at=time.monotonic())
+
+        assert revoked.is_revoked({"jti": "token-a"})
+        assert revoked.is_revoked({"jti": "other", "sid": "session-b"})
+        assert not revoked.is_revoked({"jti": "other", "sid": "session-c"})
+        assert not revoked.is_revoked({})
+
+    def test_rebuild_keeps_only_newer_local_revocations(self):
+        revoked = RevocationFilter()
+        revoked.add("before-load")
+        started_at = time.monotonic()
+        revoked.add("during-load")
+
+        revoked.rebuild([], started_at)
+
+        assert not revoked.is_revoked({"sid": "before-load"})
+        assert revoked.is_revoked({"sid": "during-load"})
+
+
+class TestAccessTokenRevocation:
+    """Tests for revocation enforcement in the auth dependencies."""
+
+    def test_access_tokens_carry_unique_ids(self):
+        first = decode_access_token(create_access_token({"sub": "1"}))
+        second = decode_access_token(create_access_token({"sub": "1"}))
+
+        assert first["jti"] != second["jti"]
+
+    @pytest.mark.asyncio
+    async def test_revoked_session_is_rejected(self):
+        token = create_access_token({"sub": "1", "sid": "revoked-session"})
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+        assert (await auth_service.get_token_claims(credentials))["sid"] == "revoked-session"
+
+        revocation_filter.add("revoked-session")
+        try:
+            with pytest.raises(HTTPException) as exc_info:
+                await auth_service.get_token_claims(credentials)
+        finally:
+            revocation_filter.rebuild([], started_at=time.monotonic())
+
+        assert exc_info.value.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_token_without_sid_or_jti_is_rejected(self):
+        # Minted like the tokens issued before revocation: no sid, no jti, 7-day expiry
+        expires = datetime.utcnow() + timedelta(days=7)
+        token = jwt.encode(
+            {"sub": "1", "email": "reader@example.com", "exp": expires},
+            settings.SECRET_KEY,
+            algorithm=settings.ALGORITHM,
+        )
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+        assert decode_access_token(token)["sub"] == "1"
+        with pytest.raises(HTTPException) as exc_info:
+            await auth_service.get_token_claims(credentials)
+
+        assert exc_info.value.status_code == 401
+
+    def test_refresh_tokens_are_stored_hashed(self):
+        assert len(hash_refresh_token("opaque")) == 64
+        assert hash_refresh_token("opaque") != "opaque"
+
+
+class RotationSession:
+    """Session stand-in for rotate_refresh_token; execute() results are returned in order."""
+
+    def __init__(self, rows, user=None, revoked_token_id=None):
+        self.rows = list(rows)
+        self.user = user
+        self.revoked_token_id = revoked_token_id
+        self.statements = []
+        self.added = []
+        self.commits = 0
+
+    async def execute(self, stmt):
+        self.statements.append(stmt.__visit_name__)
+        row = self.rows.pop(0) if self.rows else None
+
+        class Result:
+            def first(self):
+                return row
+
+        return Result()
+
+    async def scalar(self, stmt):
+        self.statements.append(stmt.__visit_name__)
+        return self.revoked_token_id
+
+    async def get(self, model, ident):
+        return self.user
+
+    def add(self, instance):
+        self.added.append(instance)
+
+    async def commit(self):
+        self.commits += 1
+
+
+class TestRotateRefreshToken:
+    """Tests for refresh token rotation and reuse detection."""
+
+    @pytest.fixture(autouse=True)
+    def clear_revocations(self):
+        yield
+        revocation_filter.rebuild([], started_at=time.monotonic())
+
+    def make_user(self, is_active=True):
+        return User(id=1, email="reader@example.com", hashed_password="h", is_active=is_active)
+
+    @pytest.mark.asyncio
+    async def test_rotation_continues_the_login_session(self):
+        claimed = SimpleNamespace(user_id=1, session_id="session-a")
+        session = RotationSession([claimed], user=self.make_user())
+
+        tokens = await rotate_refresh_token("old-token", session)
+
+        [stored] = session.added
+        assert stored.session_id == "session-a"
+        assert stored.token_hash == hash_refresh_token(tokens["refresh_token"])
+        assert tokens["refresh_token"] != "old-token"
+        assert decode_access_token(tokens["access_token"])["sid"] == "session-a"
+        assert session.commits == 1
+
+    @pytest.mark.asyncio
+    async def test_reuse_revokes_the_session(self):
+        spent = SimpleNamespace(session_id="session-a", revoked_at=datetime.utcnow())
+        session = RotationSession([None, spent])
+
+        with pytest.raises(InvalidRefreshTokenError):
+            await rotate_refresh_token("copied-token", session)
+
+        assert session.statements == ["update", "select", "update", "insert"]
+        assert revocation_filter.is_revoked({"sid": "session-a"})
+
+    @pytest.mark.asyncio
+    async def test_unknown_token_revokes_nothing(self):
+        session = RotationSession([None, None])
+
+        with pytest.raises(InvalidRefreshTokenError):
+            await rotate_refresh_token("unknown-token", session)
+
+        assert session.statements == ["update", "select"]
+
+    @pytest.mark.asyncio
+    async def test_session_revoked_during_refresh_is_refused(self):
+        claimed = SimpleNamespace(user_id=1, session_id="session-a")
+        session = RotationSession([claimed], user=self.make_user(), revoked_token_id="session-a")
+
+        with pytest.raises(InvalidRefreshTokenError):
+            await rotate_refresh_token("old-token", session)
+
+        assert session.added == []
+        assert session.commits == 1
+
+    @pytest.mark.asyncio
+    async def test_session_revoked_by_this_process_is_refused(self):
+        revocation_filter.add("session-a")
+        claimed = SimpleNamespace(user_id=1, session_id="session-a")
+        session = RotationSession([claimed], user=self.make_user())
+
+        with pytest.raises(InvalidRefreshTokenError):
+            await rotate_refresh_token("old-token", session)
+
+        assert session.added == []
+
+    @pytest.mark.asyncio
+    async def test_inactive_user_is_refused(self):
+        claimed = SimpleNamespace(user_id=1, session_id="session-a")
+        session = RotationSession([claimed], user=self.make_user(is_active=False))
+
+        with pytest.raises(InvalidRefreshTokenError):
+            await rotate_refresh_token("old-token", session)
+
+        assert session.added == []
+        assert session.commits == 1